@@ -1,21 +1,42 @@
 import os
 import re
 import json
-from typing import List, Dict, Any
+import argparse
+import functools
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 from dotenv import load_dotenv
 
 # 환경 변수 로드
 load_dotenv()
 
 from components.deepl import init_translator
-from components.translation_counter import get_remaining_chars, update_translation_count
-from components.naver_crawler import crawl_naver_blog
+from components.translation_counter import (
+    get_remaining_chars, get_translation_count, sync_translation_count, update_translation_count
+)
+from components.quota_scheduler import count_characters, plan_by_budget, print_plan, translation_budget
+from components.naver_crawler import (
+    BROWSER_PROFILE, BROWSER_PROFILES, CHROME_CACHE_DIR,
+    crawl_naver_blog, get_chrome_driver, fetch_post, fetch_or_resume, parse_post, enrich_post, translate_post,
+    estimate_post_cost, translation_texts
+)
+from components.checkpoints import clear_checkpoint, get_checkpoint_store, resume_at
+from components.driver_pool import DriverPool
+from components.concurrency import configure_limits
+from components.pipeline import Pipeline, Stage
+from components.add_travel import close_travel_client
 from components.naver_rss import check_new_posts
+from components.post_store import get_post_store, post_key
+from components.naver_backfill import REQUEST_DELAY, find_category_no, iter_backfill_posts, resolve_blog_id
+from components.translation_cache import get_translation_cache
+from components.uploader import upload_pending
+from components.fingerprints import get_fingerprint_index
+from components.document import post_document
+from components.output_writer import atomic_write, content_hash, get_output_manifest, remove_replaced_outputs
+from components.image_mirror import ImageMirror, get_image_mirror, mirror_post_images, set_image_mirror
+from components.metrics import MetricsRegistry, get_metrics, inc, set_metrics, timer
 
-def count_characters(text_list: List[str]) -> int:
-    """마크다운 텍스트 리스트의 총 글자 수를 계산합니다."""
-    return sum(len(text.strip()) for text in text_list 
-              if not text.strip().startswith('!['))
+DRIVER_MAX_PAGES = 50  # 드라이버 하나로 처리할 최대 페이지 수 (이후 재생성)
 
 def sanitize_filename(filename: str) -> str:
     """파일명에 사용할 수 없는 문자를 제거합니다."""
@@ -23,7 +44,7 @@ def sanitize_filename(filename: str) -> str:
 
 def save_markdown_files(content_parts: List[str], content_parts_en: List[str], 
                        safe_title: str, eng_title: str) -> Dict[str, str]:
-    """마크다운 파일을 저장하고 파일 경로를 반환합니다."""
+    """마크다운 파일을 저장하고 파일 경로와 내용 해시를 반환합니다. (임시 파일에 쓴 뒤 rename)"""
     # 디렉토리 생성
     kor_dir = 'kor'
     eng_dir = 'eng'
@@ -36,15 +57,18 @@ def save_markdown_files(content_parts: List[str], content_parts_en: List[str],
     kor_path = os.path.join(kor_dir, md_filename)
     eng_path = os.path.join(eng_dir, md_filename_en)
     
-    # 파일 저장
-    with open(kor_path, 'w', encoding='utf-8') as f:
-        f.writelines(content_parts)
-    with open(eng_path, 'w', encoding='utf-8') as f:
-        f.writelines(content_parts_en)
+    # 파일 저장 (중간에 죽어도 반쯤 쓴 파일이 남지 않도록)
+    kor_content = ''.join(content_parts)
+    eng_content = ''.join(content_parts_en)
+    with timer('file_write_seconds', kind='markdown'):
+        written = atomic_write(kor_path, kor_content) + atomic_write(eng_path, eng_content)
+    inc('file_write_bytes', written)
     
     return {
         'kor_path': kor_path,
-        'eng_path': eng_path
+        'eng_path': eng_path,
+        'kor_hash': content_hash(kor_content),
+        'eng_hash': content_hash(eng_content)
     }
 
 def print_statistics(content_parts: List[str], image_count: int) -> None:
@@ -55,7 +79,7 @@ def print_statistics(content_parts: List[str], image_count: int) -> None:
     
     print("\n=== 번역 통계 ===")
     print(f"현재 글의 총 글자 수: {total_chars:,}자")
-    print(f"이번 달 누적 번역: {get_remaining_chars() + total_chars:,}자")
+    print(f"이번 달 누적 번역: {get_translation_count():,}자")
     print(f"한 달 동안 번역 가능한 예상 글 개수: 약 {estimated_posts}개")
     print(f"남은 글자 수: {remaining_chars:,}자")
 
@@ -64,25 +88,19 @@ def make_supabase_data(result, eng_md_path, translator):
     with open(eng_md_path, 'r', encoding='utf-8') as f:
         content = f.read()
 
+    document = post_document(result)
+
     # desc: 본문 앞부분 요약 후 번역
-    summary = ''.join(result['content_parts'][:2]).replace('\n', ' ')
+    summary = ''.join(document.markdown()[:2]).replace('\n', ' ')
     from components.deepl import translate_text
     desc = translate_text(summary, translator)
 
-    # image: 첫 번째 이미지 URL 추출
-    image = None
-    for part in result['content_parts_en']:
-        if part.strip().startswith('!['):
-            import re
-            m = re.search(r'\((.*?)\)', part)
-            if m:
-                image = m.group(1)
-                break
+    # image: 첫 번째 이미지 URL
+    images = document.images()
+    image = images[0].src if images else None
 
     # tags: 제목/본문에서 # 또는 [] 등으로 추출(없으면 빈 리스트)
-    tags = []
-    import re
-    tags += re.findall(r'#([\w가-힣]+)', ''.join(result['content_parts']))
+    tags = document.tags()
     tags += re.findall(r'\[([^\]]+)\]', result['title'])
     tags = list(set(tags))
 
@@ -102,7 +120,72 @@ def make_supabase_data(result, eng_md_path, translator):
 
 # from components.uploader import upload_markdown_to_supabase
 
-def crawl_and_save_markdown(url: str, translator, rss_data: dict = None) -> dict:
+def save_post_result(result: dict, rss_data: dict = None) -> dict:
+    """
+    [저장 단계] 크롤링 결과로 마크다운 파일과 메타정보(json)를 저장하고 meta 반환
+    """
+    document = post_document(result)
+    file_paths = save_markdown_files(
+        document.markdown(),
+        document.markdown(translated=True),
+        result['safe_title'],
+        result['eng_title']
+    )
+    
+    # 메타정보를 별도 json으로 저장
+    meta = {
+        'title': result['eng_title'],
+        'kor_title': result['title'],
+        'safe_title': result['safe_title'],
+        'eng_title': result['eng_title'],
+        'address': result.get('store_and_address'),
+        'tags': document.tags(),
+        'kor_url': result.get('url'),
+        'image_count': result.get('image_count'),
+        'eng_md_path': file_paths['eng_path'],
+        'kor_md_path': file_paths['kor_path']
+    }
+    
+    # 이미지 미러를 쓰면 미러링한 대표 썸네일 사용
+    if result.get('cover_image'):
+        meta['image_url'] = result['cover_image']
+    # RSS에서 추출한 이미지 URL이 있으면 메타정보에 추가
+    elif rss_data and 'image_url' in rss_data and rss_data['image_url']:
+        meta['image_url'] = rss_data['image_url']
+        print(f"RSS에서 이미지 URL 추출됨: {rss_data['image_url']}")
+    else:
+        # 본문 첫 번째 이미지 사용
+        images = document.images()
+        if images:
+            meta['image_url'] = images[0].src
+            print(f"본문에서 이미지 URL 추출됨: {images[0].src}")
+    
+    meta_path = file_paths['eng_path'].replace('.md', '.meta.json')
+    with timer('file_write_seconds', kind='meta'):
+        atomic_write(meta_path, json.dumps(meta, ensure_ascii=False, indent=2))
+
+    # 저장이 끝난 포스트를 매니페스트에 바로 기록 (업로드/재개 단계에서 사용)
+    manifest = get_output_manifest()
+    if manifest is not None and result.get('url'):
+        paths = {'kor_path': file_paths['kor_path'], 'eng_path': file_paths['eng_path'], 'meta_path': meta_path}
+        # 다시 크롤링했는데 제목이 바뀌었으면 이전 이름의 파일은 지움
+        remove_replaced_outputs(manifest.previous(result['url']), paths)
+        manifest.record_written(result['url'], dict(file_paths, meta_path=meta_path),
+                                {'kor': file_paths['kor_hash'], 'eng': file_paths['eng_hash']}, meta)
+
+    # 다음에 다시 크롤링할 때 바뀐 문단만 번역하도록 지문과 번역문 기록
+    index = get_fingerprint_index()
+    if index is not None and result.get('part_hashes'):
+        index.record(result['url'], result['part_hashes'], result.get('translations'),
+                     complete=not result.get('fallback_translated'))
+    # 저장까지 끝났으므로 단계별 체크포인트는 더 이상 필요 없음
+    if result.get('url'):
+        clear_checkpoint(result['url'])
+    print(f"[Crawling/Markdown 완료] {file_paths['eng_path']} / {meta_path}")
+    return meta
+
+def crawl_and_save_markdown(url: str, translator, rss_data: dict = None,
+                            driver_pool: DriverPool = None) -> dict:
     """
     크롤링, 번역, 마크다운 저장 및 메타정보(json) 저장만 수행
     성공 시 meta 딕셔너리를 반환, 실패 시 None 반환
@@ -111,137 +194,404 @@ def crawl_and_save_markdown(url: str, translator, rss_data: dict = None) -> dict
         url: 크롤링할 블로그 URL
         translator: 번역기 객체
         rss_data: RSS에서 추출한 추가 데이터 (선택사항)
+        driver_pool: 재사용할 크롬 드라이버 풀 (없으면 포스트마다 새로 띄움)
     """
+    metrics = get_metrics()
+    post_metrics = metrics.start_post(url)
     try:
-        result = crawl_naver_blog(url, translator)
-        file_paths = save_markdown_files(
-            result['content_parts'],
-            result['content_parts_en'],
-            result['safe_title'],
-            result['eng_title']
-        )
-        
-        # 메타정보를 별도 json으로 저장
-        meta = {
-            'title': result['eng_title'],
-            'kor_title': result['title'],
-            'safe_title': result['safe_title'],
-            'eng_title': result['eng_title'],
-            'address': result.get('store_and_address'),
-            'tags': list(set(re.findall(r'#([\w가-힣]+)', ''.join(result['content_parts'])))),
-            'kor_url': result.get('url'),
-            'image_count': result.get('image_count'),
-            'eng_md_path': file_paths['eng_path'],
-            'kor_md_path': file_paths['kor_path']
-        }
-        
-        # RSS에서 추출한 이미지 URL이 있으면 메타정보에 추가
-        if rss_data and 'image_url' in rss_data and rss_data['image_url']:
-            meta['image_url'] = rss_data['image_url']
-            print(f"RSS에서 이미지 URL 추출됨: {rss_data['image_url']}")
-        else:
-            # 마크다운에서 이미지 URL 추출 시도
-            markdown_content = ''.join(result['content_parts_en'])
-            # 고정: 정규식 패턴 수정 (작은따옴표 제거)
-            image_urls = re.findall(r'!\[.*?\]\((https?://[^\s)]+)\)', markdown_content)
-            if image_urls:
-                meta['image_url'] = image_urls[0]
-                print(f"마크다운에서 이미지 URL 추출됨: {image_urls[0]}")
-        
-        meta_path = file_paths['eng_path'].replace('.md', '.meta.json')
-        with open(meta_path, 'w', encoding='utf-8') as f:
-            json.dump(meta, f, ensure_ascii=False, indent=2)
-        print(f"[Crawling/Markdown 완료] {file_paths['eng_path']} / {meta_path}")
+        with metrics.activate(post_metrics):
+            result = crawl_naver_blog(url, translator, driver_pool=driver_pool)
+            mirror_post_images(result, (rss_data or {}).get('image_url'))
+            meta = save_post_result(result, rss_data)
+        metrics.finish_post(post_metrics)
         return meta # 성공 시 meta 딕셔너리 반환
     except Exception as e:
         print(f"[크롤링/마크다운 저장 에러] {url}: {e}")
+        metrics.finish_post(post_metrics, error=e)
         return None # 실패 시 None 반환
 
-def main():
-    # DeepL 번역기 초기화
-    translator = init_translator(os.getenv('DEEPL_API_KEY'))
-    
-    # processed_posts.json 로드 (URL 목록만 저장)
-    processed_posts_path = 'processed_posts.json'
-    processed_urls = set()
-    if os.path.exists(processed_posts_path):
-        try:
-            with open(processed_posts_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # 이전 버전과 호환성을 위해 리스트인지 확인
-                if isinstance(data, list):
-                    # 각 항목이 문자열(URL)인지 딕셔너리(이전 버전 메타)인지 확인
-                    for item in data:
-                        if isinstance(item, str):
-                            processed_urls.add(item)
-                        elif isinstance(item, dict) and 'kor_url' in item:
-                            processed_urls.add(item['kor_url'])
-        except json.JSONDecodeError:
-            print(f"Warning: {processed_posts_path} is empty or malformed. Starting with an empty list.")
-        except Exception as e:
-            print(f"Error loading {processed_posts_path}: {e}")
-    
-    # 기존 처리된 URL 로그 출력
-    print(f"이미 처리된 URL 개수: {len(processed_urls)}")
-    if processed_urls:
-        print("처음 5개 URL 예시:", list(processed_urls)[:5])
-
-    # 새 포스트 확인
-    print("새로운 포스트 확인 중...")
-    category = "맛집일기_얌얌"
-    new_posts = check_new_posts(category)
-    
-    if not new_posts:
-        print("처리할 새 포스트가 없습니다.")
+def run_posts(posts: Iterable[dict], translator, driver_pool: DriverPool,
+              workers: int = 1) -> Iterator[Tuple[dict, Optional[dict]]]:
+    """
+    포스트 목록을 crawl_and_save_markdown으로 처리하고 (post, meta) 쌍을 반환
+    workers가 2 이상이면 스레드 풀로 여러 포스트를 동시에 처리하며,
+    결과는 완료된 순서대로 반환됩니다.
+    """
+    if workers <= 1:
+        for post in posts:
+            print(f"\n[처리 중] {post['title']}")
+            print(f"URL: {post['url']}")
+            # RSS에서 추출한 데이터를 포함하여 crawl_and_save_markdown 호출
+            yield post, crawl_and_save_markdown(post['url'], translator, rss_data=post, driver_pool=driver_pool)
         return
-    
-    print(f"\n총 {len(new_posts)}개의 새 포스트를 발견했습니다.")
-    
-    # 각 포스트 처리
-    success_count = 0
-    new_processed_urls = set(processed_urls)  # 기존 URL 세트 복사
-    
-    for post in new_posts:
+
+    # 백필처럼 포스트가 스트리밍으로 들어오는 경우를 위해 진행 중인 작업 수를 제한
+    max_in_flight = workers * 2
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        for post in posts:
+            print(f"[대기열 추가] {post['title']} ({post['url']})")
+            future = executor.submit(crawl_and_save_markdown, post['url'], translator,
+                                     rss_data=post, driver_pool=driver_pool)
+            futures[future] = post
+            if len(futures) >= max_in_flight:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield futures.pop(future), future.result()
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+def run_pipeline(posts: Iterable[dict], translator, driver_pool: DriverPool,
+                 limits: Dict[str, int]) -> Iterator[Tuple[dict, Optional[dict]]]:
+    """
+    수집 → 파싱 → 보강(여행코스) → 번역 → 저장 단계를 크기 제한 큐로 연결해
+    여러 포스트를 겹쳐서 처리하고 (post, meta) 쌍을 완료 순서대로 반환
+    """
+    pipeline = Pipeline(prepare_stages(driver_pool, limits) + finish_stages(translator, limits))
+    metrics = get_metrics()
+    messages = ({'url': post['url'], 'rss_data': post, 'metrics': metrics.start_post(post['url'])}
+                for post in posts)
+    yield from _drain_pipeline(pipeline, messages)
+    pipeline.print_stats()
+
+def prepare_stages(driver_pool: DriverPool, limits: Dict[str, int]) -> List[Stage]:
+    """번역량을 추정하기 전 단계: 수집 → 파싱 (체크포인트에 기록된 단계는 건너뜀)"""
+    return [
+        Stage('fetch', lambda m: fetch_or_resume(m, driver_pool=driver_pool), workers=limits['fetch']),
+        Stage('parse', resume_at('parsed', parse_post)),
+    ]
+
+def finish_stages(translator, limits: Dict[str, int]) -> List[Stage]:
+    """보강(여행코스) → 번역 → (이미지) → 저장 단계"""
+    return [
+        Stage('enrich', resume_at('enriched', enrich_post), workers=limits['llm']),
+        Stage('translate', resume_at('translated', lambda m: translate_post(m, translator)),
+              workers=limits['translate']),
+        *image_stages(limits),
+        Stage('write', lambda m: dict(m, meta=save_post_result(m, m['rss_data']))),
+    ]
+
+def image_stages(limits: Dict[str, int], wrap=None) -> List[Stage]:
+    """이미지 미러가 켜져 있으면 이미지 단계 (다운로드는 미러 안에서 동시에 처리)"""
+    if get_image_mirror() is None:
+        return []
+    func = lambda m: mirror_post_images(m, m['rss_data'].get('image_url'))
+    return [Stage('images', wrap(func) if wrap else func, workers=limits['images'])]
+
+def _drain_pipeline(pipeline: Pipeline, messages: Iterable[dict]) -> Iterator[Tuple[dict, Optional[dict]]]:
+    """파이프라인 결과마다 포스트 측정값을 마무리하고 (post, meta) 쌍 반환"""
+    metrics = get_metrics()
+    for message in pipeline.run(messages):
+        if 'error' in message:
+            print(f"[{message['failed_stage']} 단계 에러] {message['url']}: {message['error']}")
+        metrics.finish_post(message['metrics'], error=message.get('error'),
+                            failed_stage=message.get('failed_stage'))
+        yield message['rss_data'], message.get('meta')
+
+def run_budgeted(posts: Iterable[dict], translator, driver_pool: DriverPool,
+                 limits: Dict[str, int]) -> Iterator[Tuple[dict, Optional[dict]]]:
+    """
+    번역 한도를 고려한 처리.
+    모든 포스트를 먼저 수집/파싱해 포스트별 예상 번역량을 계산하고,
+    이번 달 남은 번역량 안에서 끝낼 수 있는 포스트가 가장 많도록 골라 보강/번역/저장합니다.
+    나머지는 보강(Perplexity 호출)도 하지 않고 처리 완료로 기록하지 않으므로 다음 주기(한도 갱신 후)에 다시 처리됩니다.
+    """
+    metrics = get_metrics()
+    messages = ({'url': post['url'], 'rss_data': post, 'metrics': metrics.start_post(post['url'])}
+                for post in posts)
+    prepare = Pipeline(prepare_stages(driver_pool, limits))
+    prepared = []
+    for message in prepare.run(messages):
+        if 'error' in message:
+            print(f"[{message['failed_stage']} 단계 에러] {message['url']}: {message['error']}")
+            metrics.finish_post(message['metrics'], error=message['error'],
+                                failed_stage=message['failed_stage'])
+            yield message['rss_data'], None
+        else:
+            prepared.append(message)
+    prepare.print_stats()
+
+    costs = [estimate_post_cost(message) for message in prepared]
+    for message, cost in zip(prepared, costs):
+        message['translation_cost'] = cost
+    budget = translation_budget()
+    selected, deferred = plan_by_budget(prepared, costs, budget)
+    print_plan(costs, [message['translation_cost'] for message in selected], budget)
+    for message in deferred:
+        print(f"[다음 주기로 연기] {message['title']} (예상 {message['translation_cost']:,}자)")
+
+    finish = Pipeline(finish_stages(translator, limits))
+    yield from _drain_pipeline(finish, selected)
+    finish.print_stats()
+
+def run_refresh(posts: Iterable[dict], translator, driver_pool: DriverPool,
+                limits: Dict[str, int]) -> Iterator[Tuple[dict, Optional[dict]]]:
+    """
+    이미 처리한 포스트를 다시 수집/파싱해 내용 지문을 비교하고 바뀐 포스트만 다시 처리
+    - 바뀌지 않은 포스트: 여행코스/번역/파일 저장 없이 건너뜀 (meta={'unchanged': True})
+    - 지문이 없는 포스트(이 기능 이전에 처리): 현재 지문만 기준으로 기록
+    - 바뀐 포스트: 지난번 번역문이 있는 문단은 재사용하고 바뀐 문단만 번역해 파일을 다시 씀
+    """
+    index = get_fingerprint_index()
+    if index is None:
+        raise ValueError("다시 크롤링하려면 지문 인덱스가 필요합니다 (FINGERPRINT_PATH=off)")
+
+    def check(m: dict) -> dict:
+        status, changed = index.compare(m['url'], m['part_hashes'])
+        m['refresh_status'] = status
+        if status == 'new':
+            index.record(m['url'], m['part_hashes'])
+        elif status == 'changed':
+            print(f"[내용 변경] {m['title']}: 조각 {changed}개 변경")
+        return m
+
+    def changed_only(func):
+        return lambda m: func(m) if m['refresh_status'] == 'changed' else m
+
+    def translate(m: dict) -> dict:
+        m['known_translations'] = index.known_translations(m['url'], translation_texts(m))
+        return translate_post(m, translator)
+
+    pipeline = Pipeline([
+        Stage('fetch', lambda m: fetch_post(m, driver_pool=driver_pool), workers=limits['fetch']),
+        Stage('parse', parse_post),
+        Stage('check', check),
+        Stage('enrich', changed_only(enrich_post), workers=limits['llm']),
+        Stage('translate', changed_only(translate), workers=limits['translate']),
+        *image_stages(limits, changed_only),
+        Stage('write', changed_only(lambda m: dict(m, meta=save_post_result(m, m['rss_data'])))),
+    ])
+    metrics = get_metrics()
+    messages = ({'url': post['url'], 'rss_data': post, 'metrics': metrics.start_post(post['url'])}
+                for post in posts)
+    for message in pipeline.run(messages):
+        inc('refresh_posts', status=message.get('refresh_status', 'error'))
+        if 'error' in message:
+            print(f"[{message['failed_stage']} 단계 에러] {message['url']}: {message['error']}")
+        metrics.finish_post(message['metrics'], error=message.get('error'),
+                            failed_stage=message.get('failed_stage'))
+        if message.get('refresh_status') in ('new', 'unchanged'):
+            yield message['rss_data'], {'unchanged': True}
+        else:
+            yield message['rss_data'], message.get('meta')
+    pipeline.print_stats()
+
+def select_pending_posts(posts: Iterable[dict], store,
+                         written: Optional[Dict[str, dict]] = None) -> Iterator[dict]:
+    """
+    URL이 없거나 이미 처리된 포스트를 걸러내며 처리 대상만 반환
+    written(매니페스트의 {log_no: 기록})에 파일 저장까지 끝난 포스트는 처리 완료로 기록하고 건너뜀
+    (지난 실행이 저장 직후 처리 완료를 기록하기 전에 끝난 경우)
+    """
+    written = written or {}
+    seen_urls = set()
+    for post in posts:
         post_url = post.get('url')
         if not post_url:
             print(f"Skipping post with no URL: {post.get('title', 'Unknown Title')}")
             continue
             
         # 이미 처리된 URL인지 확인
-        if post_url in new_processed_urls:
+        if post_url in seen_urls or store.is_processed(post_url):
             print(f"[건너뜀] 이미 처리된 포스트: {post['title']}")
             continue
-            
-        print(f"\n[처리 중] {post['title']}")
-        print(f"URL: {post_url}")
+        seen_urls.add(post_url)
+        entry = written.get(post_key(post_url))
+        if entry is not None and os.path.exists(entry['eng_path']) and os.path.exists(entry['meta_path']):
+            store.mark_processed(post_url, post.get('title'))
+            print(f"[건너뜀] 지난 실행에서 저장된 포스트: {post['title']}")
+            continue
+        yield post
+
+def run_upload(eng_dir: str, batch_size: Optional[int] = None, force: bool = False) -> Dict[str, int]:
+    """저장된 eng 마크다운/메타 파일 중 아직 올리지 않았거나 바뀐 포스트를 묶음 upsert"""
+    stats = upload_pending(eng_dir=eng_dir, batch_size=batch_size, force=force)
+    print(f"\n=== 업로드 완료 ===")
+    print(f"업로드 {stats['uploaded']}건 (요청 묶음 {stats['batches']}개), "
+          f"변경 없음 {stats['skipped']}건, 실패 {stats['failed']}건")
+    return stats
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="네이버 블로그 새 포스트 크롤링/번역")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="동시에 처리할 포스트 수 (기본값: 1, 순차 처리)")
+    parser.add_argument('--pipeline', action='store_true',
+                        help="단계별 큐로 연결된 스트리밍 파이프라인으로 처리")
+    parser.add_argument('--budgeted', action='store_true',
+                        help="모든 포스트를 먼저 수집/파싱한 뒤 이번 달 남은 번역량 안에서 처리할 포스트를 골라 번역 (나머지는 다음 주기로 연기)")
+    parser.add_argument('--refresh', action='store_true',
+                        help="이미 처리한 포스트를 다시 읽어 내용이 바뀐 포스트만 다시 번역/저장 (오래전에 확인한 것부터, --max-posts로 개수 제한)")
+    parser.add_argument('--backfill', action='store_true',
+                        help="RSS 범위를 넘어 카테고리 전체 글 목록을 훑어 미처리 포스트 처리")
+    parser.add_argument('--blog-id', default=None,
+                        help="백필할 blogId (기본값: RSS_URL에서 추출)")
+    parser.add_argument('--category-no', default=None,
+                        help="백필할 categoryNo (기본값: 카테고리 이름으로 조회)")
+    parser.add_argument('--max-posts', type=int, default=None,
+                        help="백필/다시 확인으로 처리할 최대 포스트 수")
+    parser.add_argument('--backfill-delay', type=float, default=REQUEST_DELAY,
+                        help="백필 목록 페이지 요청 간격(초)")
+    parser.add_argument('--fetch-concurrency', type=int, default=None,
+                        help="브라우저/HTTP 동시 요청 한도")
+    parser.add_argument('--translate-concurrency', type=int, default=None,
+                        help="DeepL 동시 요청 한도")
+    parser.add_argument('--llm-concurrency', type=int, default=None,
+                        help="Perplexity 동시 요청 한도")
+    parser.add_argument('--image-concurrency', type=int, default=None,
+                        help="이미지 미러 단계에서 동시에 처리할 포스트 수")
+    parser.add_argument('--browser-profile', choices=BROWSER_PROFILES, default=BROWSER_PROFILE,
+                        help="크롬 프로필 (lean: 이미지/미디어/광고 차단, full: 모든 리소스 로딩)")
+    parser.add_argument('--chrome-cache-dir', default=CHROME_CACHE_DIR,
+                        help="lean 프로필의 크롬 디스크 캐시 디렉토리 (빈 값이면 사용 안 함)")
+    parser.add_argument('--upload', action='store_true',
+                        help="크롤링 없이 eng 디렉토리의 마크다운/메타 파일을 Supabase에 묶음 upsert (kor_url 기준)")
+    parser.add_argument('--upload-batch-size', type=int, default=None,
+                        help="upsert 1회당 행 수 (기본값: UPLOAD_BATCH_SIZE 또는 100)")
+    parser.add_argument('--force-upload', action='store_true',
+                        help="이미 올린 내용과 같아도 모두 다시 업로드")
+    parser.add_argument('--mirror-images', action='store_true',
+                        help="본문 이미지를 내려받아 WebP로 변환하고 마크다운 주소를 미러 경로로 교체 "
+                             "(IMAGE_MIRROR_DIR, IMAGE_BASE_URL)")
+    parser.add_argument('--metrics-log', default=None,
+                        help="포스트별 측정 결과(JSON Lines) 경로 (기본값: METRICS_LOG_PATH 또는 metrics.jsonl, off면 기록 안 함)")
+    parser.add_argument('--metrics-file', default=None,
+                        help="실행 종료 시 Prometheus 텍스트 형식으로 누적 측정값을 저장할 경로")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    if args.metrics_log is not None:
+        set_metrics(MetricsRegistry(log_path=args.metrics_log))
+    if args.upload:
+        run_upload('eng', args.upload_batch_size, force=args.force_upload)
+        get_metrics().print_summary()
+        return
+    limits = configure_limits(
+        fetch=args.fetch_concurrency,
+        translate=args.translate_concurrency,
+        llm=args.llm_concurrency,
+        images=args.image_concurrency
+    )
+    if args.budgeted:
+        print(f"번역 예산 모드: 한도={limits}")
+    elif args.pipeline:
+        print(f"파이프라인 모드: 한도={limits}")
+    elif args.workers > 1:
+        print(f"동시 처리 모드: workers={args.workers}, 한도={limits}")
+
+    if args.mirror_images:
+        set_image_mirror(ImageMirror())
+
+    # DeepL 번역기 초기화
+    translator = init_translator(os.getenv('DEEPL_API_KEY'))
+    # 번역량 집계를 DeepL 사용량 API 값에 맞춤 (실패하면 로컬 집계 사용)
+    sync_translation_count(translator)
+    print(f"이번 달 남은 번역량: {get_remaining_chars():,}자")
+    
+    # 처리 상태 저장소 (기존 processed_posts.json은 최초 실행 시 자동으로 가져옴)
+    store = get_post_store()
+    processed_before = store.count('done')
+    
+    # 기존 처리된 URL 로그 출력
+    print(f"이미 처리된 URL 개수: {processed_before}")
+    if processed_before:
+        print("최근 5개 URL 예시:", store.sample_urls(5))
+    checkpoints = get_checkpoint_store()
+    if checkpoints is not None and checkpoints.count():
+        print(f"지난 실행에서 중단된 포스트 {checkpoints.count()}개는 끝난 단계 다음부터 처리합니다.")
+
+    category = "맛집일기_얌얌"
+    if args.refresh:
+        new_posts = store.processed_posts(limit=args.max_posts)
+        print(f"다시 확인 모드: 처리된 포스트 {len(new_posts)}개의 내용 변경 확인")
+    elif args.backfill:
+        # 카테고리 전체 글 목록을 페이지 단위로 받아 바로 처리 단계로 흘려보냄
+        blog_id = args.blog_id or resolve_blog_id(os.getenv('RSS_URL'))
+        category_no = args.category_no or find_category_no(blog_id, category)
+        print(f"백필 모드: blogId={blog_id}, categoryNo={category_no}")
+        new_posts = iter_backfill_posts(blog_id, category_no, store,
+                                        max_posts=args.max_posts, delay=args.backfill_delay)
+    else:
+        # 새 포스트 확인
+        print("새로운 포스트 확인 중...")
+        new_posts = check_new_posts(category, store)
+        
+        if not new_posts:
+            print("처리할 새 포스트가 없습니다.")
+            return
         
-        # RSS에서 추출한 데이터를 포함하여 crawl_and_save_markdown 호출
-        meta_data = crawl_and_save_markdown(post_url, translator, rss_data=post)
+        print(f"\n총 {len(new_posts)}개의 새 포스트를 발견했습니다.")
+    
+    # 처리 대상 선별 (다시 확인 모드는 처리된 포스트가 대상)
+    manifest = get_output_manifest()
+    written = manifest.latest() if manifest is not None and not args.refresh else None
+    pending_posts = new_posts if args.refresh else select_pending_posts(new_posts, store, written)
 
-        if meta_data:  # 성공적으로 처리된 경우
-            success_count += 1
-            new_processed_urls.add(post_url)  # 처리된 URL만 추가
-            print(f"[처리 완료] {post['title']}")
+    # 각 포스트 처리
+    success_count = 0
+    attempted_count = 0
+    # 포스트마다 크롬을 새로 띄우지 않도록 드라이버 풀 사용
+    pool_size = limits['fetch'] if args.pipeline or args.budgeted or args.refresh else min(args.workers, limits['fetch'])
+    driver_factory = functools.partial(get_chrome_driver, profile=args.browser_profile,
+                                       cache_dir=args.chrome_cache_dir)
+    driver_pool = DriverPool(driver_factory, size=pool_size, max_pages=DRIVER_MAX_PAGES)
+    
+    try:
+        # 결과는 메인 스레드에서 포스트 단위로 바로 기록 (중간에 중단돼도 진행분 유지)
+        if args.refresh:
+            results = run_refresh(pending_posts, translator, driver_pool, limits)
+        elif args.budgeted:
+            results = run_budgeted(pending_posts, translator, driver_pool, limits)
+        elif args.pipeline:
+            results = run_pipeline(pending_posts, translator, driver_pool, limits)
         else:
-            print(f"[처리 실패] {post['title']}")
-            
+            results = run_posts(pending_posts, translator, driver_pool, workers=args.workers)
+        for post, meta_data in results:
+            attempted_count += 1
+            if meta_data:  # 성공적으로 처리된 경우
+                success_count += 1
+                store.mark_processed(post['url'], post.get('title'))  # 처리된 URL만 기록
+                if meta_data.get('unchanged'):
+                    print(f"[변경 없음] {post['title']}")
+                else:
+                    print(f"[처리 완료] {post['title']}")
+            else:
+                print(f"[처리 실패] {post['title']}")
+    finally:
+        driver_pool.close()
+        close_travel_client()
+        translator.close()
+        if get_image_mirror() is not None:
+            get_image_mirror().close()
+        if args.metrics_file:
+            get_metrics().write_prometheus(args.metrics_file)
+            print(f"측정값 저장: {args.metrics_file}")
+
     # 처리 결과 요약
     print(f"\n=== 처리 완료 ===")
-    print(f"총 {len(new_posts)}개 중 {success_count}개 처리 성공")
-    if success_count < len(new_posts):
-        print(f"실패: {len(new_posts) - success_count}개")
-
-    # 업데이트된 processed_posts.json 저장 (URL 목록만 저장)
-    with open(processed_posts_path, 'w', encoding='utf-8') as f:
-        # URL만 리스트로 변환하여 저장
-        json.dump(sorted(list(new_processed_urls)), f, ensure_ascii=False, indent=2)
-    print(f"\nprocessed_posts.json이 업데이트되었습니다. 총 {len(new_processed_urls)}개의 URL이 저장되었습니다.")
-    
+    print(f"총 {attempted_count}개 중 {success_count}개 처리 성공")
+    if success_count < attempted_count:
+        print(f"실패: {attempted_count - success_count}개")
+
     # 처리 요약
-    new_urls_count = len(new_processed_urls - processed_urls)
+    processed_after = store.count('done')
     print(f"\n=== 처리 요약 ===")
-    print(f"새로 처리된 URL: {new_urls_count}")
-    print(f"총 처리된 URL: {len(new_processed_urls)}")
+    print(f"새로 처리된 URL: {processed_after - processed_before}")
+    print(f"총 처리된 URL: {processed_after}")
+
+    # 번역 캐시 통계
+    cache = get_translation_cache()
+    if cache is not None:
+        stats = cache.stats()
+        print(f"번역 캐시: 적중 {stats['hits']}건 / 미적중 {stats['misses']}건 (저장 {stats['entries']}건)")
+
+    # 번역 백엔드 상태 (회로 차단 여부, 글자당 응답 시간)
+    for status in translator.status():
+        latency = f"{status['latency_per_char'] * 1000:.3f}ms/자" if status['latency_per_char'] is not None else "-"
+        print(f"번역 백엔드 {status['backend']}: {status['state']} ({latency})")
+
+    # 단계별 소요 시간 (어느 단계가 병목인지 확인)
+    get_metrics().print_summary()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
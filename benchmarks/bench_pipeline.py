@@ -0,0 +1,371 @@
+"""
+오프라인 파이프라인 벤치마크
+
+저장해 둔 PostView HTML / RSS 픽스처와 가짜 번역기·LLM으로
+네이버 / DeepL / Perplexity를 호출하지 않고 단계별 성능을 측정합니다.
+
+    python benchmarks/bench_pipeline.py --posts 30 --workers 4 --label lxml
+
+결과는 benchmarks/results.jsonl에 한 줄씩 쌓이며, 직전 실행(또는 --baseline 라벨)과 비교해 출력합니다.
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+from unittest.mock import patch
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+import app
+import components.naver_crawler as naver_crawler
+from components.concurrency import configure_limits
+from components.checkpoints import CheckpointStore, set_checkpoint_store
+from components.fingerprints import FingerprintIndex, set_fingerprint_index
+from components.get_store_and_address import extract_store_and_address
+from components.html_parser import set_default_parser
+from components.naver_rss import check_new_posts
+from components.post_store import PostStore
+from components.supabase import MemoryClient, set_client
+from components.translation_cache import TranslationCache, disable_translation_cache, set_translation_cache
+from components.uploader import upload_pending
+from components.travel_cache import TravelCourseCache, disable_travel_cache, set_travel_cache
+from stubs import (POSTVIEW_FIXTURES, RSS_FIXTURE, FixtureFetcher, StubDriver, StubTranslator,
+                   StubTravel, load_fixture, make_posts)
+
+RESULTS_PATH = os.path.join(BENCH_DIR, 'results.jsonl')
+MODES = ('sequential', 'workers', 'pipeline', 'budgeted')
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """선형 보간 백분위수 (values가 비어 있으면 0)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(name: str, latencies: List[float], elapsed: float, peak_bytes: int,
+              **extra: Any) -> Dict[str, Any]:
+    return {
+        'name': name,
+        'count': len(latencies),
+        'posts_per_sec': round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 2),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 2),
+        'peak_kb': round(peak_bytes / 1024, 1),
+        **extra,
+    }
+
+
+def measure_peak(func: Callable[[], Any]) -> int:
+    """func 한 번 실행하는 동안의 tracemalloc 최대 할당량(바이트)"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@contextlib.contextmanager
+def quiet(enabled: bool = True) -> Iterator[None]:
+    """크롤러 로그(print)가 측정 결과를 가리지 않도록 stdout을 버림"""
+    if not enabled:
+        yield
+        return
+    with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+@contextlib.contextmanager
+def isolated_run(with_cache: bool) -> Iterator[str]:
+    """임시 디렉토리에서 실행 (kor/eng 출력, 번역량 파일, 캐시가 저장소를 건드리지 않도록)"""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='naver-bench-') as workdir:
+        os.chdir(workdir)
+        translation_cache = TranslationCache(os.path.join(workdir, 'cache.sqlite3')) if with_cache else None
+        travel_cache = TravelCourseCache(os.path.join(workdir, 'travel.sqlite3')) if with_cache else None
+        # 캐시 없이 재는 경우 기본 캐시(현재 디렉토리에 생기는 파일)도 쓰지 않도록 끔
+        if with_cache:
+            set_translation_cache(translation_cache)
+            set_travel_cache(travel_cache)
+        else:
+            disable_translation_cache()
+            disable_travel_cache()
+        # 기본 지문 인덱스/체크포인트 저장소는 처음 만든 디렉토리에 남으므로 실행마다 새로 지정
+        fingerprint_index = FingerprintIndex(os.path.join(workdir, 'fingerprints.sqlite3'))
+        set_fingerprint_index(fingerprint_index)
+        checkpoints = CheckpointStore(os.path.join(workdir, 'checkpoints.sqlite3'))
+        set_checkpoint_store(checkpoints)
+        try:
+            yield workdir
+        finally:
+            for cache in (translation_cache, travel_cache, fingerprint_index, checkpoints):
+                if cache is not None:
+                    cache.close()
+            set_translation_cache(None)
+            set_travel_cache(None)
+            set_fingerprint_index(None)
+            set_checkpoint_store(None)
+            os.chdir(cwd)
+
+
+def time_calls(name: str, func: Callable[[Any], Any], inputs: Sequence[Any], repeat: int) -> Dict[str, Any]:
+    """inputs를 repeat번 돌며 호출별 지연을 재고, 첫 입력으로 메모리 최대치를 잼"""
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for item in inputs:
+            call_started = time.perf_counter()
+            func(item)
+            latencies.append(time.perf_counter() - call_started)
+    elapsed = time.perf_counter() - started
+    peak = measure_peak(lambda: func(inputs[0]))
+    return summarize(name, latencies, elapsed, peak)
+
+
+def bench_stages(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """단계별 함수 마이크로 벤치마크 (픽스처마다 repeat번)"""
+    pages = [load_fixture(name) for name in POSTVIEW_FIXTURES]
+    drivers = [StubDriver(html) for html in pages]
+    translator = StubTranslator()
+    results = []
+
+    with isolated_run(with_cache=False), quiet(not args.verbose):
+        results.append(time_calls('extract_main_content', naver_crawler.extract_main_content,
+                                  drivers, args.repeat))
+        results.append(time_calls('extract_main_content_from_html', naver_crawler.extract_main_content_from_html,
+                                  pages, args.repeat))
+
+        parsed = [naver_crawler.extract_main_content_from_html(html) for html in pages]
+        soups = [soup for _, _, soup in parsed]
+        results.append(time_calls('extract_text_and_images',
+                                  lambda soup: naver_crawler.extract_text_and_images(soup, translator),
+                                  soups, args.repeat))
+
+        extracted = [naver_crawler.extract_text_and_images(soup, translator) for soup in soups]
+        results.append(time_calls('extract_store_and_address', extract_store_and_address,
+                                  [parts for parts, _, _ in extracted], args.repeat))
+
+        files = [(parts, parts_en, safe_title, f"{safe_title} EN")
+                 for (parts, parts_en, _), (_, safe_title, _) in zip(extracted, parsed)]
+        results.append(time_calls('save_markdown_files', lambda item: app.save_markdown_files(*item),
+                                  files, args.repeat))
+
+        # 저장된 마크다운/메타 파일 전체를 메모리 Supabase로 묶음 업로드 (매번 처음부터)
+        for idx, ((parts, parts_en, image_count), (title, safe_title, _)) in enumerate(zip(extracted, parsed)):
+            app.save_post_result({
+                'url': f"https://blog.naver.com/bench/22390000{idx:04d}", 'title': title, 'safe_title': safe_title,
+                'eng_title': f"{safe_title} EN", 'content_parts': parts, 'content_parts_en': parts_en,
+                'image_count': image_count, 'store_and_address': None,
+            })
+
+        def upload(_):
+            set_client(MemoryClient())
+            store = PostStore(':memory:', legacy_json_path=None)
+            try:
+                upload_pending('eng', store=store)
+            finally:
+                store.close()
+                set_client(None)
+
+        results.append(time_calls('upload_pending', upload, [None], args.repeat))
+
+        def read_feed(_):
+            store = PostStore(':memory:', legacy_json_path=None)
+            try:
+                check_new_posts("맛집일기_얌얌", store)
+            finally:
+                store.close()
+
+        with patch.dict(os.environ, {'RSS_URL': RSS_FIXTURE}):
+            results.append(time_calls('check_new_posts', read_feed, [None], args.repeat))
+    return results
+
+
+def run_mode(mode: str, posts: List[Dict[str, Any]], translator: StubTranslator, workers: int,
+             limits: Dict[str, int], latencies: List[float]) -> int:
+    """mode로 포스트를 처리하고 성공 수 반환 (포스트별 투입~완료 시간을 latencies에 추가)"""
+    started_at: Dict[str, float] = {}
+
+    def feed() -> Iterable[Dict[str, Any]]:
+        for post in posts:
+            started_at[post['url']] = time.perf_counter()
+            yield post
+
+    if mode == 'pipeline':
+        results = app.run_pipeline(feed(), translator, None, limits)
+    elif mode == 'budgeted':
+        results = app.run_budgeted(feed(), translator, None, limits)
+    else:
+        results = app.run_posts(feed(), translator, None, workers=workers if mode == 'workers' else 1)
+
+    succeeded = 0
+    for post, meta in results:
+        latencies.append(time.perf_counter() - started_at[post['url']])
+        if meta:
+            succeeded += 1
+    return succeeded
+
+
+def bench_end_to_end(args: argparse.Namespace, mode: str) -> Dict[str, Any]:
+    """가짜 수집/번역/LLM으로 crawl_and_save_markdown 전체 경로 측정"""
+    limits = configure_limits(fetch=args.fetch_concurrency, translate=args.translate_concurrency,
+                              llm=args.llm_concurrency)
+    posts = make_posts(args.posts)
+
+    def run(latencies: List[float]) -> Dict[str, Any]:
+        fetcher = FixtureFetcher(latency=args.fetch_latency)
+        travel = StubTravel(latency=args.llm_latency)
+        translator = StubTranslator(latency=args.translate_latency, per_char=args.translate_per_char)
+        with isolated_run(args.with_cache), quiet(not args.verbose), \
+                patch.object(naver_crawler, 'fetch_postview_html', fetcher), \
+                patch.object(naver_crawler, 'add_travel_sync', travel):
+            succeeded = run_mode(mode, posts, translator, args.workers, limits, latencies)
+        return {'succeeded': succeeded, 'translate_calls': translator.calls,
+                'translate_chars': translator.chars, 'llm_calls': travel.calls}
+
+    latencies: List[float] = []
+    started = time.perf_counter()
+    counts = run(latencies)
+    elapsed = time.perf_counter() - started
+    peak = measure_peak(lambda: run([]))
+    return summarize(f"end_to_end[{mode}]", latencies, elapsed, peak,
+                     wall_seconds=round(elapsed, 3), **counts)
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_baseline(path: str, label: Optional[str]) -> Optional[Dict[str, Any]]:
+    """비교 대상 실행 기록 (label이 있으면 그 라벨의 마지막 기록, 없으면 직전 기록)"""
+    if not os.path.exists(path):
+        return None
+    baseline = None
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if label is None or record.get('label') == label:
+                baseline = record
+    return baseline
+
+
+def append_record(path: str, record: Dict[str, Any]) -> None:
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+
+def format_delta(current: float, previous: Optional[float], higher_is_better: bool) -> str:
+    if not previous:
+        return ''
+    change = (current - previous) / previous * 100
+    better = change > 0 if higher_is_better else change < 0
+    return f" ({change:+.1f}%{' ↑' if better else ''})"
+
+
+def print_report(record: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    previous = {r['name']: r for r in baseline['results']} if baseline else {}
+    print(f"\n=== 벤치마크 결과 [{record['label']}] rev={record['git_rev']} ===")
+    if baseline:
+        print(f"비교 대상: [{baseline.get('label')}] {baseline.get('timestamp')} rev={baseline.get('git_rev')}")
+    for result in record['results']:
+        prev = previous.get(result['name'], {})
+        print(
+            f"{result['name']:<32} "
+            f"{result['posts_per_sec']:>9}/s{format_delta(result['posts_per_sec'], prev.get('posts_per_sec'), True)}  "
+            f"p50={result['p50_ms']}ms{format_delta(result['p50_ms'], prev.get('p50_ms'), False)}  "
+            f"p95={result['p95_ms']}ms{format_delta(result['p95_ms'], prev.get('p95_ms'), False)}  "
+            f"peak={result['peak_kb']}KB{format_delta(result['peak_kb'], prev.get('peak_kb'), False)}"
+            + (f"  성공={result['succeeded']}/{result['count']}" if 'succeeded' in result else '')
+        )
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="오프라인 파이프라인 벤치마크")
+    parser.add_argument('--label', default='default', help="실행 기록에 붙일 이름 (엔진/설정 구분용)")
+    parser.add_argument('--baseline', default=None, help="비교할 실행 라벨 (기본값: 직전 실행)")
+    parser.add_argument('--results', default=RESULTS_PATH, help="결과를 누적할 JSONL 경로")
+    parser.add_argument('--no-save', action='store_true', help="결과를 기록하지 않고 출력만")
+    parser.add_argument('--skip-stages', action='store_true', help="단계별 마이크로 벤치마크 생략")
+    parser.add_argument('--repeat', type=int, default=20, help="단계별 벤치마크 반복 횟수 (픽스처당)")
+    parser.add_argument('--modes', default=','.join(MODES),
+                        help="전체 경로 측정 방식 (sequential,workers,pipeline,budgeted 중 쉼표 구분, 빈 값이면 생략)")
+    parser.add_argument('--posts', type=int, default=20, help="전체 경로 측정에 쓸 포스트 수")
+    parser.add_argument('--workers', type=int, default=4, help="workers 방식의 스레드 수")
+    parser.add_argument('--fetch-concurrency', type=int, default=None)
+    parser.add_argument('--translate-concurrency', type=int, default=None)
+    parser.add_argument('--llm-concurrency', type=int, default=None)
+    parser.add_argument('--fetch-latency', type=float, default=0.02, help="가짜 PostView 응답 지연(초)")
+    parser.add_argument('--translate-latency', type=float, default=0.05, help="가짜 번역 요청당 지연(초)")
+    parser.add_argument('--translate-per-char', type=float, default=0.0, help="가짜 번역 글자당 지연(초)")
+    parser.add_argument('--llm-latency', type=float, default=0.1, help="가짜 여행코스 생성 지연(초)")
+    parser.add_argument('--html-parser', default=None, help="BeautifulSoup 파서 (auto, lxml, html.parser)")
+    parser.add_argument('--with-cache', action='store_true', help="번역/여행코스 캐시를 켠 상태로 측정")
+    parser.add_argument('--verbose', action='store_true', help="크롤러 로그 출력")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    args = parse_args(argv)
+    modes = [mode for mode in args.modes.split(',') if mode]
+    for mode in modes:
+        if mode not in MODES:
+            raise SystemExit(f"알 수 없는 측정 방식: {mode} (가능: {', '.join(MODES)})")
+
+    if args.html_parser:
+        args.html_parser = set_default_parser(args.html_parser)
+        print(f"HTML 파서: {args.html_parser}")
+
+    results = []
+    if not args.skip_stages:
+        print("단계별 벤치마크 실행 중...")
+        results.extend(bench_stages(args))
+    for mode in modes:
+        print(f"전체 경로 벤치마크 실행 중: {mode}")
+        results.append(bench_end_to_end(args, mode))
+
+    params = {key: value for key, value in vars(args).items()
+              if key not in ('label', 'baseline', 'results', 'no_save', 'verbose')}
+    record = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'label': args.label,
+        'git_rev': git_revision(),
+        'python': platform.python_version(),
+        'params': params,
+        'results': results,
+    }
+    baseline = load_baseline(args.results, args.baseline)
+    print_report(record, baseline)
+    if not args.no_save:
+        append_record(args.results, record)
+        print(f"\n결과 저장: {args.results}")
+    return record
+
+
+if __name__ == "__main__":
+    main()
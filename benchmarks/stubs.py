@@ -0,0 +1,139 @@
+"""
+벤치마크용 가짜 외부 서비스 (네이버 / DeepL / Perplexity 호출 없이 파이프라인 측정)
+- 지연 시간은 모두 초 단위로 지정
+"""
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Union
+
+from bs4 import BeautifulSoup
+
+from components.naver_fetch import parse_blog_url
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+POSTVIEW_FIXTURES = [
+    'postview_text_heavy.html',
+    'postview_image_heavy.html',
+    'postview_mixed.html',
+]
+RSS_FIXTURE = os.path.join(FIXTURES_DIR, 'rss.xml')
+
+_TITLE_TEXT_PATTERN = re.compile(r'(se-title-text".*?<span[^>]*>)([^<]*)', re.S)
+
+
+def load_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES_DIR, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+class StubResult:
+    """deepl.TextResult처럼 .text만 가진 번역 결과"""
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class StubTranslator:
+    """
+    deepl.Translator.translate_text 흉내
+    - 요청마다 latency초 + 글자당 per_char초 대기
+    - 문자열이면 단일 결과, 리스트면 결과 리스트 반환
+    """
+
+    def __init__(self, latency: float = 0.0, per_char: float = 0.0):
+        self.latency = latency
+        self.per_char = per_char
+        self.calls = 0
+        self.chars = 0
+        self._lock = threading.Lock()
+
+    def translate_text(self, text: Union[str, List[str]], target_lang: str = "EN-US", **kwargs: Any):
+        texts = text if isinstance(text, list) else [text]
+        chars = sum(len(t) for t in texts)
+        with self._lock:
+            self.calls += 1
+            self.chars += chars
+        time.sleep(self.latency + self.per_char * chars)
+        results = [StubResult(f"[{target_lang}] {t}") for t in texts]
+        return results if isinstance(text, list) else results[0]
+
+
+class StubTravel:
+    """add_travel_sync 대체: latency초 대기 후 고정된 여행코스 반환"""
+
+    COURSES = (
+        "1. 연남동 경의선숲길 산책 (도보 5분)\n"
+        "2. 홍대 걷고싶은거리 구경 (도보 10분)\n"
+        "3. 망원한강공원 노을 감상 (버스 15분)\n"
+    )
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, store_and_address: str) -> str:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.latency)
+        return self.COURSES
+
+
+class FixtureFetcher:
+    """
+    fetch_postview_html 대체: URL의 logNo로 픽스처를 골라 반환
+    - 파일명이 겹치지 않도록 제목 뒤에 logNo를 덧붙임
+    """
+
+    def __init__(self, latency: float = 0.0, fixtures: Optional[List[str]] = None):
+        self.latency = latency
+        self.pages = [load_fixture(name) for name in (fixtures or POSTVIEW_FIXTURES)]
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def page_for(self, url: str) -> str:
+        log_no = parse_blog_url(url)[1]
+        return self.pages[int(log_no) % len(self.pages)]
+
+    def __call__(self, url: str, client: Any = None) -> str:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.latency)
+        log_no = parse_blog_url(url)[1]
+        return _TITLE_TEXT_PATTERN.sub(lambda m: f"{m.group(1)}{m.group(2)} {log_no}", self.page_for(url), count=1)
+
+
+class StubElement:
+    def __init__(self, inner_html: str):
+        self._inner_html = inner_html
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        return self._inner_html if name == 'innerHTML' else None
+
+
+class StubDriver:
+    """extract_main_content 측정용: se-main-container만 찾아주는 드라이버"""
+
+    def __init__(self, html: str):
+        container = BeautifulSoup(html, 'html.parser').find('div', class_='se-main-container')
+        self._element = StubElement(container.decode_contents())
+
+    def find_element(self, by: str, value: str) -> StubElement:
+        return self._element
+
+
+def make_posts(count: int, blog_id: str = 'bench', start_log_no: int = 223900000001) -> List[Dict[str, Any]]:
+    """RSS 포스트 정보와 같은 모양의 가짜 포스트 목록"""
+    posts = []
+    for i in range(count):
+        log_no = start_log_no + i
+        posts.append({
+            'title': f"벤치마크 포스트 {i + 1}",
+            'url': f"https://blog.naver.com/{blog_id}/{log_no}",
+            'published': None,
+            'image_url': None,
+            'tags': [],
+        })
+    return posts
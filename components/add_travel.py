@@ -1,15 +1,85 @@
 import os
+import asyncio
+import threading
+from typing import Optional
 import httpx
 from dotenv import load_dotenv
+from components.concurrency import get_limit
+from components.metrics import inc
 
 load_dotenv()
 
 PPLX_API_KEY = os.getenv("PPLX_API_KEY")
+PPLX_URL = "https://api.perplexity.ai/chat/completions"
+KEEPALIVE_EXPIRY = 120.0  # 유휴 커넥션 유지 시간(초)
 
-async def generate_travel_courses(address: str) -> str:
+# 모든 여행코스 요청이 공유하는 이벤트 루프/클라이언트 (백그라운드 스레드에서 실행)
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_client: Optional[httpx.AsyncClient] = None
+_semaphore: Optional[asyncio.Semaphore] = None
+_loop_lock = threading.Lock()
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """여행코스 요청 전용 이벤트 루프 (최초 호출 시 데몬 스레드로 시작)"""
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(target=_loop.run_forever, name="travel-course-loop", daemon=True)
+            _loop_thread.start()
+        return _loop
+
+
+async def get_async_client() -> httpx.AsyncClient:
+    """
+    keep-alive(가능하면 HTTP/2) 커넥션을 재사용하는 공용 AsyncClient
+    동시 요청 수는 concurrency의 'llm' 한도를 따릅니다.
+    """
+    global _client, _semaphore
+    if _client is None:
+        max_concurrency = get_limit('llm')
+        _semaphore = asyncio.Semaphore(max_concurrency)
+        _client = httpx.AsyncClient(
+            http2=_http2_available(),
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+                keepalive_expiry=KEEPALIVE_EXPIRY
+            )
+        )
+    return _client
+
+
+async def _post_travel_request(client: httpx.AsyncClient, headers: dict, prompt: str) -> httpx.Response:
+    return await client.post(
+        PPLX_URL,
+        headers=headers,
+        json={
+            "model": "sonar",
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": 0.7,
+            "max_tokens": 1000
+        },
+        timeout=30.0
+    )
+
+
+async def generate_travel_courses(address: str, client: Optional[httpx.AsyncClient] = None) -> str:
     """
     Perplexity LLM을 사용해 여행 코스 3개를 생성합니다.
     :param address: 기준이 되는 장소 주소
+    :param client: 사용할 AsyncClient (없으면 공용 클라이언트)
     :return: 여행 코스 텍스트 (한국어)
     """
     if not PPLX_API_KEY:
@@ -49,28 +119,51 @@ async def generate_travel_courses(address: str) -> str:
     }
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.perplexity.ai/chat/completions",
-                headers=headers,
-                json={
-                    "model": "sonar",
-                    "messages": [{"role": "user", "content": prompt}],
-                    "temperature": 0.7,
-                    "max_tokens": 1000
-                },
-                timeout=30.0
-            )
-            if response.status_code == 200:
-                return response.json()['choices'][0]['message']['content']
-            else:
-                return f"[ERROR] {response.status_code} - {response.text}"
+        if client is not None:
+            response = await _post_travel_request(client, headers, prompt)
+        elif asyncio.get_running_loop() is _loop:
+            shared_client = await get_async_client()
+            async with _semaphore:
+                response = await _post_travel_request(shared_client, headers, prompt)
+        else:
+            # 공용 루프 밖(asyncio.run 등)에서 호출된 경우 1회용 클라이언트 사용
+            async with httpx.AsyncClient(http2=_http2_available()) as own_client:
+                response = await _post_travel_request(own_client, headers, prompt)
+        inc('perplexity_responses', status=response.status_code)
+        inc('perplexity_response_bytes', len(response.content))
+        if response.status_code == 200:
+            return response.json()['choices'][0]['message']['content']
+        else:
+            return f"[ERROR] {response.status_code} - {response.text}"
     except Exception as e:
         return f"[ERROR] 여행 코스 생성 중 오류: {str(e)}"
 
 
-
 async def add_travel(address):
     print("\n[ 여행코스 추천 갑니다.]")
     courses = await generate_travel_courses(address)
     return courses
+
+
+def run_travel_coroutine(coro):
+    """동기 코드(스레드)에서 공용 루프에 코루틴을 제출하고 결과를 기다림"""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+def add_travel_sync(address: str) -> str:
+    """add_travel의 동기 버전 (호출마다 새 루프/클라이언트를 만들지 않음)"""
+    return run_travel_coroutine(add_travel(address))
+
+
+def close_travel_client() -> None:
+    """공용 AsyncClient와 이벤트 루프 종료 (루프 스레드가 끝난 뒤 루프를 닫음)"""
+    global _loop, _loop_thread, _client, _semaphore
+    with _loop_lock:
+        if _loop is None:
+            return
+        if _client is not None:
+            asyncio.run_coroutine_threadsafe(_client.aclose(), _loop).result()
+        _loop.call_soon_threadsafe(_loop.stop)
+        _loop_thread.join()
+        _loop.close()
+        _loop, _loop_thread, _client, _semaphore = None, None, None, None
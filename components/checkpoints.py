@@ -0,0 +1,157 @@
+import dataclasses
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from components.default_store import DefaultStore, is_off
+from components.document import Document
+from components.get_store_and_address import StoreAddress
+from components.metrics import inc
+from components.post_store import post_key
+
+CHECKPOINT_PATH = os.getenv('POST_CHECKPOINT_PATH', 'post_checkpoints.sqlite3')
+
+# 포스트 처리 단계 (앞에서부터 차례로 완료)
+# parsed: 수집+파싱 (본문 블록, 주소) / enriched: 여행코스 / translated: 번역문
+STAGES = ('parsed', 'enriched', 'translated')
+
+# 체크포인트에 저장하는 단계 메시지 키 (soup, metrics 등 실행 중에만 쓰는 값은 제외)
+STATE_KEYS = (
+    'title', 'safe_title', 'image_count', 'store_and_address', 'part_hashes',
+    'travel_courses', 'translated_travel_courses', 'travel_cache_key', 'eng_title', 'translations',
+    'fallback_translated',
+)
+
+
+def _encode(result: Dict[str, Any]) -> str:
+    state = {key: result[key] for key in STATE_KEYS if key in result}
+    if result.get('document') is not None:
+        state['document'] = result['document'].to_dict()
+    if result.get('store_address') is not None:
+        state['store_address'] = dataclasses.asdict(result['store_address'])
+    return json.dumps(state, ensure_ascii=False)
+
+
+def _decode(data: str) -> Dict[str, Any]:
+    state = json.loads(data)
+    if 'document' in state:
+        state['document'] = Document.from_dict(state['document'])
+    if 'store_address' in state:
+        state['store_address'] = StoreAddress(**state['store_address'])
+    return state
+
+
+class CheckpointStore:
+    """
+    포스트별 마지막으로 끝낸 처리 단계와 그때까지의 결과 (SQLite, logNo 기준).
+    실패한 포스트를 다시 처리할 때 끝난 단계(크롬 수집, 여행코스 LLM 호출, 번역)는 건너뜁니다.
+    파일 저장까지 끝나면 기록을 지웁니다 (이후 상태는 처리 상태 저장소와 매니페스트가 관리).
+    """
+
+    def __init__(self, path: str = CHECKPOINT_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoints ("
+            " log_no TEXT PRIMARY KEY,"
+            " url TEXT NOT NULL,"
+            " stage TEXT NOT NULL,"
+            " state TEXT NOT NULL,"
+            " updated_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def load(self, url: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """(마지막으로 끝낸 단계, 저장된 결과) 또는 None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT stage, state FROM checkpoints WHERE log_no = ?", (post_key(url),)
+            ).fetchone()
+        if row is None or row[0] not in STAGES:
+            return None
+        return row[0], _decode(row[1])
+
+    def save(self, url: str, stage: str, result: Dict[str, Any]) -> None:
+        data = _encode(result)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?)",
+                (post_key(url), url, stage, data, time.time())
+            )
+            self._conn.commit()
+
+    def clear(self, url: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM checkpoints WHERE log_no = ?", (post_key(url),))
+            self._conn.commit()
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM checkpoints").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def restore_checkpoint(result: Dict[str, Any], store: Optional[CheckpointStore] = None) -> Dict[str, Any]:
+    """
+    result['url']의 체크포인트가 있으면 저장된 결과를 result에 합치고 result['checkpoint']에 끝낸 단계 기록
+    """
+    store = store or get_checkpoint_store()
+    saved = store.load(result['url']) if store is not None else None
+    if saved is not None:
+        stage, state = saved
+        result.update(state)
+        result['checkpoint'] = stage
+        inc('checkpoint_resumes', stage=stage)
+        print(f"[체크포인트] {result.get('title', result['url'])}: '{stage}' 단계 이후부터 다시 처리")
+    return result
+
+
+def resume_at(stage: str, func: Callable[[Dict[str, Any]], Dict[str, Any]], save: bool = True
+              ) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    stage 단계를 처리하는 func를 감싸 체크포인트를 적용
+    - 이미 stage(또는 그 뒤 단계)까지 끝낸 포스트는 func를 실행하지 않음
+    - save면 func가 끝난 뒤 stage까지 끝났다고 기록
+    체크포인트 저장소가 꺼져 있으면(POST_CHECKPOINT_PATH=off) func를 그대로 실행
+    """
+    index = STAGES.index(stage)
+
+    def run(result: Dict[str, Any]) -> Dict[str, Any]:
+        done = result.get('checkpoint')
+        if done is not None and STAGES.index(done) >= index:
+            inc('checkpoint_skipped_stages', stage=stage)
+            return result
+        result = func(result)
+        store = get_checkpoint_store()
+        if save and store is not None:
+            store.save(result['url'], stage, result)
+            result['checkpoint'] = stage
+        return result
+    return run
+
+
+def clear_checkpoint(url: str) -> None:
+    """파일 저장까지 끝난 포스트의 체크포인트 삭제"""
+    store = get_checkpoint_store()
+    if store is not None:
+        store.clear(url)
+
+
+_default_store: DefaultStore[CheckpointStore] = DefaultStore(CheckpointStore, disabled=is_off(CHECKPOINT_PATH))
+
+
+def get_checkpoint_store() -> Optional[CheckpointStore]:
+    """기본 체크포인트 저장소 반환 (POST_CHECKPOINT_PATH=off이면 None)"""
+    return _default_store.get()
+
+
+def set_checkpoint_store(store: Optional[CheckpointStore]) -> None:
+    """기본 체크포인트 저장소 교체 (None이면 다음 호출 때 기본 저장소를 다시 만듦)"""
+    _default_store.set(store)
@@ -0,0 +1,46 @@
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+# 외부 자원별 동시 요청 한도 (fetch: 브라우저/HTTP, translate: DeepL, llm: Perplexity, images: 이미지 미러 단계)
+DEFAULT_LIMITS = {
+    'fetch': 4,
+    'translate': 2,
+    'llm': 2,
+    'images': 2,
+}
+
+_limits: Dict[str, int] = dict(DEFAULT_LIMITS)
+_semaphores: Dict[str, threading.BoundedSemaphore] = {
+    name: threading.BoundedSemaphore(value) for name, value in _limits.items()
+}
+
+
+def configure_limits(fetch: Optional[int] = None, translate: Optional[int] = None,
+                     llm: Optional[int] = None, images: Optional[int] = None) -> Dict[str, int]:
+    """
+    자원별 동시 실행 한도 설정. 작업을 시작하기 전에 호출해야 합니다.
+    :return: 적용된 한도
+    """
+    for name, value in (('fetch', fetch), ('translate', translate), ('llm', llm), ('images', images)):
+        if value is not None:
+            if value < 1:
+                raise ValueError(f"{name} 동시 실행 한도는 1 이상이어야 합니다: {value}")
+            _limits[name] = value
+            _semaphores[name] = threading.BoundedSemaphore(value)
+    return dict(_limits)
+
+
+def get_limit(name: str) -> int:
+    return _limits[name]
+
+
+@contextmanager
+def limit(name: str) -> Iterator[None]:
+    """name 자원의 한도 안에서 블록 실행 (한도를 넘으면 대기)"""
+    semaphore = _semaphores[name]
+    semaphore.acquire()
+    try:
+        yield
+    finally:
+        semaphore.release()
@@ -1,9 +1,73 @@
 import deepl
+from components.metrics import inc, timer
+from components.translation_cache import get_translation_cache
+from components.translation_counter import QuotaExceeded, mark_quota_exhausted, reserve_quota, update_translation_count
+from components.translators import (
+    TRANSLATION_BACKENDS, TRANSLATION_STRICT, TranslationError, TranslatorRouter, create_backend
+)
 
-def init_translator(API_KEY):
-    return deepl.Translator(API_KEY)
+# DeepL 요청 1회당 제한: 텍스트 50개, 요청 본문 128KiB
+# 한글은 UTF-8로 3바이트이므로 글자 수 기준으로 여유 있게 잡는다.
+BATCH_MAX_TEXTS = 50
+BATCH_MAX_CHARS = 30000
 
-MAX_RETRIES = 3  # 최대 재시도 횟수
+class DeepLBackend:
+    """
+    DeepL 번역 백엔드 (월간 번역량 집계 대상)
+    남은 번역량이 모자라면 요청 전에, DeepL이 한도 초과를 알려오면 바로 QuotaExceeded
+    """
+    name = 'deepl'
+    tracks_quota = True
+
+    def __init__(self, translator):
+        self.translator = translator
+
+    def translate(self, texts, target_lang):
+        chars = sum(len(text) for text in texts)
+        # 요청하는 동안 chars만큼 예약해 다른 스레드/프로세스가 같은 여유분을 쓰지 못하게 함
+        with reserve_quota(chars):
+            inc('deepl_requests')
+            inc('deepl_request_bytes', sum(len(text.encode('utf-8')) for text in texts))
+            try:
+                with timer('deepl_request_seconds'):
+                    results = self.translator.translate_text(texts, target_lang=target_lang)
+            except deepl.QuotaExceededException as e:
+                # 한도 초과는 재시도해도 실패하므로 이번 달 남은 번역량을 0으로 기록
+                inc('deepl_quota_exceeded')
+                mark_quota_exhausted()
+                raise QuotaExceeded(f"DeepL 월간 번역 한도 초과: {e}") from e
+            update_translation_count(chars)
+        return [result.text for result in results]
+
+    def get_usage(self):
+        return self.translator.get_usage()
+
+def init_translator(API_KEY, backends=TRANSLATION_BACKENDS, strict=TRANSLATION_STRICT):
+    """
+    TRANSLATION_BACKENDS 순서(기본: deepl,google,local)로 백엔드를 묶은 번역 라우터 생성
+    키가 없거나 설치되지 않은 백엔드는 건너뜁니다.
+    """
+    instances = []
+    for name in (name.strip() for name in backends.split(',')):
+        if not name:
+            continue
+        if name == 'deepl':
+            if API_KEY:
+                instances.append(DeepLBackend(deepl.Translator(API_KEY)))
+            continue
+        backend = create_backend(name)
+        if backend is not None:
+            instances.append(backend)
+    if not instances:
+        raise ValueError(f"사용 가능한 번역 백엔드가 없습니다: {backends} (API 키/설치 확인)")
+    print(f"번역 백엔드: {', '.join(backend.name for backend in instances)}")
+    return TranslatorRouter(instances, strict=strict)
+
+def as_router(translator):
+    """라우터가 아닌 DeepL translator(또는 같은 인터페이스의 객체)는 원문 대체 방식의 단일 백엔드 라우터로 감쌈"""
+    if isinstance(translator, TranslatorRouter):
+        return translator
+    return TranslatorRouter([DeepLBackend(translator)], strict=False)
 
 def translate_text(text, translator, target_lang="EN-US"):
     """
@@ -11,23 +75,108 @@ def translate_text(text, translator, target_lang="EN-US"):
     
     Args:
         text (str): Text to translate
-        translator: DeepL translator instance
+        translator: TranslatorRouter or DeepL translator instance
         target_lang (str): Target language code (default: EN-US)
     
     Returns:
-        str: Translated text or original text if translation fails
+        str: Translated text or original text if translation fails (non-strict router only)
+
+    Raises:
+        QuotaExceeded: DeepL monthly quota is used up and no other backend is available
+        TranslationError: every backend failed and the router is strict
     """
     if not text.strip():
         return text
-        
-    retries = 0
-    while retries < MAX_RETRIES:
+    return translate_texts([text], translator, target_lang)[0]
+
+def chunk_texts(texts, max_texts=BATCH_MAX_TEXTS, max_chars=BATCH_MAX_CHARS):
+    """
+    텍스트 목록을 DeepL 요청 한도에 맞는 묶음으로 나눕니다.
+
+    Args:
+        texts (list[str]): 나눌 텍스트 목록
+        max_texts (int): 묶음당 최대 텍스트 개수
+        max_chars (int): 묶음당 최대 글자 수 (한도를 넘는 단일 텍스트는 단독 묶음)
+
+    Returns:
+        list[list[str]]: 순서를 유지한 텍스트 묶음 목록
+    """
+    chunks = []
+    current = []
+    current_chars = 0
+    for text in texts:
+        if current and (len(current) >= max_texts or current_chars + len(text) > max_chars):
+            chunks.append(current)
+            current = []
+            current_chars = 0
+        current.append(text)
+        current_chars += len(text)
+    if current:
+        chunks.append(current)
+    return chunks
+
+def translate_texts(texts, translator, target_lang="EN-US", known=None):
+    """
+    여러 텍스트를 묶음 단위로 한 번에 번역합니다. (translate_texts_detailed의 번역 결과만 반환)
+    """
+    return translate_texts_detailed(texts, translator, target_lang, known)[0]
+
+def translate_texts_detailed(texts, translator, target_lang="EN-US", known=None):
+    """
+    여러 텍스트를 묶음 단위로 한 번에 번역합니다.
+
+    빈 텍스트는 그대로 두고, 번역 캐시에 없는 고유 텍스트만 chunk_texts로
+    나눈 묶음마다 번역 라우터를 한 번씩 호출합니다. 캐시 적중분은 네트워크 요청과
+    월간 번역량 집계에서 제외됩니다. 결과는 입력과 같은 순서로 반환됩니다.
+    라우터의 첫 번째(primary) 백엔드가 번역한 묶음만 번역 캐시에 저장하고,
+    장애로 대체 백엔드가 번역한 묶음은 저장하지 않아 primary가 복구되면 다시 번역합니다.
+
+    Args:
+        texts (list[str]): 번역할 텍스트 목록
+        translator: TranslatorRouter 또는 DeepL translator instance
+        target_lang (str): Target language code (default: EN-US)
+        known (dict[str, str]): 이미 알고 있는 {원문: 번역문} (요청/캐시 조회에서 제외)
+
+    Returns:
+        tuple[list[str], set[str]]: 번역된 텍스트 목록 (strict가 아닌 라우터에서 실패한 묶음은 원본 텍스트 사용)과
+            대체 백엔드가 번역한 원문 집합
+
+    Raises:
+        QuotaExceeded: DeepL 월간 한도 초과이고 대체 백엔드도 없음 (재시도하지 않음)
+        TranslationError: 모든 백엔드 실패 (strict 라우터)
+    """
+    results = list(texts)
+    fallback = set()
+    # 같은 문장(반복 해시태그, 정형 문구 등)은 한 번만 번역
+    unique = [text for text in dict.fromkeys(texts) if text.strip()]
+    if not unique:
+        return results, fallback
+
+    translations = {text: known[text] for text in unique if text in known} if known else {}
+    unique = [text for text in unique if text not in translations]
+
+    cache = get_translation_cache()
+    if cache is not None and unique:
+        translations.update(cache.get_many(unique, target_lang))
+    pending = [text for text in unique if text not in translations]
+    if len(pending) < len(unique):
+        inc('translation_cache_hits', len(unique) - len(pending))
+
+    router = as_router(translator)
+    for chunk in chunk_texts(pending):
         try:
-            result = translator.translate_text(text, target_lang=target_lang)
-            return result.text
-        except Exception as e:
-            print(f"번역 중 에러 발생 (시도 {retries + 1}/{MAX_RETRIES}): {str(e)}")
-            retries += 1
-    
-    print(f"번역 실패 - 원본 텍스트 사용: {text[:50]}...")
-    return text
\ No newline at end of file
+            translated, backend = router.translate_with_backend(chunk, target_lang)
+        except TranslationError:
+            if router.strict:
+                raise
+            print(f"일괄 번역 실패 - 원본 텍스트 {len(chunk)}개 사용: {chunk[0][:50]}...")
+            continue
+        chunk_translations = list(zip(chunk, translated))
+        translations.update(chunk_translations)
+        if backend is not router.primary:
+            inc('translation_fallback_texts', len(chunk), backend=backend.name)
+            fallback.update(chunk)
+        elif cache is not None:
+            cache.set_many(chunk_translations, target_lang)
+
+    return [translations.get(text, text) for text in results], fallback
@@ -0,0 +1,44 @@
+import threading
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar('T')
+
+# 경로 환경 변수를 이 값으로 두면 기본 저장소를 쓰지 않음
+OFF_VALUES = ('', '0', 'off', 'false')
+
+
+def is_off(value: Optional[str]) -> bool:
+    return value is None or value.lower() in OFF_VALUES
+
+
+class DefaultStore(Generic[T]):
+    """
+    경로(환경 변수)로 설정하는 기본 저장소 하나를 관리 (모듈별 get_X()/set_X()의 공통 구현)
+    - 처음 get()할 때 factory()로 만들어 이후 재사용, disabled(경로가 off 등)면 None
+    - set(instance)로 교체 (disabled여도 직접 넣은 인스턴스는 사용)
+    - set(None)이면 처음 상태로 되돌려 다음 get()에서 다시 만듦 (supabase.set_client와 같음)
+    - disable()이면 다음 set()까지 None
+    """
+
+    def __init__(self, factory: Callable[[], T], disabled: bool = False):
+        self._factory = factory
+        self._configured_disabled = disabled
+        self._disabled = disabled
+        self._instance: Optional[T] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Optional[T]:
+        with self._lock:
+            if self._instance is None and not self._disabled:
+                self._instance = self._factory()
+            return self._instance
+
+    def set(self, instance: Optional[T]) -> None:
+        with self._lock:
+            self._instance = instance
+            self._disabled = self._configured_disabled
+
+    def disable(self) -> None:
+        with self._lock:
+            self._instance = None
+            self._disabled = True
@@ -0,0 +1,125 @@
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+TAG_PATTERN = re.compile(r'#([\w가-힣]+)')
+_IMAGE_PART = re.compile(r'\s*!\[pic(\d+)\]\(([^\s)]+)\)\s*$')
+_HEADING_PART = re.compile(r'\s*(#+) (.*?)\s*$', re.S)
+
+
+@dataclass(slots=True)
+class HeadingBlock:
+    """제목 (level 0은 글 제목으로 '#' 없이 출력)"""
+    text: str
+    translation: Optional[str] = None
+    level: int = 1
+
+    def markdown(self, translated: bool = False) -> str:
+        text = self.translation if translated and self.translation is not None else self.text
+        if self.level == 0:
+            return f"{text}\n\n"
+        return f"\n{'#' * self.level} {text}\n\n"
+
+
+@dataclass(slots=True)
+class TextBlock:
+    """본문 문단 (translation이 없으면 번역본에도 원문 사용)"""
+    text: str
+    translation: Optional[str] = None
+
+    def markdown(self, translated: bool = False) -> str:
+        text = self.translation if translated and self.translation is not None else self.text
+        return f"{text}\n\n"
+
+
+@dataclass(slots=True)
+class ImageBlock:
+    """본문 이미지 (번역본과 같은 주소 사용)"""
+    src: str
+    number: int
+
+    def markdown(self, translated: bool = False) -> str:
+        return f"\n![pic{self.number}]({self.src})\n\n"
+
+
+Block = Union[HeadingBlock, TextBlock, ImageBlock]
+_BLOCK_TYPES = {'heading': HeadingBlock, 'text': TextBlock, 'image': ImageBlock}
+_BLOCK_NAMES = {cls: name for name, cls in _BLOCK_TYPES.items()}
+
+
+@dataclass(slots=True)
+class Document:
+    """
+    포스트 본문 (파싱할 때 한 번 만들고 번역/이미지 단계에서 블록을 채워 넣음).
+    markdown()은 기존 content_parts / content_parts_en 리스트와 같은 형태로 출력합니다.
+    """
+    blocks: List[Block] = field(default_factory=list)
+
+    @property
+    def title(self) -> Optional[HeadingBlock]:
+        first = self.blocks[0] if self.blocks else None
+        return first if isinstance(first, HeadingBlock) and first.level == 0 else None
+
+    def text_blocks(self) -> List[TextBlock]:
+        return [block for block in self.blocks if type(block) is TextBlock]
+
+    def images(self) -> List[ImageBlock]:
+        return [block for block in self.blocks if type(block) is ImageBlock]
+
+    def markdown(self, translated: bool = False) -> List[str]:
+        """마크다운 조각 리스트 (translated=True면 번역본)"""
+        return [block.markdown(translated) for block in self.blocks]
+
+    def tags(self) -> List[str]:
+        """원문의 해시태그 (처음 나온 순서, 중복 제거)"""
+        tags: Dict[str, None] = {}
+        for block in self.blocks:
+            if type(block) is not ImageBlock and '#' in block.text:
+                tags.update(dict.fromkeys(TAG_PATTERN.findall(block.text)))
+        return list(tags)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON으로 저장할 수 있는 dict (체크포인트용)"""
+        return {'blocks': [
+            {'type': _BLOCK_NAMES[type(block)], **{name: getattr(block, name) for name in block.__slots__}}
+            for block in self.blocks
+        ]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Document':
+        blocks: List[Block] = []
+        for item in data['blocks']:
+            fields = dict(item)
+            blocks.append(_BLOCK_TYPES[fields.pop('type')](**fields))
+        return cls(blocks)
+
+    @classmethod
+    def from_parts(cls, content_parts: Sequence[str], content_parts_en: Optional[Sequence[str]] = None
+                   ) -> 'Document':
+        """기존 content_parts / content_parts_en 리스트로 Document 생성 (첫 조각은 글 제목)"""
+        content_parts_en = content_parts_en or [None] * len(content_parts)
+        blocks: List[Block] = []
+        for idx, (part, part_en) in enumerate(zip(content_parts, content_parts_en)):
+            translation = part_en.strip() if part_en is not None and part_en != part else None
+            image = _IMAGE_PART.match(part)
+            heading = _HEADING_PART.match(part) if idx else None
+            if image:
+                blocks.append(ImageBlock(image.group(2), int(image.group(1))))
+            elif idx == 0:
+                blocks.append(HeadingBlock(part.strip(), translation, level=0))
+            elif heading and part.startswith('\n'):
+                translated = _HEADING_PART.match(part_en) if translation is not None else None
+                blocks.append(HeadingBlock(heading.group(2), translated.group(2) if translated else translation,
+                                           level=len(heading.group(1))))
+            else:
+                blocks.append(TextBlock(part.strip(), translation))
+        return cls(blocks)
+
+
+def post_document(result: Dict[str, Any]) -> Document:
+    """단계 메시지의 Document (없으면 content_parts / content_parts_en으로 만들어 저장)"""
+    document = result.get('document')
+    if document is None:
+        document = Document.from_parts(result['content_parts'], result.get('content_parts_en'))
+        result['document'] = document
+    return document
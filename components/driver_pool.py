@@ -0,0 +1,127 @@
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+
+from selenium import webdriver
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+
+
+class DriverPool:
+    """
+    재사용 가능한 크롬 드라이버 풀.
+
+    - 최대 size개의 드라이버를 띄워 두고 포스트마다 빌려 씀
+    - 반납 시 기본 컨텐츠로 복귀 + 쿠키 삭제로 상태 초기화
+    - max_pages 페이지를 처리했거나 드라이버가 죽으면 폐기 후 새로 생성
+    - 드라이버마다 0..size-1 중 비어 있는 슬롯 번호를 factory(slot=...)로 넘김
+      (동시에 뜬 크롬이 디스크 캐시 같은 디렉토리를 함께 쓰지 않도록, 재생성된 드라이버는 슬롯을 이어받음)
+    """
+
+    def __init__(self, factory: Callable[..., webdriver.Chrome], size: int = 1, max_pages: int = 50):
+        self.factory = factory
+        self.size = size
+        self.max_pages = max_pages
+        self._idle: "queue.LifoQueue[webdriver.Chrome]" = queue.LifoQueue()
+        self._pages = {}
+        self._free_slots = list(range(size))
+        self._slot_of = {}
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._all: List[webdriver.Chrome] = []
+        self._closed = False
+
+    def _create(self) -> webdriver.Chrome:
+        with self._lock:
+            slot = min(self._free_slots)
+            self._free_slots.remove(slot)
+        try:
+            driver = self.factory(slot=slot)
+        except BaseException:
+            with self._lock:
+                self._free_slots.append(slot)
+            raise
+        with self._lock:
+            self._all.append(driver)
+            self._pages[id(driver)] = 0
+            self._slot_of[id(driver)] = slot
+        return driver
+
+    def _discard(self, driver: webdriver.Chrome) -> None:
+        with self._lock:
+            if driver in self._all:
+                self._all.remove(driver)
+            self._pages.pop(id(driver), None)
+            slot = self._slot_of.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"[드라이버 풀] 드라이버 종료 중 오류: {e}")
+        if slot is not None:
+            # 크롬이 끝난 뒤에 슬롯(캐시 디렉토리)을 다음 드라이버에 넘김
+            with self._lock:
+                self._free_slots.append(slot)
+
+    def _reset(self, driver: webdriver.Chrome) -> None:
+        """다음 페이지를 위해 iframe/쿠키 상태 초기화"""
+        driver.switch_to.default_content()
+        driver.delete_all_cookies()
+
+    @contextmanager
+    def borrow(self) -> Iterator[webdriver.Chrome]:
+        """드라이버를 빌려 with 블록 동안 사용 (블록 종료 시 자동 반납)"""
+        if self._closed:
+            raise RuntimeError("DriverPool is closed")
+        self._slots.acquire()
+        driver: Optional[webdriver.Chrome] = None
+        healthy = True
+        try:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                driver = self._create()
+            yield driver
+        except (TimeoutException, NoSuchElementException):
+            # 페이지 구조 문제일 뿐 브라우저는 정상
+            raise
+        except WebDriverException:
+            # 브라우저 크래시/세션 유실은 드라이버를 폐기
+            healthy = False
+            raise
+        finally:
+            if driver is not None:
+                self._release(driver, healthy)
+            self._slots.release()
+
+    def _release(self, driver: webdriver.Chrome, healthy: bool) -> None:
+        with self._lock:
+            self._pages[id(driver)] = self._pages.get(id(driver), 0) + 1
+            pages = self._pages[id(driver)]
+        if self._closed or not healthy or pages >= self.max_pages:
+            if healthy and not self._closed:
+                print(f"[드라이버 풀] {pages}페이지 처리한 드라이버 재생성")
+            self._discard(driver)
+            return
+        try:
+            self._reset(driver)
+        except WebDriverException as e:
+            print(f"[드라이버 풀] 상태 초기화 실패, 드라이버 폐기: {e}")
+            self._discard(driver)
+            return
+        self._idle.put(driver)
+
+    def close(self) -> None:
+        """풀의 모든 드라이버 종료"""
+        self._closed = True
+        with self._lock:
+            drivers = list(self._all)
+        for driver in drivers:
+            self._discard(driver)
+        while not self._idle.empty():
+            self._idle.get_nowait()
+
+    def __enter__(self) -> "DriverPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
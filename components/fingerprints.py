@@ -0,0 +1,123 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from components.default_store import DefaultStore, is_off
+from components.post_store import post_key
+
+INDEX_PATH = os.getenv('FINGERPRINT_PATH', 'fingerprints.sqlite3')
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def part_hashes(content_parts: Iterable[str]) -> List[str]:
+    """마크다운 조각(제목, 문단, 이미지)별 해시 (앞뒤 공백/줄바꿈 차이는 무시)"""
+    return [text_hash(part.strip()) for part in content_parts]
+
+
+class FingerprintIndex:
+    """
+    처리한 포스트의 내용 지문 (SQLite, logNo 기준).
+
+    - part_hashes: 파싱 직후 마크다운 조각(제목/문단/이미지)별 해시 목록
+    - translations: {원문 해시: 번역문} (다시 크롤링할 때 바뀌지 않은 문단은 번역하지 않음)
+    """
+
+    def __init__(self, path: str = INDEX_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS fingerprints ("
+            " log_no TEXT PRIMARY KEY,"
+            " url TEXT NOT NULL,"
+            " post_hash TEXT NOT NULL,"
+            " part_hashes TEXT NOT NULL,"
+            " translations TEXT NOT NULL,"
+            " updated_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _row(self, url: str) -> Optional[Tuple[str, str, str]]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT post_hash, part_hashes, translations FROM fingerprints WHERE log_no = ?", (post_key(url),)
+            ).fetchone()
+
+    def compare(self, url: str, hashes: List[str]) -> Tuple[str, int]:
+        """
+        지난번 기록과 비교해 (상태, 바뀐 조각 수) 반환
+        상태: 'new'(기록 없음) / 'unchanged' / 'changed'
+        """
+        row = self._row(url)
+        if row is None:
+            return 'new', len(hashes)
+        if row[0] == text_hash(''.join(hashes)):
+            return 'unchanged', 0
+        previous = set(json.loads(row[1]))
+        return 'changed', sum(1 for h in hashes if h not in previous)
+
+    def known_translations(self, url: str, texts: Iterable[str]) -> Dict[str, str]:
+        """texts 중 지난번에 번역해 둔 텍스트의 {원문: 번역문}"""
+        row = self._row(url)
+        if row is None:
+            return {}
+        stored = json.loads(row[2])
+        known = {}
+        for text in texts:
+            translation = stored.get(text_hash(text))
+            if translation is not None:
+                known[text] = translation
+        return known
+
+    def record(self, url: str, hashes: List[str], translations: Optional[Dict[str, str]] = None,
+               complete: bool = True) -> None:
+        """
+        포스트 지문 저장 (translations가 None이면 기존 번역 기록 유지)
+        번역에 실패해 원문이 그대로 돌아온 텍스트는 저장하지 않음
+        complete=False(대체 백엔드로 번역한 문단이 있음)면 다음 compare()가 'changed'를 돌려주도록
+        포스트 해시를 비워 둠 (다시 크롤링할 때 그 문단만 다시 번역)
+        """
+        stored = None
+        if translations is not None:
+            stored = {text_hash(text): translation for text, translation in translations.items()
+                      if translation != text}
+        with self._lock:
+            if stored is None:
+                row = self._conn.execute(
+                    "SELECT translations FROM fingerprints WHERE log_no = ?", (post_key(url),)
+                ).fetchone()
+                stored = json.loads(row[0]) if row else {}
+            self._conn.execute(
+                "INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?, ?, ?, ?)",
+                (post_key(url), url, text_hash(''.join(hashes)) if complete else '', json.dumps(hashes),
+                 json.dumps(stored, ensure_ascii=False), time.time())
+            )
+            self._conn.commit()
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM fingerprints").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_default_index: DefaultStore[FingerprintIndex] = DefaultStore(FingerprintIndex, disabled=is_off(INDEX_PATH))
+
+
+def get_fingerprint_index() -> Optional[FingerprintIndex]:
+    """기본 지문 인덱스 반환 (FINGERPRINT_PATH=off이면 None)"""
+    return _default_index.get()
+
+
+def set_fingerprint_index(index: Optional[FingerprintIndex]) -> None:
+    """기본 지문 인덱스 교체 (None이면 다음 호출 때 기본 인덱스를 다시 만듦)"""
+    _default_index.set(index)
@@ -1,35 +1,101 @@
 import re
+from dataclasses import dataclass
+from typing import Iterable, Optional
 
-def extract_store_and_address(paragraphs):
-    print('주소 찾기 시작')
-    store_name = None
-    address = None
+# 서울 25개 자치구 (주소 후보의 '구'가 실제 자치구인지 확인하는 데 사용)
+SEOUL_GU = frozenset((
+    '강남구', '강동구', '강북구', '강서구', '관악구', '광진구', '구로구', '금천구', '노원구',
+    '도봉구', '동대문구', '동작구', '마포구', '서대문구', '서초구', '성동구', '성북구', '송파구',
+    '양천구', '영등포구', '용산구', '은평구', '종로구', '중구', '중랑구',
+))
 
-    # 1. store_name: paragraphs에서 # 뒤에 나오는 첫 단어
-    for text in paragraphs:
-        m = re.match(r'#\s*([^\s#]+)', text)
-        if m:
-            store_name = m.group(1).strip()
-            break
+_STORE_PATTERN = re.compile(r'#\s*([^\s#]+)')
+_LABELED_PATTERN = re.compile(r'(주소|위치)[:：]?\s*([^\n]+)')
+_ADDRESS_PATTERN = re.compile(r'([가-힣]+시)? ?([가-힣]+구) ?([가-힣]+동)? ?[0-9\-]+')
+# 구/동 분해용: "서울(특별시)", "OO구", "OO동"/"OO1동"/"OO1가동"
+_CITY_PATTERN = re.compile(r'(?<![가-힣])(서울특별시|서울시|서울|[가-힣]+(?:특별시|광역시|시))(?![가-힣])')
+_GU_PATTERN = re.compile(r'(?<![가-힣])([가-힣]{1,4}구)(?![가-힣])')
+_DONG_PATTERN = re.compile(r'(?<![가-힣])([가-힣]+?)\d*가?동(?![가-힣])')
 
-    # 2. 주소: "◈ 위치" 다음 줄이 주소인 경우
-    for idx, text in enumerate(paragraphs):
-        if '위치' in text and '' in text:
-            # 다음 줄이 존재하면 주소로 간주
-            if idx + 1 < len(paragraphs):
-                candidate = paragraphs[idx + 1].strip()
-                if '구' in candidate:
-                    address = candidate
-                    break
-        # 기존 패턴도 fallback
-        m = re.search(r'(주소|위치)[:：]?\s*([^\n]+)', text)
-        if m and '구' in m.group(2):
-            address = m.group(2).strip()
-            break
-        m = re.search(r'([가-힣]+시)? ?([가-힣]+구) ?([가-힣]+동)? ?[0-9\-]+', text)
+
+@dataclass(frozen=True)
+class StoreAddress:
+    """
+    포스트에서 찾은 가게 이름과 주소.
+    str()은 기존 extract_store_and_address 결과와 같은 "가게명, 주소" 형식입니다.
+    """
+    store: Optional[str] = None
+    address: Optional[str] = None  # 본문에 적힌 주소 한 줄 (도로명/지번)
+    city: Optional[str] = None     # "서울" 등 (서울특별시/서울시는 "서울")
+    gu: Optional[str] = None
+    dong: Optional[str] = None     # 행정동 번호를 뺀 동 이름 (망원1동 → 망원동)
+
+    @property
+    def in_seoul(self) -> bool:
+        return self.gu in SEOUL_GU and self.city in (None, '서울')
+
+    def __str__(self) -> str:
+        return f"{self.store}, {self.address}"
+
+
+def parse_address(address: Optional[str], store: Optional[str] = None) -> StoreAddress:
+    """주소 문자열을 시/구/동으로 나눠 StoreAddress로 반환"""
+    if not address:
+        return StoreAddress(store=store)
+    city = gu = dong = None
+    m = _CITY_PATTERN.search(address)
+    if m:
+        city = '서울' if m.group(1).startswith('서울') else m.group(1)
+    m = _GU_PATTERN.search(address)
+    if m:
+        gu = m.group(1)
+        m = _DONG_PATTERN.search(address, m.end())
         if m:
-            address = m.group(0).strip()
+            dong = f"{m.group(1)}동"
+    return StoreAddress(store=store, address=address, city=city, gu=gu, dong=dong)
+
+
+def _is_address(match: re.Match) -> bool:
+    """번지 패턴 후보 중 실제 주소로 볼 수 있는지 ("입구 3번" 같은 오탐 제외)"""
+    return bool(match.group(1)) or match.group(2) in SEOUL_GU
+
+
+def extract_address(paragraphs: Iterable[str]) -> StoreAddress:
+    """
+    마크다운 조각에서 가게 이름과 주소를 한 번의 순회로 찾음
+    - 가게 이름: '#' 뒤에 나오는 첫 단어 (첫 해시태그)
+    - 주소 (먼저 나오는 문단 우선):
+        1. "◈ 위치" 다음 줄에 적힌 주소
+        2. "주소: ..." / "위치: ..." 형식
+        3. "OO시 OO구 OO동 123" 형식의 번지 (서울 자치구이거나 시가 함께 적힌 경우)
+    """
+    store = None
+    address = None
+    location_label = False  # 이전 문단에 '위치'가 있었는지
+    for text in paragraphs:
+        if store is None:
+            m = _STORE_PATTERN.match(text)
+            if m:
+                store = m.group(1).strip()
+        if address is None:
+            has_gu = '구' in text
+            if location_label and has_gu:
+                address = text.strip()
+            elif has_gu:
+                m = _LABELED_PATTERN.search(text) if '주소' in text or '위치' in text else None
+                if m and '구' in m.group(2):
+                    address = m.group(2).strip()
+                else:
+                    # 앞의 후보가 오탐("입구 3번")이어도 같은 문단의 다음 후보를 계속 확인
+                    m = next((m for m in _ADDRESS_PATTERN.finditer(text) if _is_address(m)), None)
+                    if m:
+                        address = m.group(0).strip()
+            location_label = '위치' in text
+        if store is not None and address is not None:
             break
-          
-    print("주소찾기 종료")
-    return f"{store_name}, {address}"
\ No newline at end of file
+    return parse_address(address, store)
+
+
+def extract_store_and_address(paragraphs: Iterable[str]) -> str:
+    """가게 이름과 주소를 "가게명, 주소" 문자열로 반환 (못 찾은 값은 None)"""
+    return str(extract_address(paragraphs))
@@ -0,0 +1,219 @@
+import os
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+# 본문 파싱 엔진
+# - 'lxml': lxml.html 트리를 직접 사용 (가장 빠름)
+# - 'bs4-lxml': BeautifulSoup + lxml 파서
+# - 'html.parser': BeautifulSoup + 파이썬 내장 파서 (추가 설치 없음)
+# - 'auto': lxml이 설치돼 있으면 'lxml', 없으면 'html.parser'
+HTML_PARSER = os.getenv('HTML_PARSER', 'auto')
+PARSERS = ('lxml', 'bs4-lxml', 'html.parser')
+
+# BeautifulSoup 엔진에서 본문 컴포넌트(div.se-component)만 트리로 만들고 나머지는 파싱하면서 버림
+# (파싱 시점에는 class 속성이 나뉘지 않은 문자열이라 단어 단위 정규식으로 비교)
+COMPONENT_STRAINER = SoupStrainer('div', class_=re.compile(r'(?:^|\s)se-component(?:\s|$)'))
+
+# TITLE_SELECTORS 형태의 단순 CSS 선택자 (tag, .class, tag[attr='value'])
+_SIMPLE_SELECTOR = re.compile(
+    r"^(?P<tag>[a-zA-Z][\w-]*)?(?:\.(?P<cls>[\w-]+))?(?:\[(?P<attr>[\w-]+)='(?P<value>[^']*)'\])?$"
+)
+
+_lxml_available: Optional[bool] = None
+_strainer_cache: Dict[Tuple[str, ...], 'SelectorStrainer'] = {}
+_xpath_cache: Dict[str, Any] = {}
+_xpath_lock = threading.Lock()
+
+
+def lxml_available() -> bool:
+    global _lxml_available
+    if _lxml_available is None:
+        try:
+            import lxml.html  # noqa: F401
+            _lxml_available = True
+        except ImportError:
+            _lxml_available = False
+    return _lxml_available
+
+
+def resolve_parser(name: Optional[str] = None) -> str:
+    """사용할 엔진 이름 (lxml 계열을 요청했지만 설치돼 있지 않으면 html.parser)"""
+    name = name or HTML_PARSER
+    if name == 'auto':
+        name = 'lxml'
+    if name not in PARSERS:
+        raise ValueError(f"알 수 없는 HTML 파서입니다: {name} (가능: auto, {', '.join(PARSERS)})")
+    if name in ('lxml', 'bs4-lxml') and not lxml_available():
+        return 'html.parser'
+    return name
+
+
+def set_default_parser(name: str) -> str:
+    """기본 엔진 변경 (실행 옵션/벤치마크용), 실제로 적용될 엔진 이름 반환"""
+    global HTML_PARSER
+    resolved = resolve_parser(name)
+    HTML_PARSER = name
+    return resolved
+
+
+def _bs4_parser(engine: str) -> str:
+    return 'lxml' if engine == 'bs4-lxml' else 'html.parser'
+
+
+def _lxml_parse(html: str, fragment: bool):
+    import lxml.html
+    try:
+        if fragment:
+            return lxml.html.fragment_fromstring(html, create_parent='div')
+        return lxml.html.document_fromstring(html)
+    except ValueError:
+        # 인코딩 선언이 들어 있는 문자열은 바이트로 넘겨야 함
+        data = html.encode('utf-8')
+        if fragment:
+            return lxml.html.fragment_fromstring(data, create_parent='div')
+        return lxml.html.document_fromstring(data)
+
+
+class SelectorStrainer(SoupStrainer):
+    """
+    단순 CSS 선택자(_SIMPLE_SELECTOR) 중 하나라도 맞는 태그와 그 하위 트리만 남기는 strainer
+    (SoupStrainer는 태그 이름과 속성 조건을 AND로만 묶을 수 있어 선택자마다 OR로 비교)
+    """
+
+    def __init__(self, selectors: Sequence[str]):
+        super().__init__()
+        self.rules = []
+        for selector in selectors:
+            m = _SIMPLE_SELECTOR.match(selector)
+            if not m or not any(m.groupdict().values()):
+                raise ValueError(f"지원하지 않는 선택자입니다: {selector}")
+            self.rules.append((m.group('tag'), m.group('cls'), m.group('attr'), m.group('value')))
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        attrs = attrs or {}
+        classes = attrs.get('class') or ''
+        classes = set(classes.split() if isinstance(classes, str) else classes)
+        for tag, cls, attr, value in self.rules:
+            if ((tag is None or tag == name) and (cls is None or cls in classes)
+                    and (attr is None or attrs.get(attr) == value)):
+                return True
+        return False
+
+    def allow_string_creation(self, string: str) -> bool:
+        return False
+
+
+def _strainer(keep: Sequence[str]) -> SelectorStrainer:
+    key = tuple(keep)
+    strainer = _strainer_cache.get(key)
+    if strainer is None:
+        strainer = _strainer_cache[key] = SelectorStrainer(key)
+    return strainer
+
+
+def parse_document(html: str, parser: Optional[str] = None, keep: Optional[Sequence[str]] = None):
+    """
+    PostView 문서 전체 파싱 (제목 + se-main-container)
+    keep을 주면 BeautifulSoup 엔진은 그 선택자에 맞는 요소(와 하위 트리)만 만들고 나머지는 파싱하면서 버림
+    (lxml 엔진은 트리를 C로 만들어 충분히 빠르므로 전체를 파싱)
+    """
+    engine = resolve_parser(parser)
+    if engine == 'lxml':
+        return _lxml_parse(html, fragment=False)
+    return BeautifulSoup(html, _bs4_parser(engine), parse_only=_strainer(keep) if keep else None)
+
+
+def parse_components(html: str, parser: Optional[str] = None):
+    """se-main-container 안쪽 HTML 파싱 (BeautifulSoup 엔진은 se-component만 남김)"""
+    engine = resolve_parser(parser)
+    if engine == 'lxml':
+        return _lxml_parse(html, fragment=True)
+    return BeautifulSoup(html, _bs4_parser(engine), parse_only=COMPONENT_STRAINER)
+
+
+def is_soup(node: Any) -> bool:
+    return isinstance(node, Tag)
+
+
+def _class_xpath(cls: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+
+
+def _xpath(expression: str):
+    with _xpath_lock:
+        compiled = _xpath_cache.get(expression)
+        if compiled is None:
+            from lxml import etree
+            compiled = _xpath_cache[expression] = etree.XPath(expression)
+        return compiled
+
+
+def _selector_xpath(selector: str) -> str:
+    m = _SIMPLE_SELECTOR.match(selector)
+    if not m or not any(m.groupdict().values()):
+        raise ValueError(f"지원하지 않는 선택자입니다: {selector}")
+    predicates = []
+    if m.group('cls'):
+        predicates.append(_class_xpath(m.group('cls')))
+    if m.group('attr'):
+        predicates.append(f"@{m.group('attr')}='{m.group('value')}'")
+    return f".//{m.group('tag') or '*'}" + ''.join(f"[{p}]" for p in predicates)
+
+
+def select_one(node: Any, selector: str) -> Optional[Any]:
+    """문서 순서상 첫 번째로 selector에 맞는 요소"""
+    if is_soup(node):
+        return node.select_one(selector)
+    found = _xpath(_selector_xpath(selector))(node)
+    return found[0] if found else None
+
+
+def find_by_class(node: Any, tag: str, cls: str) -> Optional[Any]:
+    if is_soup(node):
+        return node.find(tag, class_=cls)
+    found = _xpath(f".//{tag}[{_class_xpath(cls)}]")(node)
+    return found[0] if found else None
+
+
+def find_all_by_class(node: Any, tag: str, cls: str) -> List[Any]:
+    if is_soup(node):
+        return node.find_all(tag, class_=cls)
+    return _xpath(f".//{tag}[{_class_xpath(cls)}]")(node)
+
+
+def find_all(node: Any, tag: str) -> List[Any]:
+    if is_soup(node):
+        return node.find_all(tag)
+    return _xpath(f".//{tag}")(node)
+
+
+def class_list(node: Any) -> List[str]:
+    if is_soup(node):
+        return node.get('class', [])
+    return (node.get('class') or '').split()
+
+
+def get_attr(node: Any, name: str, default: Any = None) -> Any:
+    return node.get(name, default)
+
+
+def get_text(node: Any) -> str:
+    if is_soup(node):
+        return node.get_text()
+    return node.text_content()
+
+
+def document_title(node: Any) -> Optional[str]:
+    """<title> 텍스트 (없으면 None)"""
+    if is_soup(node):
+        return node.title.string if node.title else None
+    found = _xpath("//title")(node)
+    return found[0].text if found else None
+
+
+def iter_components(node: Any) -> Iterable[Any]:
+    """본문 컴포넌트(div.se-component)를 문서 순서대로 반환"""
+    return find_all_by_class(node, 'div', 'se-component')
@@ -0,0 +1,242 @@
+import hashlib
+import io
+import multiprocessing
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from components.document import post_document
+from components.metrics import inc, timer
+from components.output_writer import atomic_write
+from components.naver_fetch import HEADERS
+
+IMAGE_DIR = os.getenv('IMAGE_MIRROR_DIR', 'images')
+# 비어 있으면 마크다운 파일(eng/, kor/) 기준 상대 경로, 지정하면 "{IMAGE_BASE_URL}/{파일명}" (CDN)
+IMAGE_BASE_URL = os.getenv('IMAGE_BASE_URL', '')
+MARKDOWN_DIR = 'eng'
+DOWNLOAD_WORKERS = int(os.getenv('IMAGE_DOWNLOAD_WORKERS', '8'))
+RESIZE_WORKERS = int(os.getenv('IMAGE_RESIZE_WORKERS', '0')) or None  # 0이면 CPU 수
+DOWNLOAD_TIMEOUT = 20.0
+# 파생 이미지: 이름 → 최대 너비(px), WebP로 저장
+DERIVATIVES = {'display': 1200, 'thumb': 400}
+WEBP_QUALITY = 80
+
+_EXTENSIONS = {'image/jpeg': '.jpg', 'image/png': '.png', 'image/gif': '.gif', 'image/webp': '.webp'}
+
+
+def pillow_available() -> bool:
+    try:
+        import PIL  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def make_derivatives(path: str, out_dir: str, digest: str) -> Dict[str, str]:
+    """
+    원본 이미지로 DERIVATIVES 크기의 WebP 파일을 만들고 {이름: 파일명} 반환
+    (프로세스 풀에서 실행되므로 모듈 최상위 함수로 둠, 파일마다 고유한 임시 파일에 쓴 뒤 rename)
+    """
+    from PIL import Image, ImageOps
+    created = {}
+    with Image.open(path) as source:
+        if getattr(source, 'is_animated', False):
+            return created  # 움직이는 GIF는 원본 유지
+        image = ImageOps.exif_transpose(source)
+        image = image.convert('RGBA' if image.mode in ('RGBA', 'LA', 'P') else 'RGB')
+        for name, width in DERIVATIVES.items():
+            filename = f"{digest}-{name}.webp"
+            target = os.path.join(out_dir, filename)
+            if not os.path.exists(target):
+                resized = image.copy()
+                resized.thumbnail((width, width * 10))
+                buffer = io.BytesIO()
+                resized.save(buffer, 'WEBP', quality=WEBP_QUALITY, method=6)
+                atomic_write(target, buffer.getvalue())
+            created[name] = filename
+    return created
+
+
+class ImageMirror:
+    """
+    블로그 이미지(postfiles.pstatic.net) 미러.
+
+    - 공용 httpx 클라이언트로 여러 이미지를 동시에 다운로드 (네이버 Referer 포함)
+    - 내용 sha256으로 파일 이름을 정해 같은 이미지는 한 번만 저장
+    - Pillow가 설치돼 있으면 프로세스 풀에서 WebP 파생 이미지(display/thumb) 생성
+    - URL → 저장 결과를 SQLite에 기록해 다시 만난 URL은 다운로드하지 않음
+    """
+
+    def __init__(self, image_dir: str = IMAGE_DIR, base_url: str = IMAGE_BASE_URL,
+                 workers: int = DOWNLOAD_WORKERS, resize_workers: Optional[int] = RESIZE_WORKERS,
+                 db_path: Optional[str] = None, client: Optional[httpx.Client] = None):
+        self.image_dir = image_dir
+        self.base_url = base_url.rstrip('/')
+        os.makedirs(image_dir, exist_ok=True)
+        self._client = client or httpx.Client(
+            headers=HEADERS, timeout=DOWNLOAD_TIMEOUT, follow_redirects=True,
+            limits=httpx.Limits(max_connections=workers, max_keepalive_connections=workers)
+        )
+        self._downloads = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='image-download')
+        self._resize_workers = resize_workers
+        self._resizer: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path or os.path.join(image_dir, 'mirror.sqlite3'), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS images ("
+            " url TEXT PRIMARY KEY,"
+            " original TEXT NOT NULL,"
+            " display TEXT,"
+            " thumb TEXT,"
+            " updated_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def public_url(self, filename: str) -> str:
+        if self.base_url:
+            return f"{self.base_url}/{filename}"
+        return os.path.relpath(os.path.join(self.image_dir, filename), MARKDOWN_DIR).replace(os.sep, '/')
+
+    def _download(self, url: str) -> Optional[Dict[str, str]]:
+        """다운로드해 원본 파일 저장, {'original': 파일명, 'digest': 해시} (실패 시 None)"""
+        try:
+            with timer('image_download_seconds'):
+                response = self._client.get(url)
+                response.raise_for_status()
+        except httpx.HTTPError as e:
+            inc('image_download_errors')
+            print(f"[이미지 다운로드 실패] {url}: {e}")
+            return None
+        data = response.content
+        inc('image_download_bytes', len(data))
+        content_type = response.headers.get('content-type', '').split(';')[0].strip()
+        ext = _EXTENSIONS.get(content_type) or os.path.splitext(urlparse(url).path)[1].lower() or '.jpg'
+        digest = hashlib.sha256(data).hexdigest()[:32]
+        filename = f"{digest}{ext}"
+        path = os.path.join(self.image_dir, filename)
+        if os.path.exists(path):
+            inc('image_dedup_hits')
+        else:
+            # 같은 내용의 이미지를 다른 스레드가 동시에 저장해도 임시 파일이 겹치지 않음 (내용이 같으므로 나중 rename도 무해)
+            atomic_write(path, data)
+        return {'original': filename, 'digest': digest}
+
+    def _get_resizer(self) -> Optional[ProcessPoolExecutor]:
+        if not pillow_available():
+            return None
+        with self._lock:
+            if self._resizer is None:
+                # 파이프라인 스레드가 도는 중에 fork하면 잠긴 락까지 복사되므로 spawn으로 새 프로세스 시작
+                self._resizer = ProcessPoolExecutor(max_workers=self._resize_workers,
+                                                    mp_context=multiprocessing.get_context('spawn'))
+            return self._resizer
+
+    def _lookup(self, urls: List[str]) -> Dict[str, Dict[str, str]]:
+        found = {}
+        with self._lock:
+            for start in range(0, len(urls), 500):
+                batch = urls[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT url, original, display, thumb FROM images WHERE url IN ({','.join('?' * len(batch))})",
+                    batch
+                ).fetchall()
+                for url, original, display, thumb in rows:
+                    found[url] = {'original': original, 'display': display or original, 'thumb': thumb or original}
+        return found
+
+    def mirror(self, urls: Iterable[str]) -> Dict[str, Dict[str, str]]:
+        """
+        urls를 미러링하고 {원본 URL: {'original', 'display', 'thumb': 공개 경로}} 반환
+        다운로드에 실패한 URL은 결과에 없음 (호출한 쪽에서 원본 URL 유지)
+        """
+        unique = list(dict.fromkeys(url for url in urls if url))
+        files = self._lookup(unique)
+        inc('image_mirror_hits', len(files))
+        missing = [url for url in unique if url not in files]
+
+        downloaded = dict(zip(missing, self._downloads.map(self._download, missing)))
+        resizer = self._get_resizer()
+        # 내용이 같은 이미지는 변환 작업을 한 번만 제출하고 결과를 URL끼리 공유
+        jobs = {}
+        for url, saved in downloaded.items():
+            if saved is None:
+                continue
+            if resizer is not None and saved['digest'] not in jobs:
+                jobs[saved['digest']] = resizer.submit(make_derivatives,
+                                                       os.path.join(self.image_dir, saved['original']),
+                                                       self.image_dir, saved['digest'])
+            files[url] = {'original': saved['original'], 'display': saved['original'], 'thumb': saved['original']}
+        derivatives = {}
+        for digest, job in jobs.items():
+            try:
+                with timer('image_resize_wait_seconds'):
+                    derivatives[digest] = job.result()
+            except Exception as e:
+                inc('image_resize_errors')
+                print(f"[이미지 변환 실패] {digest}: {e}")
+        for url, saved in downloaded.items():
+            if saved is not None and saved['digest'] in derivatives:
+                files[url].update(derivatives[saved['digest']])
+
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO images VALUES (?, ?, ?, ?, ?)",
+                [(url, files[url]['original'], files[url]['display'], files[url]['thumb'], now)
+                 for url in downloaded if url in files]
+            )
+            self._conn.commit()
+        return {url: {name: self.public_url(filename) for name, filename in variants.items()}
+                for url, variants in files.items()}
+
+    def close(self) -> None:
+        self._downloads.shutdown()
+        if self._resizer is not None:
+            self._resizer.shutdown()
+        self._client.close()
+        with self._lock:
+            self._conn.close()
+
+
+def mirror_post_images(result: Dict[str, Any], cover_url: Optional[str] = None,
+                       mirror: Optional['ImageMirror'] = None) -> Dict[str, Any]:
+    """
+    [이미지 단계] 본문 이미지와 대표 이미지(cover_url, 보통 RSS image_url)를 미러링하고
+    본문 이미지 블록의 주소를 display 경로로 교체, result['cover_image']에 대표 썸네일 경로 저장
+    (미러링에 실패한 이미지는 원래 주소 유지) 미러가 설정되지 않았으면 아무것도 하지 않음
+    """
+    mirror = mirror or get_image_mirror()
+    if mirror is None:
+        return result
+    images = post_document(result).images()
+    cover_url = cover_url or (images[0].src if images else None)
+    with timer('image_mirror_seconds'):
+        mirrored = mirror.mirror([image.src for image in images] + ([cover_url] if cover_url else []))
+    for image in images:
+        if image.src in mirrored:
+            image.src = mirrored[image.src]['display']
+    if cover_url in mirrored:
+        result['cover_image'] = mirrored[cover_url]['thumb']
+    return result
+
+
+_default_mirror: Optional[ImageMirror] = None
+_default_lock = threading.Lock()
+
+
+def get_image_mirror() -> Optional[ImageMirror]:
+    """기본 이미지 미러 (set_image_mirror로 켜기 전에는 None)"""
+    with _default_lock:
+        return _default_mirror
+
+
+def set_image_mirror(mirror: Optional[ImageMirror]) -> None:
+    global _default_mirror
+    with _default_lock:
+        _default_mirror = mirror
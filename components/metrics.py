@@ -0,0 +1,232 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# 포스트별 측정 결과(JSON 한 줄씩) 저장 경로, 'off'이면 기록하지 않음
+METRICS_LOG_PATH = os.getenv('METRICS_LOG_PATH', 'metrics.jsonl')
+PROMETHEUS_PREFIX = 'naver_crawl'
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _prometheus_labels(labels: LabelKey) -> str:
+    if not labels:
+        return ''
+    escaped = (
+        (name, value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in labels
+    )
+    return '{' + ','.join(f'{name}="{value}"' for name, value in escaped) + '}'
+
+
+def _format_name(name: str, labels: LabelKey) -> str:
+    """포스트별 기록에 쓸 이름 (예: title_selector_seconds{selector=h1})"""
+    if not labels:
+        return name
+    return f"{name}{{{','.join(f'{k}={v}' for k, v in labels)}}}"
+
+
+class PostMetrics:
+    """포스트 한 건의 단계별 소요 시간과 카운터 (여러 스레드/단계를 거쳐도 같은 객체에 누적)"""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.started_at = time.time()
+        self._started = time.perf_counter()
+        self.timings: Dict[str, float] = {}
+        self.counters: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def add_timing(self, key: str, seconds: float) -> None:
+        with self._lock:
+            self.timings[key] = self.timings.get(key, 0.0) + seconds
+
+    def add_count(self, key: str, value: float) -> None:
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def to_dict(self, status: str, error: Optional[str] = None,
+                failed_stage: Optional[str] = None) -> Dict[str, Any]:
+        with self._lock:
+            record = {
+                'url': self.url,
+                'status': status,
+                'started_at': round(self.started_at, 3),
+                'total_seconds': round(time.perf_counter() - self._started, 4),
+                'timings': {key: round(value, 4) for key, value in self.timings.items()},
+                'counters': dict(self.counters),
+            }
+        if error is not None:
+            record['error'] = error
+        if failed_stage is not None:
+            record['failed_stage'] = failed_stage
+        return record
+
+
+class MetricsRegistry:
+    """
+    카운터/타이머 집계기.
+
+    - 전체 누적값은 render_prometheus()로 Prometheus 텍스트 형식 출력
+    - 현재 스레드에서 활성화된 PostMetrics가 있으면 같은 값을 포스트별로도 기록
+    - finish_post()가 포스트별 결과를 log_path에 JSON 한 줄로 추가
+    """
+
+    def __init__(self, log_path: Optional[str] = METRICS_LOG_PATH):
+        self.log_path = None if log_path in (None, '', 'off') else log_path
+        self._counters: Dict[Tuple[str, LabelKey], float] = {}
+        self._timers: Dict[Tuple[str, LabelKey], List[float]] = {}  # [count, sum, max]
+        self._lock = threading.Lock()
+        self._log_lock = threading.Lock()
+        self._local = threading.local()
+
+    def current(self) -> Optional[PostMetrics]:
+        return getattr(self._local, 'post', None)
+
+    def inc(self, name: str, value: float = 1, **labels: Any) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._counters[(name, key)] = self._counters.get((name, key), 0) + value
+        post = self.current()
+        if post is not None:
+            post.add_count(_format_name(name, key), value)
+
+    def observe(self, name: str, seconds: float, **labels: Any) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            stat = self._timers.setdefault((name, key), [0, 0.0, 0.0])
+            stat[0] += 1
+            stat[1] += seconds
+            stat[2] = max(stat[2], seconds)
+        post = self.current()
+        if post is not None:
+            post.add_timing(_format_name(name, key), seconds)
+
+    @contextmanager
+    def timer(self, name: str, **labels: Any) -> Iterator[None]:
+        """블록 실행 시간을 name 타이머에 기록 (예외가 나도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def start_post(self, url: str) -> PostMetrics:
+        return PostMetrics(url)
+
+    @contextmanager
+    def activate(self, post: Optional[PostMetrics]) -> Iterator[Optional[PostMetrics]]:
+        """with 블록 동안 현재 스레드의 측정값을 post에도 기록"""
+        previous = self.current()
+        self._local.post = post
+        try:
+            yield post
+        finally:
+            self._local.post = previous
+
+    def finish_post(self, post: PostMetrics, error: Optional[BaseException] = None,
+                    failed_stage: Optional[str] = None) -> Dict[str, Any]:
+        """포스트 처리 결과를 log_path에 JSON 한 줄로 기록하고 반환"""
+        record = post.to_dict(
+            'error' if error is not None else 'ok',
+            error=str(error) if error is not None else None,
+            failed_stage=failed_stage
+        )
+        self.inc('posts', status=record['status'])
+        if self.log_path:
+            line = json.dumps(record, ensure_ascii=False)
+            with self._log_lock:
+                with open(self.log_path, 'a', encoding='utf-8') as f:
+                    f.write(line + '\n')
+        return record
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'counters': {_format_name(name, key): value for (name, key), value in self._counters.items()},
+                'timers': {
+                    _format_name(name, key): {'count': stat[0], 'sum': round(stat[1], 4), 'max': round(stat[2], 4)}
+                    for (name, key), stat in self._timers.items()
+                },
+            }
+
+    def render_prometheus(self, prefix: str = PROMETHEUS_PREFIX) -> str:
+        """Prometheus 텍스트 형식 (카운터는 _total, 타이머는 summary의 _count/_sum과 _max)"""
+        with self._lock:
+            counters = sorted(self._counters.items())
+            timers = sorted(self._timers.items())
+
+        lines = []
+        declared = set()
+        for (name, key), value in counters:
+            metric = f"{prefix}_{name}_total"
+            if metric not in declared:
+                lines.append(f"# TYPE {metric} counter")
+                declared.add(metric)
+            lines.append(f"{metric}{_prometheus_labels(key)} {value}")
+        for (name, key), (count, total, maximum) in timers:
+            metric = f"{prefix}_{name}"
+            if metric not in declared:
+                lines.append(f"# TYPE {metric} summary")
+                lines.append(f"# TYPE {metric}_max gauge")
+                declared.add(metric)
+            lines.append(f"{metric}_count{_prometheus_labels(key)} {count}")
+            lines.append(f"{metric}_sum{_prometheus_labels(key)} {total:.6f}")
+            lines.append(f"{metric}_max{_prometheus_labels(key)} {maximum:.6f}")
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path: str) -> None:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.render_prometheus())
+        os.replace(tmp_path, path)
+
+    def print_summary(self, limit: int = 15) -> None:
+        """누적 시간이 큰 타이머 순으로 출력 (어느 단계가 지배적인지 확인용)"""
+        timers = self.snapshot()['timers']
+        if not timers:
+            return
+        print("\n=== 단계별 소요 시간 (누적 순) ===")
+        for name, stat in sorted(timers.items(), key=lambda item: item[1]['sum'], reverse=True)[:limit]:
+            avg = stat['sum'] / stat['count'] if stat['count'] else 0.0
+            print(f"{name}: 횟수={stat['count']} 누적={stat['sum']:.3f}s 평균={avg:.3f}s 최대={stat['max']:.3f}s")
+
+
+_default_registry: Optional[MetricsRegistry] = None
+_default_lock = threading.Lock()
+
+
+def get_metrics() -> MetricsRegistry:
+    """기본 측정 레지스트리"""
+    global _default_registry
+    with _default_lock:
+        if _default_registry is None:
+            _default_registry = MetricsRegistry()
+        return _default_registry
+
+
+def set_metrics(registry: MetricsRegistry) -> None:
+    """기본 측정 레지스트리 교체"""
+    global _default_registry
+    with _default_lock:
+        _default_registry = registry
+
+
+def inc(name: str, value: float = 1, **labels: Any) -> None:
+    get_metrics().inc(name, value, **labels)
+
+
+def observe(name: str, seconds: float, **labels: Any) -> None:
+    get_metrics().observe(name, seconds, **labels)
+
+
+def timer(name: str, **labels: Any):
+    """get_metrics().timer의 단축 함수"""
+    return get_metrics().timer(name, **labels)
@@ -0,0 +1,162 @@
+import json
+import os
+import re
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import unquote_plus, urlparse
+
+import httpx
+
+from components.concurrency import limit
+from components.naver_fetch import get_http_client
+from components.post_store import PostStore, post_key
+
+POST_LIST_URL = "https://blog.naver.com/PostTitleListAsync.naver"
+CATEGORY_LIST_URL = "https://m.blog.naver.com/api/blogs/{blog_id}/category-list"
+CHECKPOINT_PATH = 'backfill_checkpoint.json'
+COUNT_PER_PAGE = 30   # PostTitleListAsync 최대 페이지 크기
+REQUEST_DELAY = 1.0   # 목록 페이지 요청 간격(초)
+
+
+def resolve_blog_id(rss_url: str) -> str:
+    """RSS 주소(https://rss.blog.naver.com/{blogId}.xml)에서 blogId 추출"""
+    path = urlparse(rss_url or '').path
+    m = re.match(r'^/([A-Za-z0-9_-]+)(?:\.xml)?$', path)
+    if not m:
+        raise ValueError(f"RSS 주소에서 blogId를 찾을 수 없습니다: {rss_url}")
+    return m.group(1)
+
+
+def find_category_no(blog_id: str, category_name: str, client: Optional[httpx.Client] = None) -> str:
+    """카테고리 이름으로 categoryNo 조회"""
+    with limit('fetch'):
+        response = (client or get_http_client()).get(CATEGORY_LIST_URL.format(blog_id=blog_id))
+    response.raise_for_status()
+    categories = response.json().get('result', {}).get('mylogCategoryList', [])
+    for category in categories:
+        if category.get('categoryName') == category_name:
+            return str(category['categoryNo'])
+    raise ValueError(f"카테고리를 찾을 수 없습니다: {category_name}")
+
+
+def fetch_post_list_page(blog_id: str, category_no: str, page: int,
+                         client: Optional[httpx.Client] = None) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    카테고리 글 목록 한 페이지 조회
+    :return: (포스트 정보 목록, 전체 글 수)
+    """
+    params = {
+        'blogId': blog_id,
+        'viewdate': '',
+        'currentPage': page,
+        'categoryNo': category_no,
+        'parentCategoryNo': '',
+        'countPerPage': COUNT_PER_PAGE,
+    }
+    with limit('fetch'):
+        response = (client or get_http_client()).get(POST_LIST_URL, params=params)
+    response.raise_for_status()
+    # 응답에 JSON 규격에 없는 \' 이스케이프가 섞여 있어 보정 후 파싱
+    data = json.loads(response.text.replace("\\'", "'"))
+    if data.get('resultCode') not in (None, 'S'):
+        raise ValueError(f"글 목록 조회 실패: {data.get('resultMessage')}")
+
+    posts = []
+    for item in data.get('postList', []):
+        log_no = str(item['logNo'])
+        posts.append({
+            'title': unquote_plus(item.get('title', '')),
+            'url': f"https://blog.naver.com/{blog_id}/{log_no}",
+            'published': item.get('addDate'),
+            'image_url': None,
+            'tags': [],
+        })
+    return posts, int(data.get('totalCount') or 0)
+
+
+def load_checkpoint(path: str = CHECKPOINT_PATH) -> Dict[str, Any]:
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except json.JSONDecodeError:
+        print(f"Warning: {path} is empty or malformed. Starting from the first page.")
+        return {}
+
+
+def save_checkpoint(state: Dict[str, Any], path: str = CHECKPOINT_PATH) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def iter_backfill_posts(blog_id: str, category_no: str, store: PostStore,
+                        max_posts: Optional[int] = None, delay: float = REQUEST_DELAY,
+                        checkpoint_path: str = CHECKPOINT_PATH) -> Iterator[Dict[str, Any]]:
+    """
+    카테고리 전체 글 목록을 페이지 단위로 훑으며 미처리 포스트를 하나씩 반환
+    - 지난 실행에서 목록에 올렸지만 처리 완료(mark_processed)되지 않은 포스트(저장소의 pending)를 먼저 반환
+    - 처리 완료된 포스트는 건너뜀
+    - 반환하는 포스트는 먼저 저장소에 대기(pending)로 기록한 뒤 체크포인트에 그 logNo를 저장
+      (새 글이 올라오거나 글이 지워져 페이지가 밀려도 다음 실행은 logNo 기준으로 그 다음 글부터 확인)
+    """
+    checkpoint = load_checkpoint(checkpoint_path)
+    page, cursor = 1, None
+    if checkpoint.get('blog_id') == blog_id and checkpoint.get('category_no') == category_no:
+        page = checkpoint.get('page', checkpoint.get('next_page', 1))  # next_page: 예전 형식
+        cursor = checkpoint.get('last_log_no')
+        print(f"[백필] 체크포인트에서 재개: {page}페이지, logNo {cursor} 다음부터")
+
+    def save(page_no: int, log_no: Optional[str]) -> None:
+        save_checkpoint({'blog_id': blog_id, 'category_no': category_no,
+                         'page': page_no, 'last_log_no': log_no}, checkpoint_path)
+
+    yielded = 0
+    seen_urls = set()
+    pending = store.pending_posts()
+    if pending:
+        print(f"[백필] 지난 실행에서 처리하지 못한 포스트 {len(pending)}개부터 처리")
+    for post in pending:
+        if max_posts is not None and yielded >= max_posts:
+            return
+        seen_urls.add(post['url'])
+        yield post
+        yielded += 1
+
+    total_count = None
+    resuming = cursor is not None
+    while True:
+        posts, total_count = fetch_post_list_page(blog_id, category_no, page)
+        print(f"[백필] {page}페이지: {len(posts)}개 (전체 {total_count}개)")
+        if resuming and page > 1 and (not posts or int(post_key(posts[0]['url'])) < int(cursor)):
+            # 글이 지워져 목록이 당겨졌으면 앞 페이지부터 다시 확인
+            page -= 1
+            time.sleep(delay)
+            continue
+        resuming = False
+        if not posts:
+            break
+        for post in posts:
+            log_no = post_key(post['url'])
+            if cursor is not None and int(log_no) >= int(cursor):
+                continue  # 지난 실행에서 확인한 글 (또는 그 뒤에 올라온 새 글, RSS에서 처리)
+            if post['url'] not in seen_urls and not store.is_processed(post['url']):
+                if max_posts is not None and yielded >= max_posts:
+                    return
+                store.add_pending(post)
+                cursor = log_no
+                save(page, cursor)
+                seen_urls.add(post['url'])
+                yield post
+                yielded += 1
+            else:
+                cursor = log_no
+        page += 1
+        save(page, cursor)
+        if (page - 1) * COUNT_PER_PAGE >= total_count:
+            break
+        time.sleep(delay)
+
+    print(f"[백필] 목록 끝까지 확인 완료 (전체 {total_count}개)")
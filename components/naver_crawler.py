@@ -12,72 +12,183 @@ from components.add_travel import add_travel
 from components.deepl import translate_text
 
 
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, List, Dict, Any, Optional
 import os
 import re
 import asyncio
+import threading
+from contextlib import nullcontext
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from bs4 import BeautifulSoup
-from components.get_store_and_address import extract_store_and_address
-from components.add_travel import add_travel
-from components.deepl import translate_text
+from components.get_store_and_address import extract_address
+from components.add_travel import add_travel, add_travel_sync
+from components.deepl import translate_text, translate_texts, translate_texts_detailed
+from components.concurrency import limit
+from components.checkpoints import restore_checkpoint, resume_at
+from components.document import Block, Document, HeadingBlock, ImageBlock, TextBlock
+from components.driver_pool import DriverPool
+from components.html_parser import (
+    class_list, document_title, find_all, find_all_by_class, find_by_class, get_text, iter_components,
+    parse_components, parse_document, select_one
+)
+from components.metrics import inc, timer
+from components.naver_fetch import fetch_postview_html, parse_blog_url
+from components.fingerprints import part_hashes
+from components.quota_scheduler import TRAVEL_ESTIMATE_CHARS, estimate_translation_cost
+from components.translation_counter import reserve_quota
+from components.translators import TranslatorRouter
+from components.travel_cache import get_travel_cache, normalize_address
+
+# 본문 수집 방식: 'http'(PostView 직접 요청), 'selenium', 'auto'(http 실패 시 selenium)
+FETCH_MODE = os.getenv('FETCH_MODE', 'auto')
+
+# 크롬 프로필: 'lean'(이미지/미디어/광고 차단, eager 로딩) 또는 'full'(모든 리소스 로딩)
+BROWSER_PROFILES = ('lean', 'full')
+BROWSER_PROFILE = os.getenv('BROWSER_PROFILE', 'lean')
+# lean 프로필의 디스크 캐시 디렉토리 (드라이버를 재생성하거나 다음 실행에서도 스크립트/CSS 재사용, 빈 값이면 사용 안 함)
+CHROME_CACHE_DIR = os.getenv('CHROME_CACHE_DIR', '.chrome_cache')
+BLOCKED_URL_PATTERNS = [
+    # 동영상/오디오
+    '*.mp4', '*.webm', '*.m3u8', '*.ts', '*.mp3',
+    # 웹폰트
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    # 광고/통계
+    '*doubleclick.net*', '*googlesyndication.com*', '*google-analytics.com*', '*googletagmanager.com*',
+    '*veta.naver.com*', '*adcr.naver.com*', '*lcs.naver.com*', '*nlog.naver.com*',
+]
+
+# 제목 후보 선택자 (우선순위 순)
+TITLE_SELECTORS = [
+    ".se-title-text",
+    ".se_editArea",
+    ".se_editable",
+    ".pcol1",
+    "h1",
+    "h2",
+    "h3",
+    "div[role='heading']",
+]
+TITLE_SELECTOR_ANY = ", ".join(TITLE_SELECTORS)
+# 블로그별로 기억하는 선택자는 에디터 전용 선택자까지만 (h1/h2/h3 같은 일반 선택자는 본문 제목과 겹침)
+MEMO_SELECTOR_COUNT = TITLE_SELECTORS.index("h1")
+# HTTP로 받은 PostView 문서에서 남길 요소 (<title>, 제목 후보, 본문 컨테이너)
+POSTVIEW_KEEP = ("title", "div.se-main-container", *TITLE_SELECTORS)
+TITLE_WAIT_SECONDS = 3  # 포스트당 제목 대기 한도 (선택자별이 아니라 전체에 한 번)
 
+# 블로그별로 마지막에 제목을 찾은 선택자 위치 (같은 블로그는 레이아웃이 같음)
+_title_memo: Dict[str, int] = {}
+_title_memo_lock = threading.Lock()
 
-def get_chrome_driver() -> webdriver.Chrome:
-    """크롬 드라이버 객체 생성"""
+
+def build_chrome_options(profile: str = BROWSER_PROFILE, cache_dir: Optional[str] = CHROME_CACHE_DIR,
+                         slot: int = 0) -> Options:
+    """
+    크롬 옵션 생성
+    - 'lean': 이미지 로딩 끔, DOMContentLoaded까지만 대기(eager), 디스크 캐시 사용
+    - 'full': 기존과 같은 기본 옵션
+    디스크 캐시는 크롬 프로세스 하나만 쓸 수 있으므로 cache_dir 아래 슬롯(드라이버 풀 번호)별 디렉토리를 사용
+    """
+    if profile not in BROWSER_PROFILES:
+        raise ValueError(f"알 수 없는 브라우저 프로필입니다: {profile} (가능: {', '.join(BROWSER_PROFILES)})")
     chrome_options = Options()
     chrome_options.add_argument('--headless')
     chrome_options.add_argument('--no-sandbox')
     chrome_options.add_argument('--disable-dev-shm-usage')
-    return webdriver.Chrome(options=chrome_options)
+    if profile == 'lean':
+        chrome_options.page_load_strategy = 'eager'
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_argument('--mute-audio')
+        chrome_options.add_argument('--autoplay-policy=user-gesture-required')
+        chrome_options.add_argument('--disable-extensions')
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+        })
+        if cache_dir:
+            chrome_options.add_argument(f'--disk-cache-dir={os.path.join(os.path.abspath(cache_dir), f"slot-{slot}")}')
+    return chrome_options
+
+
+def get_chrome_driver(profile: str = BROWSER_PROFILE, cache_dir: Optional[str] = CHROME_CACHE_DIR,
+                      slot: int = 0) -> webdriver.Chrome:
+    """크롬 드라이버 객체 생성 (profile: 'lean' | 'full', slot: 디스크 캐시 디렉토리 번호)"""
+    driver = webdriver.Chrome(options=build_chrome_options(profile, cache_dir, slot))
+    if profile == 'lean':
+        # 본문 DOM만 필요하므로 동영상/폰트/광고/통계 요청은 네트워크 단계에서 차단
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            print(f"[경고] 요청 차단 설정 실패 (계속 진행): {e}")
+    driver.browser_profile = profile  # 페이지 로드 시간 측정 라벨
+    return driver
 
 
-def extract_blog_title(driver: webdriver.Chrome) -> Tuple[str, str]:
+def _find_title(soup: Any, blog_id: Optional[str] = None) -> Optional[str]:
+    """
+    TITLE_SELECTORS를 순서대로 찾아 첫 번째로 비어 있지 않은 제목 반환
+    blog_id가 주어지면 그 블로그에서 마지막으로 성공한 에디터 선택자를 먼저 시도합니다.
+    (일반 선택자 h1/h2/h3 등은 기억하지 않으므로 .se-title-text보다 앞서는 일이 없음)
+    """
+    with _title_memo_lock:
+        memo = _title_memo.get(blog_id) if blog_id else None
+    order = list(range(len(TITLE_SELECTORS)))
+    if memo is not None:
+        order.remove(memo)
+        order.insert(0, memo)
+
+    for idx in order:
+        element = select_one(soup, TITLE_SELECTORS[idx])
+        if element is not None:
+            title = get_text(element).strip()
+            if title:
+                inc('title_selector_hits', selector=TITLE_SELECTORS[idx])
+                if blog_id and idx < MEMO_SELECTOR_COUNT:
+                    if idx == memo:
+                        inc('title_memo_hits')
+                    with _title_memo_lock:
+                        _title_memo[blog_id] = idx
+                return title
+    return None
+
+
+def _safe_title(title: str) -> str:
+    """안전한 파일명 생성 (파일 시스템에서 허용되지 않는 문자 제거, 길이 제한)"""
+    return re.sub(r'[\\/*?:"<>|]', '', title)[:100]
+
+
+def extract_blog_title(driver: webdriver.Chrome, blog_id: Optional[str] = None) -> Tuple[str, str]:
     """
     블로그 제목 추출 및 안전한 파일명으로 변환
     다양한 네이버 블로그 레이아웃에 대응하기 위해 여러 선택자로 시도합니다.
+    - 모든 후보 선택자를 합친 선택자로 한 번만 기다린 뒤(최대 TITLE_WAIT_SECONDS초)
+      페이지 스냅샷에서 후보를 순서대로 찾음
     """
     try:
-        # 여러 선택자로 시도
-        selectors = [
-            (By.CLASS_NAME, "se-title-text"),  # 일반적인 선택자
-            (By.CLASS_NAME, "se_editArea"),    # 대체 선택지 1
-            (By.CLASS_NAME, "se_editable"),    # 대체 선택지 2
-            (By.CLASS_NAME, "pcol1"),          # 대체 선택지 3
-            (By.TAG_NAME, "h1"),               # h1 태그로 대체
-            (By.TAG_NAME, "h2"),               # h2 태그로 대체
-            (By.TAG_NAME, "h3"),               # h3 태그로 대체
-            (By.CSS_SELECTOR, "div[role='heading']")  # ARIA role 사용
-        ]
-        
-        title = None
-        for by, selector in selectors:
-            try:
-                element = WebDriverWait(driver, 3).until(
-                    EC.presence_of_element_located((by, selector))
+        try:
+            with timer('title_wait_seconds'):
+                WebDriverWait(driver, TITLE_WAIT_SECONDS).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, TITLE_SELECTOR_ANY))
                 )
-                title = element.text.strip()
-                if title:  # 제목을 찾았으면 종료
-                    break
-            except Exception as e:
-                continue
-        
+        except TimeoutException:
+            pass
+
+        title = _find_title(parse_document(driver.page_source), blog_id)
+
         # 그래도 제목을 찾지 못한 경우
         if not title:
+            inc('title_fallbacks')
             title = driver.title.split(" : ")[0]  # 블로그 이름 제거
             
         # 그래도 없으면 기본값 사용
         if not title:
             title = "제목 없음"
             
-        # 안전한 파일명 생성 (파일 시스템에서 허용되지 않는 문자 제거)
-        safe_title = re.sub(r'[\\/*?:"<>|]', '', title)[:100]  # 파일명 길이 제한
-        
-        return title, safe_title
+        return title, _safe_title(title)
         
     except Exception as e:
         print(f"[경고] 제목 추출 중 오류가 발생했습니다: {e}")
@@ -85,115 +196,337 @@ def extract_blog_title(driver: webdriver.Chrome) -> Tuple[str, str]:
         return "제목 없음", "untitled_blog_post"
 
 
-def extract_main_content(driver: webdriver.Chrome) -> BeautifulSoup:
-    """본문 HTML 파싱 및 soup 반환"""
+def extract_blog_title_from_soup(soup: Any, blog_id: Optional[str] = None) -> Tuple[str, str]:
+    """extract_blog_title과 같은 규칙으로 정적 HTML(parse_document 결과)에서 제목 추출"""
+    title = _find_title(soup, blog_id)
+
+    page_title = document_title(soup) if not title else None
+    if page_title:
+        inc('title_fallbacks')
+        title = page_title.split(" : ")[0].strip()  # 블로그 이름 제거
+
+    if not title:
+        title = "제목 없음"
+
+    return title, _safe_title(title)
+
+
+def extract_main_content(driver: webdriver.Chrome) -> Any:
+    """본문 HTML 파싱 및 soup 반환 (html_parser의 기본 엔진 사용)"""
     main_content = WebDriverWait(driver, 10).until(
         EC.presence_of_element_located((By.CLASS_NAME, "se-main-container"))
     )
-    soup = BeautifulSoup(main_content.get_attribute('innerHTML'), 'html.parser')
+    soup = parse_components(main_content.get_attribute('innerHTML'))
     return soup
 
 
-def extract_text_and_images(soup: BeautifulSoup, translator: Any) -> Tuple[List[str], List[str], int]:
-    """본문 텍스트/이미지 추출 및 번역, 마크다운 리스트 반환
+def parse_blocks(soup: Any) -> Tuple[List[Block], int]:
+    """본문 텍스트/이미지를 블록 리스트로 추출 (번역 없음)
+    - soup는 BeautifulSoup 또는 lxml 요소 (html_parser 엔진에 따라 다름)
     - postfiles.pstatic.net 이미지만 허용
     - 이미지 그룹(div.se-section-imageGroup 등) 내부의 모든 img 처리
     """
-    content_parts = []
-    content_parts_en = []
+    blocks: List[Block] = []
     image_count = 1
     # 1. 일반 텍스트 및 단일 이미지
-    for component in soup.find_all('div', class_='se-component'):
-        classes = component.get('class', [])
+    for component in iter_components(soup):
+        classes = class_list(component)
         if 'se-text' in classes:
-            paragraphs = component.find_all('p', class_='se-text-paragraph')
+            paragraphs = find_all_by_class(component, 'p', 'se-text-paragraph')
             for p in paragraphs:
-                text = p.get_text().strip()
+                text = get_text(p).strip()
                 if text:
-                    content_parts.append(text + '\n\n')
-                    translated = translate_text(text, translator)
-                    content_parts_en.append(translated + '\n\n')
+                    blocks.append(TextBlock(text))
         # 단일 이미지(기존)
         elif 'se-image' in classes:
-            img = component.find('img', class_='se-image-resource')
-            if img:
+            img = find_by_class(component, 'img', 'se-image-resource')
+            if img is not None:
                 img_src = img.get('data-lazy-src') or img.get('src', '')
                 if img_src and 'postfiles.pstatic.net' in img_src:
-                    img_markdown = f'\n![pic{image_count}]({img_src})\n\n'
-                    content_parts.append(img_markdown)
-                    content_parts_en.append(img_markdown)
+                    blocks.append(ImageBlock(img_src, image_count))
                     image_count += 1
         # 이미지 그룹 처리
         elif ('se-section-imageGroup' in classes) or ('se-l-collage' in classes) or ('__se-component' in classes):
             # 그룹 내 모든 img 태그 순회
-            imgs = component.find_all('img')
+            imgs = find_all(component, 'img')
             for img in imgs:
                 img_src = img.get('data-lazy-src') or img.get('src', '')
                 if img_src and 'postfiles.pstatic.net' in img_src:
-                    img_markdown = f'\n![pic{image_count}]({img_src})\n\n'
-                    content_parts.append(img_markdown)
-                    content_parts_en.append(img_markdown)
+                    blocks.append(ImageBlock(img_src, image_count))
                     image_count += 1
+    return blocks, image_count
+
+
+def parse_text_and_images(soup: Any) -> Tuple[List[str], List[int], int]:
+    """parse_blocks 결과를 마크다운 리스트와 번역할 텍스트 문단의 위치(text_indices)로 반환"""
+    blocks, image_count = parse_blocks(soup)
+    content_parts = [block.markdown() for block in blocks]
+    text_indices = [idx for idx, block in enumerate(blocks) if type(block) is TextBlock]
+    return content_parts, text_indices, image_count
+
+
+def extract_text_and_images(soup: Any, translator: Any) -> Tuple[List[str], List[str], int]:
+    """본문 텍스트/이미지 추출 및 번역, 마크다운 리스트 반환
+    - 모든 문단을 모아 translate_texts로 묶음 번역한 뒤 원래 위치에 배치
+    """
+    content_parts, text_indices, image_count = parse_text_and_images(soup)
+    translated = translate_texts([content_parts[idx].strip() for idx in text_indices], translator)
+    content_parts_en = list(content_parts)
+    for idx, text in zip(text_indices, translated):
+        content_parts_en[idx] = text + '\n\n'
     return content_parts, content_parts_en, image_count
 
 
+def fetch_travel_courses(store_and_address: str) -> str:
+    """여행 코스 추천 (한국어 원문만 반환, 실패 시 빈 문자열)"""
+    # 공용 이벤트 루프/AsyncClient로 요청 (동시 요청 수는 'llm' 한도로 제한)
+    inc('perplexity_requests')
+    with timer('perplexity_request_seconds'):
+        travel_courses = add_travel_sync(store_and_address)
+    if travel_courses and not travel_courses.startswith('[ERROR]'):
+        inc('perplexity_response_chars', len(travel_courses))
+        return travel_courses
+    inc('perplexity_errors')
+    return ''
+
+
 def generate_travel_courses(store_and_address: str, translator: Any) -> Tuple[str, str]:
     """여행 코스 추천 및 번역"""
-    travel_courses = asyncio.run(add_travel(store_and_address))
-    if travel_courses and not travel_courses.startswith('[ERROR]'):
+    travel_courses = fetch_travel_courses(store_and_address)
+    if travel_courses:
         translated_courses = translate_text(travel_courses, translator)
         return travel_courses, translated_courses
     return '', ''
 
 
-def crawl_naver_blog(url: str, translator: Any) -> Dict[str, Any]:
+def _blog_id_from_url(url: str) -> Optional[str]:
+    try:
+        return parse_blog_url(url)[0]
+    except ValueError:
+        return None
+
+
+def fetch_post_page(driver: webdriver.Chrome, url: str) -> Tuple[str, str, Any]:
     """
-    네이버 블로그 크롤러 메인 함수. 각 역할별 함수 호출로 구성.
+    드라이버로 포스트를 열어 제목과 본문 soup 반환
+    본문이 나타날 때까지 한 번만 기다린 뒤, 같은 페이지 스냅샷에서 제목과 본문을 함께 추출합니다.
     """
-    driver = get_chrome_driver()
-    try:
+    profile = getattr(driver, 'browser_profile', None)
+    profile = profile if isinstance(profile, str) else 'unknown'
+    with timer('page_load_seconds', profile=profile):
         driver.get(url)
-        # iframe 전환
+    # iframe 전환
+    with timer('iframe_switch_seconds', profile=profile):
         iframe = WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.ID, "mainFrame"))
         )
         driver.switch_to.frame(iframe)
 
-        # 제목 추출 및 번역
-        title, safe_title = extract_blog_title(driver)
-        eng_title = translate_text(title + " korea hongdae", translator)
-
-        # 본문 파싱
-        soup = extract_main_content(driver)
-
-        # 텍스트/이미지 추출 및 번역
-        content_parts, content_parts_en, image_count = extract_text_and_images(soup, translator)
-        content_parts.insert(0, f"{title}\n\n")
-        content_parts_en.insert(0, f"{eng_title}\n\n")
-
-        # 매장/주소 추출
-        store_and_address = extract_store_and_address(content_parts)
-
-        print("주소 결과 값", store_and_address)
-        # 여행코스 추천 및 번역
-        travel_courses, translated_courses = generate_travel_courses(store_and_address, translator)
-        if travel_courses:
-            content_parts.append("\n# 여행 코스 추천\n\n")
-            content_parts.append(travel_courses + "\n\n")
-            content_parts_en.append("\n# Seoul Travel Guide Recommendation by Korean\n\n")
-            content_parts_en.append(translated_courses + "\n\n")
-
-        return {
-            "url": url,
-            "title": title,
-            "safe_title": safe_title,
-            "eng_title": eng_title,
-            "content_parts": content_parts,
-            "content_parts_en": content_parts_en,
-            "store_and_address": store_and_address,
-            "image_count": image_count,
-            "travel_courses": travel_courses,
-            "translated_travel_courses": translated_courses
-        }
-    finally:
-        driver.quit()
+    with timer('content_wait_seconds', profile=profile):
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CLASS_NAME, "se-main-container"))
+        )
+    html = driver.page_source
+
+    # 제목/본문 파싱
+    with timer('main_content_seconds', source='selenium'):
+        return extract_main_content_from_html(html, blog_id=_blog_id_from_url(url))
+
+
+def extract_main_content_from_html(html: str, blog_id: Optional[str] = None) -> Tuple[str, str, Any]:
+    """PostView HTML에서 제목과 본문(se-main-container) soup 반환"""
+    soup = parse_document(html, keep=POSTVIEW_KEEP)
+    main_content = find_by_class(soup, 'div', 'se-main-container')
+    if main_content is None:
+        raise ValueError("se-main-container를 찾을 수 없습니다.")
+    with timer('title_extract_seconds'):
+        title, safe_title = extract_blog_title_from_soup(soup, blog_id)
+    return title, safe_title, main_content
+
+
+def fetch_post_http(url: str) -> Tuple[str, str, Any]:
+    """브라우저 없이 PostView 문서를 받아 제목과 본문 soup 반환"""
+    with limit('fetch'), timer('http_fetch_seconds'):
+        html = fetch_postview_html(url)
+    inc('http_fetch_bytes', len(html.encode('utf-8')))
+    with timer('main_content_seconds', source='http'):
+        return extract_main_content_from_html(html, blog_id=_blog_id_from_url(url))
+
+
+def fetch_post(result: Dict[str, Any], driver_pool: Optional[DriverPool] = None,
+               fetch_mode: str = FETCH_MODE) -> Dict[str, Any]:
+    """
+    [수집 단계] result['url']의 제목과 본문 soup를 result에 추가
+    fetch_mode가 'http'/'auto'이면 PostView HTML을 직접 받아오고,
+    'auto'에서 실패하거나 'selenium'이면 브라우저로 읽습니다.
+    driver_pool이 주어지면 페이지를 읽는 동안만 풀에서 드라이버를 빌려 쓰고,
+    없으면 새 드라이버를 띄운 뒤 종료합니다.
+    """
+    url = result['url']
+    page = None
+    if fetch_mode in ('http', 'auto'):
+        try:
+            page = fetch_post_http(url)
+        except Exception as e:
+            if fetch_mode == 'http':
+                raise
+            inc('fetch_fallbacks')
+            print(f"[HTTP 수집 실패, Selenium으로 재시도] {url}: {e}")
+    if page is not None:
+        title, safe_title, soup = page
+    elif driver_pool is not None:
+        with limit('fetch'), driver_pool.borrow() as driver:
+            title, safe_title, soup = fetch_post_page(driver, url)
+    else:
+        with limit('fetch'):
+            # 풀 밖의 1회용 드라이버는 풀 드라이버와 캐시 디렉토리가 겹치지 않도록 디스크 캐시 없이 실행
+            driver = get_chrome_driver(cache_dir=None)
+            try:
+                title, safe_title, soup = fetch_post_page(driver, url)
+            finally:
+                driver.quit()
+
+    result.update({"title": title, "safe_title": safe_title, "soup": soup})
+    return result
+
+
+def fetch_or_resume(result: Dict[str, Any], driver_pool: Optional[DriverPool] = None,
+                    fetch_mode: str = FETCH_MODE) -> Dict[str, Any]:
+    """
+    [수집 단계] 지난 실행의 체크포인트가 있으면 복원하고, 파싱까지 끝낸 포스트면 수집을 건너뜀
+    (다음 단계들은 resume_at으로 감싸 끝난 단계를 건너뜀)
+    """
+    result = restore_checkpoint(result)
+    fetch = resume_at('parsed', lambda m: fetch_post(m, driver_pool=driver_pool, fetch_mode=fetch_mode), save=False)
+    return fetch(result)
+
+
+def parse_post(result: Dict[str, Any]) -> Dict[str, Any]:
+    """[파싱 단계] 본문 soup에서 텍스트/이미지 마크다운과 주소 추출 (번역 없음)"""
+    with timer('parse_seconds'):
+        blocks, image_count = parse_blocks(result.pop('soup'))
+    document = Document([HeadingBlock(result['title'], level=0)] + blocks)
+    content_parts = document.markdown()
+    # 다시 크롤링했을 때 바뀐 조각을 찾기 위한 지문 (여행코스가 붙기 전의 본문 기준)
+    result["part_hashes"] = part_hashes(content_parts)
+
+    # 매장/주소 추출
+    with timer('address_extract_seconds'):
+        store_address = extract_address(content_parts)
+    print("주소 결과 값", store_address)
+
+    result.update({
+        "document": document,
+        "image_count": image_count,
+        "store_address": store_address,
+        "store_and_address": str(store_address),
+    })
+    return result
+
+
+def enrich_post(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    [보강 단계] 주소 기반 여행코스 추천 (한국어)
+    같은 주소(또는 동)의 캐시가 있으면 LLM 호출 없이 원문/번역문을 재사용
+    """
+    cache = get_travel_cache()
+    key = normalize_address(result.get("store_address") or result["store_and_address"]) if cache is not None else None
+    if key:
+        cached = cache.get(key)
+        if cached:
+            inc('travel_cache_hits')
+            print(f"[여행코스 캐시 적중] {key}")
+            result["travel_courses"], translated = cached
+            if translated:
+                result["translated_travel_courses"] = translated
+            return result
+
+    result["travel_courses"] = fetch_travel_courses(result["store_and_address"])
+    if key and result["travel_courses"]:
+        cache.set(key, result["travel_courses"])
+        result["travel_cache_key"] = key
+    return result
+
+
+def translation_texts(result: Dict[str, Any]) -> List[str]:
+    """[번역 단계]에서 DeepL로 보낼 텍스트 (제목, 본문 문단, 아직 번역되지 않은 여행코스)"""
+    texts = [result["title"] + " korea hongdae"]
+    texts += [block.text for block in result["document"].text_blocks()]
+    # 캐시에서 번역문까지 가져온 여행코스는 다시 번역하지 않음
+    if result.get("travel_courses") and not result.get("translated_travel_courses"):
+        texts.append(result["travel_courses"])
+    return texts
+
+
+def estimate_post_cost(result: Dict[str, Any]) -> int:
+    """
+    파싱이 끝난 포스트를 번역할 때 청구될 글자 수 (번역 캐시 적중분 제외)
+    아직 보강 전이면 여행코스 번역량은 TRAVEL_ESTIMATE_CHARS로 추정
+    """
+    cost = estimate_translation_cost(translation_texts(result), known=result.get("known_translations"))
+    if "travel_courses" not in result:
+        cost += TRAVEL_ESTIMATE_CHARS
+    return cost
+
+
+def translate_post(result: Dict[str, Any], translator: Any) -> Dict[str, Any]:
+    """
+    [번역 단계] 제목, 본문 문단, 여행코스를 한 번에 묶음 번역하고 마크다운 완성
+    한도와 무관한 대체 백엔드가 없으면 예상 번역량을 먼저 예약하고, 남은 번역량이 모자라면 요청 전에 QuotaExceeded
+    (포스트는 다음 주기에 다시 처리)
+    result['known_translations']가 있으면 ({원문: 번역문}, 다시 크롤링한 포스트의 바뀌지 않은 문단) 번역하지 않음
+    대체 백엔드의 번역은 result['translations']와 여행코스 캐시에 남기지 않고 개수만 result['fallback_translated']에 기록
+    """
+    texts = translation_texts(result)
+    known = result.pop("known_translations", None)
+    if isinstance(translator, TranslatorRouter) and translator.has_unmetered_backend():
+        reservation = nullcontext()
+    else:
+        reservation = reserve_quota(estimate_translation_cost(texts, known=known))
+
+    document = result["document"]
+    paragraphs = document.text_blocks()
+    travel_courses = result.get("travel_courses", '')
+    translated_courses = result.get("translated_travel_courses", '')
+    translate_courses = bool(travel_courses) and not translated_courses
+
+    with reservation:
+        translated, fallback = translate_texts_detailed(texts, translator, known=known)
+    eng_title = translated[0]
+    if translate_courses:
+        translated_courses = translated[-1]
+        cache_key = result.pop("travel_cache_key", None) or normalize_address(result.get("store_address") or result.get("store_and_address", ''))
+        cache = get_travel_cache()
+        # 번역 실패로 원문이 그대로 돌아온 경우는 저장하지 않음
+        if (cache is not None and cache_key and translated_courses != travel_courses
+                and travel_courses not in fallback):
+            cache.set_translation(cache_key, translated_courses)
+
+    document.title.translation = eng_title
+    for block, text in zip(paragraphs, translated[1:len(paragraphs) + 1]):
+        block.translation = text
+
+    if travel_courses:
+        document.blocks.append(HeadingBlock("여행 코스 추천", "Seoul Travel Guide Recommendation by Korean"))
+        document.blocks.append(TextBlock(travel_courses, translated_courses))
+
+    result.update({
+        "eng_title": eng_title,
+        "translated_travel_courses": translated_courses,
+        "translations": {text: translation for text, translation in zip(texts, translated) if text not in fallback},
+        "fallback_translated": len(fallback),
+    })
+    return result
+
+
+def crawl_naver_blog(url: str, translator: Any, driver_pool: Optional[DriverPool] = None,
+                     fetch_mode: str = FETCH_MODE) -> Dict[str, Any]:
+    """
+    네이버 블로그 크롤러 메인 함수. 수집 → 파싱 → 보강 → 번역 단계를 차례로 실행.
+    지난 실행에서 실패한 포스트는 체크포인트에 기록된 단계 다음부터 처리합니다.
+    반환 dict는 단계 간에 전달되는 메시지와 같은 형태입니다.
+    """
+    result = fetch_or_resume({"url": url}, driver_pool=driver_pool, fetch_mode=fetch_mode)
+    result = resume_at('parsed', parse_post)(result)
+    result = resume_at('enriched', enrich_post)(result)
+    return resume_at('translated', lambda m: translate_post(m, translator))(result)
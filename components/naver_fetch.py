@@ -0,0 +1,70 @@
+import re
+import threading
+from typing import Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+
+POSTVIEW_URL = "https://blog.naver.com/PostView.naver"
+HTTP_TIMEOUT = 10.0
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36"
+    ),
+    "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+    "Referer": "https://blog.naver.com/",
+}
+
+_PATH_PATTERN = re.compile(r'^/([A-Za-z0-9_-]+)/(\d+)')
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def parse_blog_url(url: str) -> Tuple[str, str]:
+    """
+    네이버 블로그 URL에서 (blogId, logNo) 추출
+    지원 형식:
+    - https://blog.naver.com/{blogId}/{logNo}?fromRss=true...
+    - https://m.blog.naver.com/{blogId}/{logNo}
+    - https://blog.naver.com/PostView.naver?blogId=...&logNo=...
+    """
+    parsed = urlparse(url)
+    query = parse_qs(parsed.query)
+    if 'blogId' in query and 'logNo' in query:
+        return query['blogId'][0], query['logNo'][0]
+    m = _PATH_PATTERN.match(parsed.path)
+    if m:
+        return m.group(1), m.group(2)
+    raise ValueError(f"blogId/logNo를 찾을 수 없는 URL입니다: {url}")
+
+
+def build_postview_url(blog_id: str, log_no: str) -> str:
+    """mainFrame iframe이 가리키는 PostView 주소 생성"""
+    return f"{POSTVIEW_URL}?blogId={blog_id}&logNo={log_no}&redirect=Dlog&widgetTypeCall=true&directAccess=false"
+
+
+def get_http_client() -> httpx.Client:
+    """커넥션을 재사용하는 공용 httpx 클라이언트"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(headers=HEADERS, timeout=HTTP_TIMEOUT, follow_redirects=True)
+        return _client
+
+
+def fetch_postview_html(url: str, client: Optional[httpx.Client] = None) -> str:
+    """블로그 URL의 PostView(iframe 본문) HTML을 브라우저 없이 가져옴"""
+    blog_id, log_no = parse_blog_url(url)
+    response = (client or get_http_client()).get(build_postview_url(blog_id, log_no))
+    response.raise_for_status()
+    return response.text
+
+
+def close_http_client() -> None:
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
@@ -1,19 +1,17 @@
 import feedparser
-import json
 import os
 from bs4 import BeautifulSoup
+from components.post_store import PostStore, get_post_store
 
-def load_processed_posts():
-    """처리된 포스트 목록 불러오기"""
-    if os.path.exists('processed_posts.json'):
-        with open('processed_posts.json', 'r', encoding='utf-8') as f:
-            return set(json.load(f))
-    return set()
+def load_processed_posts(store: PostStore = None):
+    """처리된 포스트 확인용 저장소 불러오기 (post_url in store 대신 store.is_processed 사용)"""
+    return store or get_post_store()
 
-def save_processed_posts(posts):
-    """처리된 포스트 목록 저장하기"""
-    with open('processed_posts.json', 'w', encoding='utf-8') as f:
-        json.dump(list(posts), f, ensure_ascii=False, indent=2)
+def save_processed_posts(posts, store: PostStore = None):
+    """처리된 포스트 URL들을 완료 상태로 기록 (해당 행만 갱신)"""
+    store = store or get_post_store()
+    for url in posts:
+        store.mark_processed(url)
 
 def extract_image_from_description(description: str) -> str:
     """Extract the first image URL from HTML description using BeautifulSoup"""
@@ -29,26 +27,38 @@ def extract_image_from_description(description: str) -> str:
         print(f"이미지 추출 중 오류 발생: {e}")
     return None
 
-def check_new_posts(category):
-    """새로운 포스트 확인"""
-    # 기존에 처리한 포스트 불러오기
-    processed_posts = load_processed_posts()
-    new_posts = []
+def check_new_posts(category, store: PostStore = None):
+    """
+    새로운 포스트 확인
+    - ETag/Last-Modified 조건부 요청으로 피드가 바뀌지 않았으면(304) 파싱 생략
+    - 새로 발견한 포스트는 저장소에 대기(pending) 상태로 기록
+    - 이전 실행에서 처리하지 못한 대기 포스트까지 함께 반환
+    """
+    store = load_processed_posts(store)
     
     # 네이버 RSS 피드 파싱
     feed_url = os.getenv('RSS_URL')
     print(f"RSS 피드 확인 중: {feed_url}")
     
     try:
-        feed = feedparser.parse(feed_url)
-        print(f"총 {len(feed.entries)}개의 포스트를 찾았습니다.")
+        etag, modified = store.get_feed_state(feed_url)
+        feed = feedparser.parse(feed_url, etag=etag, modified=modified)
+        if getattr(feed, 'status', None) == 304:
+            print("RSS 피드 변경 없음 (304), 파싱을 건너뜁니다.")
+            entries = []
+        else:
+            entries = feed.entries
+            print(f"총 {len(entries)}개의 포스트를 찾았습니다.")
+            if entries:
+                store.set_feed_state(feed_url, feed.get('etag'), feed.get('modified'))
         
-        for entry in feed.entries:
+        discovered = 0
+        for entry in entries:
             # 원하는 카테고리인지 확인
             if any(category in tag.term for tag in entry.get('tags', [])):
                 post_url = entry.link
                 
-                if post_url not in processed_posts:
+                if not store.is_processed(post_url):
                     # Extract image URL using BeautifulSoup
                     image_url = extract_image_from_description(entry.get('description', ''))
                     
@@ -60,14 +70,13 @@ def check_new_posts(category):
                         'image_url': image_url,  # Extract first image URL from description
                         'tags': entry.get('tags', [{'term': ''}])[0].term.split(',')
                     }
-                    new_posts.append(post_info)
-                    print(f"새 포스트 발견: {entry.title}")
+                    if store.add_pending(post_info):
+                        discovered += 1
+                        print(f"새 포스트 발견: {entry.title}")
         
-        # 새 포스트가 있으면 저장
+        new_posts = store.pending_posts()
         if new_posts:
-            new_urls = {post['url'] for post in new_posts}
-            save_processed_posts(processed_posts.union(new_urls))
-            print(f"총 {len(new_posts)}개의 새 포스트를 저장했습니다.")
+            print(f"새로 발견 {discovered}개, 처리 대기 총 {len(new_posts)}개")
         else:
             print("새로운 포스트가 없습니다.")
             
@@ -0,0 +1,174 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from components.default_store import DefaultStore, is_off
+from components.post_store import post_key
+
+MANIFEST_PATH = os.getenv('OUTPUT_MANIFEST_PATH', 'manifest.jsonl')
+
+
+def _current_umask() -> int:
+    # umask는 바꾸지 않고는 읽을 수 없으므로 (스레드가 뜨기 전) 불러올 때 한 번만 읽음
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+_UMASK = _current_umask()
+
+
+def _fsync_dir(directory: str) -> None:
+    """rename 결과가 디스크에 남도록 디렉토리도 fsync (지원하지 않는 OS에서는 건너뜀)"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _file_mode(path: str) -> int:
+    """기존 파일이 있으면 그 권한, 없으면 open()으로 만들 때와 같은 권한 (0o666 & ~umask)"""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def atomic_write(path: str, data: Union[str, bytes], encoding: str = 'utf-8') -> int:
+    """
+    같은 디렉토리의 임시 파일에 쓰고 fsync한 뒤 rename (중간에 죽어도 이전 파일 또는 완성된 파일만 남음)
+    mkstemp는 0600으로 만들므로 rename 전에 일반 open()과 같은 권한으로 맞춤
+    :return: 쓴 바이트 수
+    """
+    payload = data.encode(encoding) if isinstance(data, str) else data
+    directory = os.path.dirname(path) or '.'
+    mode = _file_mode(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        os.fchmod(fd, mode)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    _fsync_dir(directory)
+    return len(payload)
+
+
+def content_hash(data: Union[str, bytes]) -> str:
+    return hashlib.sha256(data.encode('utf-8') if isinstance(data, str) else data).hexdigest()
+
+
+class OutputManifest:
+    """
+    저장한 포스트 목록 (JSON Lines, 추가만 함).
+    포스트를 저장할 때마다 한 줄씩 fsync해 기록하므로 실행이 중간에 끝나도 그때까지의 기록은 남습니다.
+    한 줄: {'log_no', 'kor_url', 'status'('written'/'uploaded'), 'kor_path', 'eng_path', 'meta_path',
+           'kor_hash', 'eng_hash', 'meta', 'time'}
+    같은 포스트가 여러 번 나오면 마지막 줄이 현재 상태입니다.
+    """
+
+    def __init__(self, path: str = MANIFEST_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._latest: Optional[Dict[str, Dict[str, Any]]] = None  # previous()에서 처음 읽은 뒤 append로 갱신
+
+    def append(self, entries: Iterable[Dict[str, Any]]) -> int:
+        entries = list(entries)
+        lines = [json.dumps(entry, ensure_ascii=False) + '\n' for entry in entries]
+        if not lines:
+            return 0
+        with self._lock, open(self.path, 'a', encoding='utf-8') as f:
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+            if self._latest is not None:
+                self._latest.update((entry['log_no'], entry) for entry in entries)
+        return len(lines)
+
+    def previous(self, url: str) -> Optional[Dict[str, Any]]:
+        """포스트의 마지막 기록 (포스트마다 파일 전체를 읽지 않도록 처음 한 번만 읽고 메모리에서 갱신)"""
+        with self._lock:
+            if self._latest is None:
+                self._latest = self.latest()
+            return self._latest.get(post_key(url))
+
+    def record_written(self, url: str, paths: Dict[str, str], hashes: Dict[str, str],
+                       meta: Dict[str, Any]) -> Dict[str, Any]:
+        entry = {
+            'log_no': post_key(url), 'kor_url': url, 'status': 'written',
+            'kor_path': paths['kor_path'], 'eng_path': paths['eng_path'], 'meta_path': paths['meta_path'],
+            'kor_hash': hashes['kor'], 'eng_hash': hashes['eng'], 'meta': meta, 'time': time.time(),
+        }
+        self.append([entry])
+        return entry
+
+    def entries(self) -> Iterator[Dict[str, Any]]:
+        """기록 순서대로 반환 (쓰다가 끊긴 마지막 줄은 건너뜀)"""
+        try:
+            f = open(self.path, 'r', encoding='utf-8')
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    print(f"[매니페스트] 손상된 줄 건너뜀: {line[:80]!r}")
+
+    def latest(self) -> Dict[str, Dict[str, Any]]:
+        """{log_no: 마지막 기록}"""
+        return {entry['log_no']: entry for entry in self.entries()}
+
+
+def remove_replaced_outputs(previous: Optional[Dict[str, Any]], paths: Dict[str, str]) -> List[str]:
+    """
+    제목이 바뀌어 새 이름으로 저장한 포스트의 이전 kor/eng/메타 파일 삭제
+    (남겨 두면 같은 kor_url의 파일이 두 벌이 되어 업로드할 때마다 서로 덮어씀)
+    :return: 지운 경로 목록
+    """
+    if not previous:
+        return []
+    current = {os.path.abspath(path) for path in paths.values()}
+    removed = []
+    for key in ('kor_path', 'eng_path', 'meta_path'):
+        path = previous.get(key)
+        if not path or os.path.abspath(path) in current:
+            continue
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            continue
+        removed.append(path)
+    if removed:
+        print(f"[이전 파일 삭제] {', '.join(removed)}")
+    return removed
+
+
+_default_manifest: DefaultStore[OutputManifest] = DefaultStore(OutputManifest, disabled=is_off(MANIFEST_PATH))
+
+
+def get_output_manifest() -> Optional[OutputManifest]:
+    """기본 매니페스트 반환 (OUTPUT_MANIFEST_PATH=off이면 None)"""
+    return _default_manifest.get()
+
+
+def set_output_manifest(manifest: Optional[OutputManifest]) -> None:
+    """기본 매니페스트 교체 (None이면 다음 호출 때 기본 매니페스트를 다시 만듦)"""
+    _default_manifest.set(manifest)
@@ -0,0 +1,152 @@
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+from components.metrics import get_metrics
+
+_DONE = object()  # 단계 종료 신호
+
+
+class Stage:
+    """
+    파이프라인의 한 단계.
+    func(message) -> message 를 workers개 스레드로 실행합니다.
+    """
+
+    def __init__(self, name: str, func: Callable[[Dict[str, Any]], Dict[str, Any]], workers: int = 1):
+        self.name = name
+        self.func = func
+        self.workers = max(1, workers)
+        self.processed = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.max_seconds = 0.0
+        self.wait_seconds = 0.0  # 다음 단계 큐가 가득 차서 대기한 시간 (backpressure)
+        self._lock = threading.Lock()
+
+    def record(self, elapsed: float, failed: bool) -> None:
+        with self._lock:
+            self.processed += 1
+            self.busy_seconds += elapsed
+            self.max_seconds = max(self.max_seconds, elapsed)
+            if failed:
+                self.errors += 1
+
+    def record_wait(self, elapsed: float) -> None:
+        with self._lock:
+            self.wait_seconds += elapsed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'stage': self.name,
+                'workers': self.workers,
+                'processed': self.processed,
+                'errors': self.errors,
+                'busy_seconds': round(self.busy_seconds, 3),
+                'avg_seconds': round(self.busy_seconds / self.processed, 3) if self.processed else 0.0,
+                'max_seconds': round(self.max_seconds, 3),
+                'blocked_seconds': round(self.wait_seconds, 3),
+            }
+
+
+class Pipeline:
+    """
+    단계(Stage)들을 크기 제한 큐로 연결한 스트리밍 파이프라인.
+
+    - 각 단계는 자기 스레드에서 독립적으로 돌아가므로 느린 단계가 다른 단계를 막지 않음
+    - 큐가 가득 차면 앞 단계가 대기 (backpressure)
+    - 예외가 난 메시지는 'error', 'failed_stage'가 기록된 채 남은 단계를 건너뛰고 출력됨
+    - 메시지에 'metrics'(PostMetrics)가 있으면 단계 실행 중 측정값을 그 포스트에도 기록
+    """
+
+    def __init__(self, stages: List[Stage], queue_size: int = 4):
+        self.stages = stages
+        self.queue_size = queue_size
+
+    def run(self, messages: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """messages를 흘려보내고 마지막 단계를 통과한 메시지를 완료 순서대로 반환"""
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+        threads = []
+
+        feeder = threading.Thread(target=self._feed, args=(messages, queues[0]), daemon=True)
+        threads.append(feeder)
+        for idx, stage in enumerate(self.stages):
+            remaining = [stage.workers]
+            lock = threading.Lock()
+            next_workers = self.stages[idx + 1].workers if idx + 1 < len(self.stages) else 1
+            for _ in range(stage.workers):
+                threads.append(threading.Thread(
+                    target=self._work,
+                    args=(stage, queues[idx], queues[idx + 1], remaining, lock, next_workers),
+                    name=f"pipeline-{stage.name}",
+                    daemon=True
+                ))
+
+        for thread in threads:
+            thread.start()
+
+        output = queues[-1]
+        while True:
+            message = output.get()
+            if message is _DONE:
+                break
+            yield message
+
+        for thread in threads:
+            thread.join()
+
+    def _feed(self, messages: Iterable[Dict[str, Any]], out_queue: queue.Queue) -> None:
+        try:
+            for message in messages:
+                out_queue.put(message)
+        finally:
+            for _ in range(self.stages[0].workers):
+                out_queue.put(_DONE)
+
+    def _work(self, stage: Stage, in_queue: queue.Queue, out_queue: queue.Queue,
+              remaining: List[int], lock: threading.Lock, next_workers: int) -> None:
+        metrics = get_metrics()
+        while True:
+            message = in_queue.get()
+            if message is _DONE:
+                break
+            with metrics.activate(message.get('metrics')):
+                if 'error' not in message:
+                    started = time.perf_counter()
+                    failed = False
+                    try:
+                        message = stage.func(message)
+                    except Exception as e:
+                        message['error'] = e
+                        message['failed_stage'] = stage.name
+                        failed = True
+                    elapsed = time.perf_counter() - started
+                    stage.record(elapsed, failed=failed)
+                    metrics.observe('stage_seconds', elapsed, stage=stage.name)
+                started = time.perf_counter()
+                out_queue.put(message)
+                waited = time.perf_counter() - started
+                stage.record_wait(waited)
+                metrics.observe('stage_blocked_seconds', waited, stage=stage.name)
+
+        # 이 단계의 마지막 워커가 다음 단계에 종료 신호 전달
+        with lock:
+            remaining[0] -= 1
+            last = remaining[0] == 0
+        if last:
+            for _ in range(next_workers):
+                out_queue.put(_DONE)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        return [stage.stats() for stage in self.stages]
+
+    def print_stats(self) -> None:
+        print("\n=== 파이프라인 단계별 통계 ===")
+        for stat in self.stats():
+            print(
+                f"[{stat['stage']}] workers={stat['workers']} 처리={stat['processed']} 실패={stat['errors']} "
+                f"평균={stat['avg_seconds']}s 최대={stat['max_seconds']}s "
+                f"누적={stat['busy_seconds']}s 대기={stat['blocked_seconds']}s"
+            )
@@ -0,0 +1,198 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from components.default_store import DefaultStore
+from components.naver_fetch import parse_blog_url
+
+STORE_PATH = os.getenv('PROCESSED_STORE_PATH', 'processed_posts.sqlite3')
+LEGACY_JSON_PATH = 'processed_posts.json'
+
+
+def post_key(url: str) -> str:
+    """포스트 식별 키 (logNo, URL에서 찾지 못하면 URL 그대로)"""
+    try:
+        return parse_blog_url(url)[1]
+    except ValueError:
+        return url
+
+
+class PostStore:
+    """
+    처리 상태 저장소 (SQLite, logNo 기준 인덱스).
+
+    - posts: 발견된 포스트와 상태('pending' / 'done')
+    - feed_state: RSS 조건부 요청용 ETag / Last-Modified
+    - uploads: Supabase에 마지막으로 올린 행의 내용 해시 (바뀐 포스트만 다시 업로드)
+    처리 완료 표시는 행 단위 갱신이라 파일 전체를 다시 쓰지 않습니다.
+    """
+
+    def __init__(self, path: str = STORE_PATH, legacy_json_path: Optional[str] = LEGACY_JSON_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS posts ("
+            " log_no TEXT PRIMARY KEY,"
+            " url TEXT NOT NULL,"
+            " title TEXT,"
+            " status TEXT NOT NULL,"
+            " info TEXT,"
+            " updated_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_status ON posts(status)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS feed_state ("
+            " feed_url TEXT PRIMARY KEY,"
+            " etag TEXT,"
+            " modified TEXT,"
+            " checked_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS uploads ("
+            " log_no TEXT PRIMARY KEY,"
+            " kor_url TEXT NOT NULL,"
+            " content_hash TEXT NOT NULL,"
+            " uploaded_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+        if legacy_json_path and os.path.exists(legacy_json_path) and self.count() == 0:
+            self.import_legacy_json(legacy_json_path)
+
+    def import_legacy_json(self, json_path: str) -> int:
+        """기존 processed_posts.json(URL 목록 또는 이전 버전 메타 목록)을 가져옴"""
+        try:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except json.JSONDecodeError:
+            print(f"Warning: {json_path} is empty or malformed. Skipping import.")
+            return 0
+        urls = []
+        if isinstance(data, list):
+            for item in data:
+                if isinstance(item, str):
+                    urls.append(item)
+                elif isinstance(item, dict) and 'kor_url' in item:
+                    urls.append(item['kor_url'])
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO posts (log_no, url, status, updated_at) VALUES (?, ?, 'done', ?)",
+                [(post_key(url), url, now) for url in urls]
+            )
+            self._conn.commit()
+        print(f"{json_path}에서 처리된 URL {len(urls)}개를 가져왔습니다.")
+        return len(urls)
+
+    def count(self, status: Optional[str] = None) -> int:
+        with self._lock:
+            if status is None:
+                return self._conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+            return self._conn.execute("SELECT COUNT(*) FROM posts WHERE status = ?", (status,)).fetchone()[0]
+
+    def is_processed(self, url: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT status FROM posts WHERE log_no = ?", (post_key(url),)).fetchone()
+        return row is not None and row[0] == 'done'
+
+    def add_pending(self, post: Dict[str, Any]) -> bool:
+        """새로 발견한 포스트를 대기 상태로 추가 (이미 있으면 무시), 추가 여부 반환"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO posts (log_no, url, title, status, info, updated_at) "
+                "VALUES (?, ?, ?, 'pending', ?, ?)",
+                (post_key(post['url']), post['url'], post.get('title'),
+                 json.dumps(post, ensure_ascii=False), time.time())
+            )
+            self._conn.commit()
+            return cursor.rowcount > 0
+
+    def mark_processed(self, url: str, title: Optional[str] = None) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO posts (log_no, url, title, status, updated_at) VALUES (?, ?, ?, 'done', ?) "
+                "ON CONFLICT(log_no) DO UPDATE SET status = 'done', updated_at = excluded.updated_at, "
+                "title = COALESCE(excluded.title, posts.title)",
+                (post_key(url), url, title, time.time())
+            )
+            self._conn.commit()
+
+    def pending_posts(self) -> List[Dict[str, Any]]:
+        """아직 처리되지 않은 포스트 정보 목록 (발견 순)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT url, title, info FROM posts WHERE status = 'pending' ORDER BY updated_at"
+            ).fetchall()
+        posts = []
+        for url, title, info in rows:
+            post = json.loads(info) if info else {'url': url, 'title': title}
+            posts.append(post)
+        return posts
+
+    def processed_posts(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """처리 완료된 포스트 목록 (가장 오래전에 처리/확인한 것부터, 발견할 때 저장한 RSS 정보 포함)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT url, title, info FROM posts WHERE status = 'done' ORDER BY updated_at LIMIT ?",
+                (-1 if limit is None else limit,)
+            ).fetchall()
+        posts = []
+        for url, title, info in rows:
+            post = json.loads(info) if info else {'url': url}
+            post.setdefault('title', title or url)
+            posts.append(post)
+        return posts
+
+    def sample_urls(self, limit: int = 5) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT url FROM posts WHERE status = 'done' ORDER BY updated_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def get_feed_state(self, feed_url: str) -> Tuple[Optional[str], Optional[str]]:
+        """(etag, modified) 반환"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, modified FROM feed_state WHERE feed_url = ?", (feed_url,)
+            ).fetchone()
+        return (row[0], row[1]) if row else (None, None)
+
+    def set_feed_state(self, feed_url: str, etag: Optional[str], modified: Optional[str]) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO feed_state VALUES (?, ?, ?, ?)",
+                (feed_url, etag, modified, time.time())
+            )
+            self._conn.commit()
+
+    def upload_hashes(self) -> Dict[str, str]:
+        """{post_key: 마지막으로 업로드한 행의 해시}"""
+        with self._lock:
+            rows = self._conn.execute("SELECT log_no, content_hash FROM uploads").fetchall()
+        return dict(rows)
+
+    def mark_uploaded(self, uploads: Iterable[Tuple[str, str]]) -> None:
+        """(kor_url, 해시) 목록을 업로드 완료로 기록 (한 트랜잭션)"""
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO uploads VALUES (?, ?, ?, ?)",
+                [(post_key(url), url, content_hash, now) for url, content_hash in uploads]
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_default_store: DefaultStore[PostStore] = DefaultStore(PostStore)
+
+
+def get_post_store() -> PostStore:
+    """기본 처리 상태 저장소"""
+    return _default_store.get()
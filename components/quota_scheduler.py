@@ -0,0 +1,63 @@
+import os
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from components.translation_cache import get_translation_cache
+from components.translation_counter import get_remaining_chars
+
+# 남은 번역량 중 예산에서 빼 둘 여유분 (추정 오차, 다른 작업의 번역 대비)
+QUOTA_RESERVE_CHARS = int(os.getenv('QUOTA_RESERVE_CHARS', '0'))
+# 보강(여행코스) 전에 계획할 때 포스트마다 더해 둘 여행코스 번역량 추정치
+TRAVEL_ESTIMATE_CHARS = int(os.getenv('TRAVEL_ESTIMATE_CHARS', '1500'))
+
+
+def count_characters(text_list: List[str]) -> int:
+    """마크다운 텍스트 리스트의 총 글자 수를 계산합니다."""
+    return sum(len(text.strip()) for text in text_list
+              if not text.strip().startswith('!['))
+
+
+def estimate_translation_cost(texts: Iterable[str], target_lang: str = "EN-US",
+                              known: Optional[Dict[str, str]] = None) -> int:
+    """
+    texts를 translate_texts로 번역할 때 DeepL에 청구될 글자 수.
+    translate_texts와 같은 규칙으로 빈 텍스트, 중복 텍스트, known에 있는 텍스트,
+    번역 캐시 적중분은 제외합니다.
+    """
+    unique = [text for text in dict.fromkeys(texts) if text.strip() and not (known and text in known)]
+    cache = get_translation_cache()
+    if cache is not None and unique:
+        cached = cache.get_many(unique, target_lang, record_stats=False)
+        unique = [text for text in unique if text not in cached]
+    return sum(len(text) for text in unique)
+
+
+def translation_budget(reserve: int = QUOTA_RESERVE_CHARS) -> int:
+    """이번 달 남은 번역량에서 여유분을 뺀 예산"""
+    return max(0, get_remaining_chars() - reserve)
+
+
+def plan_by_budget(items: Sequence[Any], costs: Sequence[int],
+                   budget: int) -> Tuple[List[Any], List[Any]]:
+    """
+    예산 안에서 끝낼 수 있는 포스트 수가 가장 많도록 (선택, 연기) 목록으로 나눔.
+    포스트마다 가치가 같으므로 비용이 작은 것부터 채우는 것이 최적입니다.
+    두 목록 모두 원래 순서(보통 발행 순서)를 유지합니다.
+    """
+    chosen = set()
+    spent = 0
+    for idx in sorted(range(len(items)), key=lambda i: costs[i]):
+        if spent + costs[idx] > budget:
+            break
+        chosen.add(idx)
+        spent += costs[idx]
+    selected = [item for idx, item in enumerate(items) if idx in chosen]
+    deferred = [item for idx, item in enumerate(items) if idx not in chosen]
+    return selected, deferred
+
+
+def print_plan(costs: Sequence[int], selected_costs: Sequence[int], budget: int) -> None:
+    print("\n=== 번역 예산 계획 ===")
+    print(f"예산: {budget:,}자 / 예상 총 번역량: {sum(costs):,}자")
+    print(f"이번 주기 처리: {len(selected_costs)}개 ({sum(selected_costs):,}자)")
+    if len(selected_costs) < len(costs):
+        print(f"다음 주기로 연기: {len(costs) - len(selected_costs)}개")
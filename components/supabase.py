@@ -1,18 +1,132 @@
 import os
-from supabase import create_client, Client
-
+import threading
+from typing import Any, Dict, List, Optional
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
-url: str = os.getenv("SUPABASE_URL")
-key: str = os.getenv("SUPABASE_KEY")
+# 'remote': Supabase 프로젝트(SUPABASE_URL/SUPABASE_KEY), 'memory': 프로세스 안의 임시 저장소 (테스트/벤치마크용)
+SUPABASE_BACKEND = os.getenv('SUPABASE_BACKEND', 'remote')
+
+_client: Optional[Any] = None
+_client_lock = threading.Lock()
+
+
+class MemoryResponse:
+    def __init__(self, data: List[Dict[str, Any]]):
+        self.data = data
+
+
+class MemoryQuery:
+    """execute()만 지원하는 최소한의 요청 객체"""
+
+    def __init__(self, run):
+        self._run = run
+
+    def execute(self) -> MemoryResponse:
+        return MemoryResponse(self._run())
+
 
-if not url or not key:
-    raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in environment variables")
+class MemoryTable:
+    def __init__(self, client: 'MemoryClient', name: str):
+        self._client = client
+        self._name = name
+
+    def _rows(self) -> List[Dict[str, Any]]:
+        return self._client.tables.setdefault(self._name, [])
+
+    def insert(self, data: Any) -> MemoryQuery:
+        rows = data if isinstance(data, list) else [data]
+
+        def run() -> List[Dict[str, Any]]:
+            with self._client.lock:
+                inserted = [dict(row) for row in rows]
+                self._rows().extend(inserted)
+                self._client.requests += 1
+                return inserted
+        return MemoryQuery(run)
+
+    def upsert(self, data: Any, on_conflict: str = '', **kwargs: Any) -> MemoryQuery:
+        rows = data if isinstance(data, list) else [data]
+
+        def run() -> List[Dict[str, Any]]:
+            with self._client.lock:
+                table = self._rows()
+                conflicts = [column for column in on_conflict.split(',') if column]
+                if conflicts and len({tuple(row.get(column) for column in conflicts) for row in rows}) < len(rows):
+                    # PostgreSQL과 같이 한 요청 안에서 같은 행을 두 번 갱신하면 실패
+                    raise ValueError("ON CONFLICT DO UPDATE command cannot affect row a second time")
+                index = {tuple(item.get(column) for column in conflicts): item for item in table} if conflicts else {}
+                upserted = []
+                for row in rows:
+                    existing = index.get(tuple(row.get(column) for column in conflicts)) if conflicts else None
+                    if existing is not None:
+                        existing.update(row)
+                        upserted.append(existing)
+                    else:
+                        table.append(dict(row))
+                        upserted.append(table[-1])
+                self._client.requests += 1
+                return upserted
+        return MemoryQuery(run)
+
+    def select(self, *columns: str) -> MemoryQuery:
+        def run() -> List[Dict[str, Any]]:
+            with self._client.lock:
+                return [dict(row) for row in self._rows()]
+        return MemoryQuery(run)
+
+
+class MemoryClient:
+    """
+    Supabase 클라이언트 대신 쓰는 프로세스 내 저장소.
+    table().insert/upsert/select().execute()만 흉내 내며, 요청 수를 requests에 셉니다.
+    """
+
+    def __init__(self):
+        self.tables: Dict[str, List[Dict[str, Any]]] = {}
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def table(self, name: str) -> MemoryTable:
+        return MemoryTable(self, name)
+
+
+def create_supabase_client(backend: Optional[str] = None) -> Any:
+    backend = backend or SUPABASE_BACKEND
+    if backend == 'memory':
+        return MemoryClient()
+    if backend != 'remote':
+        raise ValueError(f"알 수 없는 SUPABASE_BACKEND입니다: {backend} (가능: remote, memory)")
+
+    url = os.getenv("SUPABASE_URL")
+    key = os.getenv("SUPABASE_KEY")
+    if not url or not key:
+        raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in environment variables")
+    # supabase 패키지는 불러오는 데만 시간이 걸리므로 처음 업로드할 때 import
+    from supabase import create_client
+    return create_client(url, key)
+
+
+def get_client() -> Any:
+    """
+    공용 Supabase 클라이언트 (처음 호출할 때 생성하고 이후 재사용)
+    크롤링만 하는 실행에서는 호출되지 않으므로 네트워크/환경 변수 설정이 필요 없습니다.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = create_supabase_client()
+        return _client
+
+
+def set_client(client: Optional[Any]) -> None:
+    """공용 클라이언트 교체 (None이면 다음 get_client() 호출 때 다시 생성)"""
+    global _client
+    with _client_lock:
+        _client = client
 
-supabase: Client = create_client(url, key)
 
 def insert_eng_post(data: dict) -> dict:
     """
@@ -28,7 +142,14 @@ def insert_eng_post(data: dict) -> dict:
     :return: Supabase 응답(dict)
     """
     # tags 컬럼이 JSONB라면 그대로, 문자열이면 ','.join(tags)로 변환 필요
-    response = supabase.table("eng_posts").insert(data).execute()
+    response = get_client().table("eng_posts").insert(data).execute()
     if hasattr(response, 'data'):
         return response.data
-    return response
\ No newline at end of file
+    return response
+
+def upsert_eng_posts(rows: List[dict]) -> None:
+    """
+    eng_posts 테이블에 여러 행을 한 번의 요청으로 upsert (kor_url 기준)
+    eng_posts.kor_url에 UNIQUE 제약이 있어야 합니다.
+    """
+    get_client().table("eng_posts").upsert(rows, on_conflict="kor_url", returning='minimal').execute()
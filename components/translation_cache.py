@@ -0,0 +1,171 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from components.default_store import DefaultStore
+
+CACHE_PATH = os.getenv('TRANSLATION_CACHE_PATH', 'translation_cache.sqlite3')
+MAX_DB_BYTES = 64 * 1024 * 1024  # 디스크 캐시 최대 크기 (번역문 기준)
+MEMORY_ENTRIES = 4096            # 메모리 LRU 항목 수
+
+
+def make_cache_key(text: str, target_lang: str) -> str:
+    """(원문, 대상 언어) 조합의 sha256 키"""
+    return hashlib.sha256(f"{target_lang}\0{text}".encode('utf-8')).hexdigest()
+
+
+class TranslationCache:
+    """
+    번역 결과 캐시. 메모리 LRU 앞단 + SQLite 영구 저장소로 구성됩니다.
+
+    - 키: make_cache_key(원문, target_lang)
+    - 디스크 사용량이 max_bytes를 넘으면 가장 오래 사용되지 않은 항목부터 삭제
+    - hits / misses 카운터 제공
+    """
+
+    def __init__(self, path: str = CACHE_PATH, max_bytes: int = MAX_DB_BYTES,
+                 memory_entries: int = MEMORY_ENTRIES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            " key TEXT PRIMARY KEY,"
+            " target_lang TEXT NOT NULL,"
+            " translation TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_translations_last_used ON translations(last_used)")
+        self._conn.commit()
+        self._db_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM translations").fetchone()[0]
+
+    def _remember(self, key: str, translation: str) -> None:
+        self._memory[key] = translation
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get_many(self, texts: Iterable[str], target_lang: str, record_stats: bool = True) -> Dict[str, str]:
+        """캐시에 있는 번역만 {원문: 번역문} 형태로 반환 (record_stats=False면 적중 통계에서 제외)"""
+        found = {}
+        with self._lock:
+            missing = {}
+            for text in dict.fromkeys(texts):
+                key = make_cache_key(text, target_lang)
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    found[text] = self._memory[key]
+                else:
+                    missing[key] = text
+
+            keys = list(missing)
+            now = time.time()
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, translation FROM translations WHERE key IN ({','.join('?' * len(batch))})", batch
+                ).fetchall()
+                for key, translation in rows:
+                    found[missing.pop(key)] = translation
+                    self._remember(key, translation)
+                if rows:
+                    self._conn.executemany(
+                        "UPDATE translations SET last_used = ? WHERE key = ?",
+                        [(now, key) for key, _ in rows]
+                    )
+            if keys:
+                self._conn.commit()
+
+            if record_stats:
+                self.hits += len(found)
+                self.misses += len(missing)
+        return found
+
+    def get(self, text: str, target_lang: str) -> Optional[str]:
+        return self.get_many([text], target_lang).get(text)
+
+    def set_many(self, pairs: Iterable[Tuple[str, str]], target_lang: str) -> None:
+        """(원문, 번역문) 쌍을 저장하고 필요하면 오래된 항목을 제거"""
+        now = time.time()
+        with self._lock:
+            rows = {}
+            for text, translation in pairs:
+                key = make_cache_key(text, target_lang)
+                self._remember(key, translation)
+                size = len(text.encode('utf-8')) + len(translation.encode('utf-8'))
+                rows[key] = (key, target_lang, translation, size, now)
+            if not rows:
+                return
+            keys = list(rows)
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                replaced = self._conn.execute(
+                    f"SELECT COALESCE(SUM(size), 0) FROM translations WHERE key IN ({','.join('?' * len(batch))})", batch
+                ).fetchone()[0]
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?)", [rows[key] for key in batch]
+                )
+                self._db_bytes += sum(rows[key][3] for key in batch) - replaced
+            if self._db_bytes > self.max_bytes:
+                self._evict()
+            self._conn.commit()
+
+    def set(self, text: str, target_lang: str, translation: str) -> None:
+        self.set_many([(text, translation)], target_lang)
+
+    def _evict(self) -> None:
+        """가장 오래 사용되지 않은 항목부터 지워 max_bytes의 90% 이하로 줄임"""
+        target = int(self.max_bytes * 0.9)
+        rows = self._conn.execute("SELECT key, size FROM translations ORDER BY last_used, rowid").fetchall()
+        evicted: List[str] = []
+        for key, size in rows:
+            if self._db_bytes <= target:
+                break
+            evicted.append(key)
+            self._db_bytes -= size
+            self._memory.pop(key, None)
+        self._conn.executemany("DELETE FROM translations WHERE key = ?", [(key,) for key in evicted])
+        print(f"[번역 캐시] {len(evicted)}개 항목 정리")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': entries,
+                'bytes': self._db_bytes,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_default_cache: DefaultStore[TranslationCache] = DefaultStore(
+    TranslationCache, disabled=os.getenv('TRANSLATION_CACHE', '').lower() in ('0', 'off', 'false'))
+
+
+def get_translation_cache() -> Optional[TranslationCache]:
+    """기본 번역 캐시 반환 (TRANSLATION_CACHE=off이면 None)"""
+    return _default_cache.get()
+
+
+def set_translation_cache(cache: Optional[TranslationCache]) -> None:
+    """기본 번역 캐시 교체 (None이면 다음 호출 때 기본 캐시를 다시 만듦)"""
+    _default_cache.set(cache)
+
+
+def disable_translation_cache() -> None:
+    """다음 set_translation_cache() 호출 전까지 번역 캐시를 쓰지 않음"""
+    _default_cache.disable()
@@ -1,21 +1,175 @@
+import json
 import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional
+
+try:
+    import fcntl  # 여러 프로세스(cron 중복 실행 등)가 같은 파일을 갱신할 때 사용, Windows에는 없음
+except ImportError:
+    fcntl = None
 
 COUNTER_FILE = 'translation_counter.txt'
+MONTHLY_LIMIT = int(os.getenv('DEEPL_MONTHLY_LIMIT', '493989'))  # DeepL 무료 티어 월간 제한
+# 예약한 프로세스가 끝나지 못하고 죽은 경우 그 예약이 풀리기까지의 시간(초)
+RESERVATION_TTL = int(os.getenv('QUOTA_RESERVATION_TTL', '3600'))
+_counter_lock = threading.Lock()
+_local = threading.local()  # 현재 스레드가 번역 중인 예약 (update_translation_count가 차감)
 
-def get_translation_count():
+
+class QuotaExceeded(Exception):
+    """이번 달 남은 번역량으로는 요청을 처리할 수 없음 (재시도해도 성공하지 않음)"""
+
+
+def current_month() -> str:
+    return datetime.now().strftime('%Y-%m')
+
+
+def _read_state() -> Dict[str, Any]:
+    """
+    {'month': 'YYYY-MM', 'chars': 누적 글자 수, 'reserved': {예약 id: [남은 예약 글자 수, 예약 시각]}}
+    예전 형식(정수 하나만 저장된 파일)은 이번 달 누적값으로 간주합니다.
+    RESERVATION_TTL이 지난 예약은 버립니다.
+    """
+    month = current_month()
     if not os.path.exists(COUNTER_FILE):
-        return 0
+        return {'month': month, 'chars': 0, 'reserved': {}}
     try:
         with open(COUNTER_FILE, 'r') as f:
-            return int(f.read().strip() or 0)
-    except (ValueError, IOError):
-        return 0
+            raw = f.read().strip()
+    except IOError:
+        return {'month': month, 'chars': 0, 'reserved': {}}
+    try:
+        data = json.loads(raw or '0')
+    except ValueError:
+        return {'month': month, 'chars': 0, 'reserved': {}}
+    if isinstance(data, int):
+        return {'month': month, 'chars': data, 'reserved': {}}
+    if not isinstance(data, dict) or data.get('month') != month:
+        # 달이 바뀌면 0부터 다시 집계
+        return {'month': month, 'chars': 0, 'reserved': {}}
+    now = time.time()
+    reserved = {token: [int(chars), at] for token, (chars, at) in (data.get('reserved') or {}).items()
+                if now - at < RESERVATION_TTL}
+    return {'month': month, 'chars': int(data.get('chars', 0)), 'reserved': reserved}
+
+
+def _write_state(state: Dict[str, Any]) -> None:
+    if not state.get('reserved'):
+        state = {'month': state['month'], 'chars': state['chars']}
+    tmp_path = f"{COUNTER_FILE}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(state, f)
+    os.replace(tmp_path, COUNTER_FILE)
+
+
+def _reserved_chars(state: Dict[str, Any]) -> int:
+    return sum(chars for chars, _ in state['reserved'].values())
+
+
+@contextmanager
+def _locked() -> Iterator[None]:
+    """스레드 간 잠금 + (가능하면) 프로세스 간 파일 잠금"""
+    with _counter_lock:
+        if fcntl is None:
+            yield
+            return
+        with open(f"{COUNTER_FILE}.lock", 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def get_translation_count():
+    return _read_state()['chars']
+
 
 def update_translation_count(chars_count):
-    current = get_translation_count()
-    with open(COUNTER_FILE, 'w') as f:
-        f.write(str(current + chars_count))
+    # 여러 스레드/프로세스에서 동시에 번역해도 누적값이 유실되지 않도록 잠금
+    # reserve_quota 블록 안이면 쓴 만큼 예약분에서 빼서 두 번 세지 않음
+    token = getattr(_local, 'token', None)
+    with _locked():
+        state = _read_state()
+        state['chars'] += chars_count
+        if token in state['reserved']:
+            reservation = state['reserved'][token]
+            reservation[0] = max(0, reservation[0] - chars_count)
+        _write_state(state)
+
+
+def set_translation_count(chars_count: int) -> None:
+    """이번 달 누적값을 덮어씀 (DeepL 사용량 동기화, 한도 소진 표시용)"""
+    with _locked():
+        state = _read_state()
+        state['chars'] = chars_count
+        _write_state(state)
+
 
 def get_remaining_chars():
-    monthly_limit = 493989  # DeepL 무료 티어 월간 제한
-    return max(0, monthly_limit - get_translation_count())
+    """이번 달 남은 번역량 (다른 포스트/프로세스가 예약한 양 제외)"""
+    state = _read_state()
+    return max(0, MONTHLY_LIMIT - state['chars'] - _reserved_chars(state))
+
+
+def ensure_quota(chars_count: int) -> None:
+    """chars_count만큼 번역할 여유가 없으면 QuotaExceeded (예약은 하지 않음)"""
+    remaining = get_remaining_chars()
+    if chars_count > remaining:
+        raise QuotaExceeded(f"번역 한도 부족: 필요 {chars_count:,}자 / 남은 {remaining:,}자")
+
+
+@contextmanager
+def reserve_quota(chars_count: int) -> Iterator[None]:
+    """
+    chars_count자를 파일 잠금 안에서 확인과 동시에 예약 (여유가 없으면 QuotaExceeded)
+    동시에 번역하는 포스트/프로세스가 같은 여유분을 보고 함께 한도를 넘지 않게 합니다.
+    블록 안에서 update_translation_count로 기록한 양은 예약분에서 빠지고, 블록이 끝나면 남은 예약은 풀립니다.
+    예약 블록 안에서 다시 예약하면 바깥 예약의 남은 양부터 가져다 씁니다.
+    """
+    token = uuid.uuid4().hex
+    parent = getattr(_local, 'token', None)
+    with _locked():
+        state = _read_state()
+        borrowed = min(chars_count, state['reserved'][parent][0]) if parent in state['reserved'] else 0
+        remaining = max(0, MONTHLY_LIMIT - state['chars'] - _reserved_chars(state))
+        if chars_count - borrowed > remaining:
+            raise QuotaExceeded(f"번역 한도 부족: 필요 {chars_count:,}자 / 남은 {remaining + borrowed:,}자")
+        if borrowed:
+            state['reserved'][parent][0] -= borrowed
+        state['reserved'][token] = [chars_count, time.time()]
+        _write_state(state)
+    _local.token = token
+    try:
+        yield
+    finally:
+        _local.token = parent
+        with _locked():
+            state = _read_state()
+            if state['reserved'].pop(token, None) is not None:
+                _write_state(state)
+
+
+def mark_quota_exhausted() -> None:
+    """DeepL이 한도 초과를 알려온 경우 이번 달 남은 번역량을 0으로 기록"""
+    set_translation_count(max(MONTHLY_LIMIT, get_translation_count()))
+
+
+def sync_translation_count(translator: Any) -> Optional[int]:
+    """
+    DeepL 사용량 API 값으로 누적값을 맞춤 (과금 주기가 달력 월과 다를 수 있어 API 값을 우선)
+    조회에 실패하면 로컬 집계를 그대로 쓰고 None 반환
+    """
+    try:
+        usage = translator.get_usage().character
+    except Exception as e:
+        print(f"[번역량 동기화 실패] 로컬 집계 사용: {e}")
+        return None
+    if not usage.valid:
+        return None
+    set_translation_count(usage.count)
+    return usage.count
@@ -0,0 +1,288 @@
+import os
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+from components.concurrency import limit
+from components.metrics import inc, observe
+from components.translation_counter import QuotaExceeded
+
+# 사용할 번역 백엔드 (앞쪽이 우선, 설정/설치가 안 된 백엔드는 건너뜀)
+TRANSLATION_BACKENDS = os.getenv('TRANSLATION_BACKENDS', 'deepl,google,local')
+# 1이면 모든 백엔드가 실패했을 때 원문(한국어)을 쓰지 않고 예외를 올림
+TRANSLATION_STRICT = os.getenv('TRANSLATION_STRICT', '1') == '1'
+
+GOOGLE_TRANSLATE_API_KEY = os.getenv('GOOGLE_TRANSLATE_API_KEY')
+GOOGLE_TRANSLATE_URL = "https://translation.googleapis.com/language/translate/v2"
+LOCAL_TRANSLATION_MODEL = os.getenv('LOCAL_TRANSLATION_MODEL', 'Helsinki-NLP/opus-mt-ko-en')
+
+MAX_ROUNDS = 3            # 모든 백엔드를 한 바퀴 시도하는 것을 1회로, 최대 시도 횟수
+BACKOFF_BASE = 0.5        # 재시도 대기 시간 기준(초), 회차마다 2배 (full jitter)
+BACKOFF_MAX = 8.0
+FAILURE_THRESHOLD = 3     # 연속 실패 시 회로 차단
+RESET_SECONDS = 30.0      # 차단 후 다시 시도해 볼 때까지의 시간
+UNAVAILABLE_SECONDS = 3600.0  # 한도 초과/인증 실패처럼 재시도가 의미 없는 경우의 차단 시간
+EWMA_ALPHA = 0.3
+SLOW_FACTOR = 3.0         # 가장 빠른 백엔드보다 이 배수 이상 느리면 우선순위를 뒤로 미룸
+
+
+class TranslationError(Exception):
+    """사용 가능한 모든 번역 백엔드가 실패함"""
+
+
+class BackendUnavailable(Exception):
+    """재시도해도 성공하지 않는 실패 (인증 실패, 지원하지 않는 언어 등)"""
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 threshold번 쌓이면 reset_seconds 동안 요청을 막고(open),
+    그 뒤에는 한 번만 시험 삼아 허용(half-open)해 성공하면 다시 닫습니다.
+    """
+
+    def __init__(self, threshold: int = FAILURE_THRESHOLD, reset_seconds: float = RESET_SECONDS):
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.open_until = 0.0
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self.open_until == 0.0:
+                return 'closed'
+            return 'open' if time.monotonic() < self.open_until else 'half-open'
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.open_until == 0.0:
+                return True
+            if time.monotonic() < self.open_until or self._trial:
+                return False
+            self._trial = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.open_until = 0.0
+            self._trial = False
+
+    def record_failure(self, cooldown: Optional[float] = None) -> bool:
+        """실패 기록, 이번 실패로 회로가 열렸으면 True"""
+        with self._lock:
+            self.failures += 1
+            self._trial = False
+            if cooldown is None and self.failures < self.threshold and self.open_until == 0.0:
+                return False
+            self.open_until = time.monotonic() + (cooldown if cooldown is not None else self.reset_seconds)
+            return True
+
+
+class GoogleBackend:
+    """Google Cloud Translation v2 REST API"""
+    name = 'google'
+    tracks_quota = False
+
+    def __init__(self, api_key: str, timeout: float = 30.0):
+        self.api_key = api_key
+        self._client = httpx.Client(timeout=timeout)
+
+    def translate(self, texts: List[str], target_lang: str) -> List[str]:
+        response = self._client.post(
+            GOOGLE_TRANSLATE_URL,
+            params={'key': self.api_key},
+            json={'q': texts, 'source': 'ko', 'target': target_lang.split('-')[0].lower(), 'format': 'text'}
+        )
+        if response.status_code in (400, 401, 403):
+            raise BackendUnavailable(f"Google 번역 {response.status_code}: {response.text[:200]}")
+        response.raise_for_status()
+        return [item['translatedText'] for item in response.json()['data']['translations']]
+
+    def close(self) -> None:
+        self._client.close()
+
+
+class LocalModelBackend:
+    """
+    transformers 번역 모델로 오프라인 번역 (네트워크/한도 없음, 품질은 낮음)
+    transformers가 설치돼 있어야 하며 모델은 처음 사용할 때 불러옵니다.
+    """
+    name = 'local'
+    tracks_quota = False
+
+    def __init__(self, model_name: str = LOCAL_TRANSLATION_MODEL, batch_size: int = 8):
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self._pipeline = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def available() -> bool:
+        try:
+            import transformers  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def translate(self, texts: List[str], target_lang: str) -> List[str]:
+        if not target_lang.upper().startswith('EN'):
+            raise BackendUnavailable(f"로컬 모델은 영어 번역만 지원합니다: {target_lang}")
+        # 파이프라인은 스레드 안전하지 않으므로 한 번에 하나씩 실행
+        with self._lock:
+            if self._pipeline is None:
+                from transformers import pipeline
+                self._pipeline = pipeline('translation', model=self.model_name)
+            outputs = self._pipeline(texts, batch_size=self.batch_size, truncation=True)
+        return [output['translation_text'] for output in outputs]
+
+
+def create_backend(name: str) -> Optional[Any]:
+    """DeepL 외 백엔드 생성 (키가 없거나 설치돼 있지 않으면 None)"""
+    if name == 'google':
+        return GoogleBackend(GOOGLE_TRANSLATE_API_KEY) if GOOGLE_TRANSLATE_API_KEY else None
+    if name == 'local':
+        return LocalModelBackend() if LocalModelBackend.available() else None
+    raise ValueError(f"알 수 없는 번역 백엔드입니다: {name}")
+
+
+class _Route:
+    def __init__(self, backend: Any, breaker: CircuitBreaker):
+        self.backend = backend
+        self.breaker = breaker
+        self.latency: Optional[float] = None  # 글자당 응답 시간의 지수이동평균(초)
+
+    def record_latency(self, seconds: float, chars: int) -> None:
+        sample = seconds / max(1, chars)
+        self.latency = sample if self.latency is None else (1 - EWMA_ALPHA) * self.latency + EWMA_ALPHA * sample
+
+
+class TranslatorRouter:
+    """
+    여러 번역 백엔드 앞에 두는 라우터.
+
+    - 백엔드마다 회로 차단기를 두고, 실패하면 바로 다음 백엔드로 넘김
+    - 모든 백엔드가 실패하면 지수 백오프(+jitter) 후 다시 한 바퀴 (최대 max_rounds회)
+    - 설정 순서를 우선하되, 가장 빠른 백엔드보다 SLOW_FACTOR배 이상 느린 백엔드는 뒤로 미룸
+    - 한도 초과(QuotaExceeded)/BackendUnavailable은 재시도하지 않고 오래 차단
+    """
+
+    def __init__(self, backends: Sequence[Any], strict: bool = TRANSLATION_STRICT,
+                 max_rounds: int = MAX_ROUNDS, backoff_base: float = BACKOFF_BASE,
+                 backoff_max: float = BACKOFF_MAX, failure_threshold: int = FAILURE_THRESHOLD,
+                 reset_seconds: float = RESET_SECONDS):
+        if not backends:
+            raise ValueError("번역 백엔드가 하나 이상 필요합니다.")
+        self.strict = strict
+        self.max_rounds = max_rounds
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._routes = [_Route(backend, CircuitBreaker(failure_threshold, reset_seconds)) for backend in backends]
+
+    @property
+    def backends(self) -> List[Any]:
+        return [route.backend for route in self._routes]
+
+    @property
+    def primary(self) -> Any:
+        """설정에서 첫 번째 백엔드 (이 백엔드의 번역만 캐시/지문에 저장, 나머지는 장애 대비용)"""
+        return self._routes[0].backend
+
+    def has_unmetered_backend(self) -> bool:
+        """월간 번역량 한도와 무관한 백엔드가 있는지 (있으면 한도가 떨어져도 번역 가능)"""
+        return any(not getattr(route.backend, 'tracks_quota', False) for route in self._routes)
+
+    def get_usage(self) -> Any:
+        """번역량을 집계하는 첫 백엔드의 사용량 (translation_counter.sync_translation_count용)"""
+        for route in self._routes:
+            if getattr(route.backend, 'tracks_quota', False) and hasattr(route.backend, 'get_usage'):
+                return route.backend.get_usage()
+        raise AttributeError("사용량을 조회할 수 있는 백엔드가 없습니다.")
+
+    def status(self) -> List[Dict[str, Any]]:
+        return [
+            {'backend': route.backend.name, 'state': route.breaker.state, 'latency_per_char': route.latency}
+            for route in self._routes
+        ]
+
+    def _ordered_routes(self) -> List[_Route]:
+        known = [route.latency for route in self._routes if route.latency is not None]
+        fastest = min(known) if known else None
+
+        def slow(route: _Route) -> bool:
+            return fastest is not None and route.latency is not None and route.latency > fastest * SLOW_FACTOR
+
+        return [route for route in self._routes if not slow(route)] + [route for route in self._routes if slow(route)]
+
+    def _backoff(self, round_no: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** round_no)))
+
+    def translate(self, texts: List[str], target_lang: str) -> List[str]:
+        """texts를 번역해 같은 순서로 반환, 모든 백엔드가 실패하면 TranslationError/QuotaExceeded"""
+        return self.translate_with_backend(texts, target_lang)[0]
+
+    def translate_with_backend(self, texts: List[str], target_lang: str) -> Tuple[List[str], Any]:
+        """translate와 같지만 (번역 결과, 번역한 백엔드)를 반환"""
+        chars = sum(len(text) for text in texts)
+        last_error: Optional[BaseException] = None
+        quota_only = True  # 지금까지의 실패가 모두 한도 초과인지
+        for round_no in range(self.max_rounds):
+            if round_no:
+                # 남은 백엔드가 모두 차단된 경우는 기다려도 소용없음
+                if all(route.breaker.state == 'open' for route in self._routes):
+                    break
+                inc('translation_retries')
+                time.sleep(self._backoff(round_no - 1))
+            attempted = False
+            for route in self._ordered_routes():
+                if not route.breaker.allow():
+                    continue
+                name = route.backend.name
+                if attempted:
+                    inc('translation_failovers')
+                attempted = True
+                inc('translation_requests', backend=name)
+                started = time.perf_counter()
+                try:
+                    with limit('translate'):
+                        translated = route.backend.translate(texts, target_lang)
+                except (QuotaExceeded, BackendUnavailable) as e:
+                    last_error = e
+                    quota_only = quota_only and isinstance(e, QuotaExceeded)
+                    inc('translation_backend_errors', backend=name)
+                    route.breaker.record_failure(cooldown=UNAVAILABLE_SECONDS)
+                    inc('translation_circuit_opened', backend=name)
+                    print(f"[번역 백엔드 차단] {name}: {e}")
+                    continue
+                except Exception as e:
+                    last_error = e
+                    quota_only = False
+                    inc('translation_backend_errors', backend=name)
+                    if route.breaker.record_failure():
+                        inc('translation_circuit_opened', backend=name)
+                    print(f"[번역 에러] {name} (시도 {round_no + 1}/{self.max_rounds}): {e}")
+                    continue
+                elapsed = time.perf_counter() - started
+                observe('translation_request_seconds', elapsed, backend=name)
+                route.record_latency(elapsed, chars)
+                route.breaker.record_success()
+                return translated, route.backend
+
+            if not attempted:
+                break
+
+        inc('translation_failures')
+        if last_error is not None and quota_only:
+            raise last_error
+        raise TranslationError(f"모든 번역 백엔드 실패: {last_error or '사용 가능한 백엔드 없음'}")
+
+    def close(self) -> None:
+        for route in self._routes:
+            close = getattr(route.backend, 'close', None)
+            if close is not None:
+                close()
@@ -0,0 +1,122 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Optional, Tuple, Union
+
+from components.default_store import DefaultStore
+from components.get_store_and_address import StoreAddress, parse_address
+
+CACHE_PATH = os.getenv('TRAVEL_CACHE_PATH', 'travel_cache.sqlite3')
+TTL_DAYS = float(os.getenv('TRAVEL_CACHE_TTL_DAYS', '30'))
+# 'address': 같은 주소일 때만 재사용, 'dong': 같은 구/동이면 재사용
+GRANULARITY = os.getenv('TRAVEL_CACHE_GRANULARITY', 'address')
+
+_WHITESPACE = re.compile(r'\s+')
+_EMPTY_VALUES = ('', 'None')
+
+
+def normalize_address(store_and_address: Union[StoreAddress, str, None],
+                      granularity: str = GRANULARITY) -> Optional[str]:
+    """
+    extract_address 결과(StoreAddress) 또는 "가게명, 주소" 문자열에서 캐시 키로 쓸 주소를 정규화
+    - 주소가 없으면 None
+    - granularity='dong'이면 "OO구 OO동" 단위 (망원1동 → 망원동)
+    """
+    if not store_and_address:
+        return None
+    if isinstance(store_and_address, StoreAddress):
+        parsed = store_and_address
+        address = parsed.address or ''
+    else:
+        parsed = None
+        address = store_and_address.split(', ', 1)[1] if ', ' in store_and_address else store_and_address
+    address = _WHITESPACE.sub(' ', address).strip(' ,.')
+    address = address.replace('서울특별시', '서울')
+    if address in _EMPTY_VALUES:
+        return None
+    if granularity == 'dong':
+        parsed = parsed or parse_address(address)
+        if parsed.gu and parsed.dong:
+            return f"dong:{parsed.gu} {parsed.dong}"
+    return f"address:{address}"
+
+
+class TravelCourseCache:
+    """
+    주소 기반 여행코스 캐시 (SQLite).
+    한국어 원문과 번역문을 함께 저장해 같은 동네는 LLM/번역 호출 없이 재사용합니다.
+    """
+
+    def __init__(self, path: str = CACHE_PATH, ttl_days: float = TTL_DAYS):
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS travel_courses ("
+            " key TEXT PRIMARY KEY,"
+            " courses_ko TEXT NOT NULL,"
+            " courses_en TEXT,"
+            " created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Tuple[str, Optional[str]]]:
+        """(한국어, 번역문 또는 None) 반환, 없거나 만료되면 None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT courses_ko, courses_en, created_at FROM travel_courses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or time.time() - row[2] > self.ttl_seconds:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0], row[1]
+
+    def set(self, key: str, courses_ko: str, courses_en: Optional[str] = None) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO travel_courses VALUES (?, ?, ?, ?)",
+                (key, courses_ko, courses_en, time.time())
+            )
+            self._conn.commit()
+
+    def set_translation(self, key: str, courses_en: str) -> None:
+        """이미 저장된 원문에 번역문만 추가 (만료 시각은 유지)"""
+        with self._lock:
+            self._conn.execute("UPDATE travel_courses SET courses_en = ? WHERE key = ?", (courses_en, key))
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM travel_courses WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_default_cache: DefaultStore[TravelCourseCache] = DefaultStore(
+    TravelCourseCache, disabled=os.getenv('TRAVEL_CACHE', '').lower() in ('0', 'off', 'false'))
+
+
+def get_travel_cache() -> Optional[TravelCourseCache]:
+    """기본 여행코스 캐시 반환 (TRAVEL_CACHE=off이면 None)"""
+    return _default_cache.get()
+
+
+def set_travel_cache(cache: Optional[TravelCourseCache]) -> None:
+    """기본 여행코스 캐시 교체 (None이면 다음 호출 때 기본 캐시를 다시 만듦)"""
+    _default_cache.set(cache)
+
+
+def disable_travel_cache() -> None:
+    """다음 set_travel_cache() 호출 전까지 여행코스 캐시를 쓰지 않음"""
+    _default_cache.disable()
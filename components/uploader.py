@@ -1,47 +1,214 @@
-
-
+import glob
+import hashlib
 import json
+import os
+import random
 import re
-from components.supabase import insert_eng_post
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from components.metrics import inc, timer
+from components.output_writer import OutputManifest, get_output_manifest
+from components.post_store import PostStore, get_post_store, post_key
+from components.supabase import upsert_eng_posts
 
-def upload_markdown_to_supabase(eng_md_path: str, meta_path: str):
+ENG_DIR = 'eng'
+UPLOAD_BATCH_SIZE = int(os.getenv('UPLOAD_BATCH_SIZE', '100'))  # upsert 1회당 행 수
+MAX_RETRIES = 3       # 묶음당 최대 시도 횟수
+BACKOFF_BASE = 1.0    # 재시도 대기 시간 기준(초), 회차마다 2배 (full jitter)
+
+IMAGE_URL_PATTERN = re.compile(r'!\[.*?\]\((https?://[^\s)]+)\)')
+
+
+def build_post_row(eng_md_path: str, meta_path: str, meta: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
-    eng 마크다운 파일과 메타정보(json)를 읽어 Supabase에 업로드
+    eng 마크다운 파일과 메타정보(json)로 eng_posts 행 생성
+    meta를 주면(매니페스트에 기록된 메타정보) meta_path를 다시 읽지 않음
     """
     # 메타 정보 로드
-    with open(meta_path, 'r', encoding='utf-8') as f:
-        meta = json.load(f)
-    
+    if meta is None:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+
     # 마크다운 내용 로드
     with open(eng_md_path, 'r', encoding='utf-8') as f:
         content = f.read()
-    
+
     # 이미지 URL 추출 (RSS description에서 가져온 image_url 우선 사용)
     image_url = meta.get('image_url')
-    
+
     # RSS에서 이미지 URL을 찾지 못한 경우 마크다운에서 추출 시도
     if not image_url:
-        image_urls = re.findall(r'!\\[.*?\\]\\((https?://[^\\s]+)\\)', content)
+        image_urls = IMAGE_URL_PATTERN.findall(content)
         image_url = image_urls[0] if image_urls else None
-    
-    # Supabase 데이터 생성
-    data = {
+
+    # Supabase 데이터 생성 (묶음 upsert는 모든 행의 컬럼이 같아야 하므로 address도 항상 포함)
+    return {
         'title': meta['title'],
         'content': content,
         'desc': content[:200],  # 요약
         'image_url': image_url,  # 이미지 URL
         'tags': meta.get('tags', []),
-        'kor_url': meta.get('kor_url')
+        'kor_url': meta.get('kor_url'),
+        'address': meta.get('address') or None
     }
-    
-    # 주소가 있는 경우에만 추가
-    if meta.get('address'):
-        data['address'] = meta['address']
+
+
+def row_hash(row: Dict[str, Any]) -> str:
+    """업로드할 행 내용의 sha256 (마크다운/메타를 고치면 바뀜)"""
+    return hashlib.sha256(json.dumps(row, ensure_ascii=False, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def iter_post_files(eng_dir: str = ENG_DIR) -> Iterator[Tuple[str, str]]:
+    """eng 디렉토리의 (마크다운 경로, .meta.json 경로) 쌍을 파일 이름 순으로 반환"""
+    for meta_path in sorted(glob.iglob(os.path.join(glob.escape(eng_dir), '*.meta.json'))):
+        md_path = meta_path[:-len('.meta.json')] + '.md'
+        if os.path.exists(md_path):
+            yield md_path, meta_path
+        else:
+            print(f"[업로드 건너뜀] 마크다운 파일 없음: {md_path}")
+
+
+def iter_upload_sources(eng_dir: str = ENG_DIR, entries: Optional[Dict[str, Dict[str, Any]]] = None
+                        ) -> Iterator[Tuple[str, str, Optional[Dict[str, Any]]]]:
+    """
+    업로드할 (마크다운 경로, 메타 경로, 메타정보 또는 None) 반환
+    - 매니페스트 기록(entries)이 있는 포스트: 기록된 경로와 메타정보 사용
+      (저장 후 메타 파일을 직접 고쳤으면 None을 돌려 파일을 다시 읽게 함)
+    - 매니페스트가 생기기 전에 저장된 파일: 디렉토리에서 찾아 추가
+    """
+    listed = set()
+    for entry in (entries or {}).values():
+        md_path, meta_path = entry['eng_path'], entry['meta_path']
+        if os.path.dirname(os.path.abspath(md_path)) != os.path.abspath(eng_dir):
+            continue
+        try:
+            modified = os.path.getmtime(meta_path) > entry['time']
+        except OSError:
+            continue  # 파일을 지운 포스트
+        if not os.path.exists(md_path):
+            continue
+        listed.add(os.path.abspath(meta_path))
+        yield md_path, meta_path, None if modified else entry['meta']
+    for md_path, meta_path in iter_post_files(eng_dir):
+        if os.path.abspath(meta_path) not in listed:
+            yield md_path, meta_path, None
+
+
+def _backoff(attempt: int) -> float:
+    return random.uniform(0, BACKOFF_BASE * (2 ** attempt))
+
+
+def _upsert_with_retry(rows: List[Dict[str, Any]], upsert: Callable[[List[Dict[str, Any]]], Any]
+                       ) -> List[Dict[str, Any]]:
+    """
+    rows를 upsert하고 끝내 실패한 행 목록을 반환
+    재시도해도 실패한 묶음은 반으로 나눠 다시 시도해, 문제가 있는 행만 남깁니다.
+    """
+    for attempt in range(MAX_RETRIES):
+        try:
+            inc('supabase_upsert_requests')
+            with timer('supabase_upsert_seconds'):
+                upsert(rows)
+            inc('supabase_upserted_rows', len(rows))
+            return []
+        except Exception as e:
+            print(f"[Supabase Upsert 에러] {len(rows)}행 (시도 {attempt + 1}/{MAX_RETRIES}): {e}")
+            if attempt + 1 < MAX_RETRIES:
+                inc('supabase_upsert_retries')
+                time.sleep(_backoff(attempt))
+    if len(rows) == 1:
+        return rows
+    middle = len(rows) // 2
+    return _upsert_with_retry(rows[:middle], upsert) + _upsert_with_retry(rows[middle:], upsert)
+
+
+def upload_pending(eng_dir: str = ENG_DIR, batch_size: Optional[int] = None,
+                   store: Optional[PostStore] = None, force: bool = False,
+                   upsert: Optional[Callable[[List[Dict[str, Any]]], Any]] = None,
+                   manifest: Optional[OutputManifest] = None) -> Dict[str, int]:
+    """
+    eng 디렉토리의 마크다운/메타 파일을 읽으며 batch_size행(기본 UPLOAD_BATCH_SIZE)씩 kor_url 기준으로 upsert
+    마지막 업로드 이후 내용이 바뀌지 않은 포스트는 건너뛰고(force면 모두 업로드),
+    성공한 행의 해시를 store에 기록합니다. 같은 포스트를 다시 올려도 중복 행이 생기지 않습니다.
+    매니페스트(기본 get_output_manifest())에 기록된 포스트는 메타 파일을 다시 파싱하지 않고,
+    업로드가 끝나면 'uploaded' 상태를 추가로 기록합니다.
+    :return: {'uploaded', 'skipped', 'failed', 'batches'}
+    """
+    batch_size = batch_size or UPLOAD_BATCH_SIZE
+    store = store or get_post_store()
+    upsert = upsert or upsert_eng_posts
+    manifest = manifest or get_output_manifest()
+    entries = manifest.latest() if manifest is not None else {}
+    synced = {} if force else store.upload_hashes()
+    stats = {'uploaded': 0, 'skipped': 0, 'failed': 0, 'batches': 0}
+    # 한 번의 upsert에 같은 kor_url이 두 번 들어가면 요청 전체가 실패하므로 포스트별로 하나만 유지
+    batch: Dict[str, Tuple[Dict[str, Any], str]] = {}
+    seen = set()
+
+    def flush() -> None:
+        rows = [row for row, _ in batch.values()]
+        failed = _upsert_with_retry(rows, upsert)
+        failed_ids = {id(row) for row in failed}
+        done = [(row['kor_url'], content_hash) for row, content_hash in batch.values() if id(row) not in failed_ids]
+        store.mark_uploaded(done)
+        if manifest is not None:
+            now = time.time()
+            manifest.append(dict(entries[key], status='uploaded', time=now)
+                            for key in (post_key(url) for url, _ in done) if key in entries)
+        stats['batches'] += 1
+        stats['uploaded'] += len(done)
+        stats['failed'] += len(failed)
+        for row in failed:
+            print(f"[업로드 실패] {row['kor_url']}")
+        print(f"[업로드 진행] 성공 {stats['uploaded']}건 / 실패 {stats['failed']}건 / 건너뜀 {stats['skipped']}건")
+        batch.clear()
+
+    for md_path, meta_path, meta in iter_upload_sources(eng_dir, entries):
+        try:
+            row = build_post_row(md_path, meta_path, meta)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[업로드 건너뜀] {meta_path}: {e}")
+            stats['failed'] += 1
+            continue
+        if not row['kor_url']:
+            print(f"[업로드 건너뜀] kor_url 없음: {meta_path}")
+            stats['failed'] += 1
+            continue
+        key = post_key(row['kor_url'])
+        if key in seen:
+            # 매니페스트 기록이 먼저 나오므로 최신 저장본을 유지하고, 남은 옛 파일이 번갈아 덮어쓰지 않게 함
+            print(f"[업로드 중복] 같은 포스트의 파일이 여러 개입니다. 건너뜀: {meta_path}")
+            stats['skipped'] += 1
+            continue
+        seen.add(key)
+        content_hash = row_hash(row)
+        if synced.get(key) == content_hash:
+            stats['skipped'] += 1
+            continue
+        batch[key] = (row, content_hash)
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+    return stats
+
+
+def upload_markdown_to_supabase(eng_md_path: str, meta_path: str):
+    """
+    eng 마크다운 파일과 메타정보(json)를 읽어 Supabase에 업로드 (kor_url 기준 upsert)
+    kor_url이 없는 메타는 upsert 기준이 없으므로 업로드하지 않음 (upload_pending과 같음)
+    """
+    data = build_post_row(eng_md_path, meta_path)
+    if not data['kor_url']:
+        print(f"[업로드 건너뜀] kor_url 없음: {meta_path}")
+        return False, ValueError(f"kor_url 없음: {meta_path}")
     try:
-        insert_result = insert_eng_post(data)
-        print(f"[Supabase Insert 결과] {insert_result}")
-        return True, insert_result
+        failed = _upsert_with_retry([data], upsert_eng_posts)
+        if failed:
+            raise RuntimeError(f"업로드 실패: {data['kor_url']}")
+        get_post_store().mark_uploaded([(data['kor_url'], row_hash(data))])
+        print(f"[Supabase Upsert 완료] {data['kor_url']}")
+        return True, data
     except Exception as supa_err:
-        print(f"[Supabase Insert 에러] {supa_err}")
+        print(f"[Supabase Upsert 에러] {supa_err}")
         return False, supa_err
-
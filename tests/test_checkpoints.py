@@ -0,0 +1,105 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+import app
+import components.deepl as deepl
+import components.metrics as metrics
+import components.naver_crawler as naver_crawler
+from components.checkpoints import CheckpointStore, clear_checkpoint, set_checkpoint_store
+from components.document import Document, HeadingBlock, TextBlock
+from components.get_store_and_address import StoreAddress
+from components.translators import TranslatorRouter
+
+URL = "https://blog.naver.com/bench/223900000001"
+REAL_TRANSLATE_POST = naver_crawler.translate_post
+
+@pytest.fixture
+def checkpoints(tmp_path):
+    store = CheckpointStore(str(tmp_path / "checkpoints.sqlite3"))
+    set_checkpoint_store(store)
+    yield store
+    set_checkpoint_store(None)
+    store.close()
+
+@pytest.fixture
+def stages(monkeypatch):
+    calls = {'fetch': 0, 'parse': 0, 'enrich': 0, 'translate': 0}
+    failures = {'translate': 1}
+
+    def fetch(result, driver_pool=None, fetch_mode=None):
+        calls['fetch'] += 1
+        return dict(result, title="망원동 라멘", safe_title="mangwon", soup=object())
+
+    def parse(result):
+        calls['parse'] += 1
+        result.pop('soup')
+        return dict(result, document=Document([HeadingBlock("망원동 라멘", level=0), TextBlock("국물이 진해요")]),
+                    store_address=StoreAddress('라멘', '서울 마포구 망원로 12', '서울', '마포구'),
+                    store_and_address="라멘, 서울 마포구 망원로 12")
+
+    def enrich(result):
+        calls['enrich'] += 1
+        return dict(result, travel_courses="여행 코스")
+
+    def translate(result, translator):
+        calls['translate'] += 1
+        if failures['translate']:
+            failures['translate'] -= 1
+            raise RuntimeError("번역 실패")
+        result['document'].text_blocks()[0].translation = "The broth is rich"
+        return dict(result, eng_title="Mangwon Ramen")
+
+    monkeypatch.setattr(naver_crawler, 'fetch_post', fetch)
+    monkeypatch.setattr(naver_crawler, 'parse_post', parse)
+    monkeypatch.setattr(naver_crawler, 'enrich_post', enrich)
+    monkeypatch.setattr(naver_crawler, 'translate_post', translate)
+    return calls
+
+def test_retry_resumes_after_last_completed_stage(checkpoints, stages):
+    with pytest.raises(RuntimeError):
+        naver_crawler.crawl_naver_blog(URL, translator=None)
+    assert checkpoints.load(URL)[0] == 'enriched'
+
+    result = naver_crawler.crawl_naver_blog(URL, translator=None)
+    assert stages == {'fetch': 1, 'parse': 1, 'enrich': 1, 'translate': 2}
+    assert result['travel_courses'] == "여행 코스"
+    assert result['store_address'].gu == '마포구'
+    assert result['document'].markdown(translated=True)[1] == "The broth is rich\n\n"
+
+    # 번역까지 끝난 포스트는 저장만 다시 하면 됨
+    stage, state = checkpoints.load(URL)
+    assert stage == 'translated' and state['eng_title'] == "Mangwon Ramen"
+    naver_crawler.crawl_naver_blog(URL, translator=None)
+    assert stages['translate'] == 2
+
+    clear_checkpoint(URL)
+    assert checkpoints.count() == 0
+
+class FailingBackend:
+    tracks_quota = False
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+
+    def translate(self, texts, target_lang):
+        self.calls += 1
+        raise ConnectionError(f"{self.name} 응답 없음")
+
+def test_post_fails_cleanly_when_every_backend_fails(checkpoints, stages, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(metrics, "_default_registry", metrics.MetricsRegistry(log_path=None))
+    monkeypatch.setattr(deepl, "get_translation_cache", lambda: None)
+    # 번역 단계만 실제 구현으로 되돌림
+    monkeypatch.setattr(naver_crawler, 'translate_post', REAL_TRANSLATE_POST)
+    backends = [FailingBackend("deepl"), FailingBackend("google")]
+    router = TranslatorRouter(backends, strict=True, backoff_base=0)
+
+    assert app.crawl_and_save_markdown(URL, router) is None
+    assert all(backend.calls for backend in backends)
+    # 원문을 번역문으로 저장하지 않고, 다음 실행은 번역 단계부터 다시 시작
+    assert not os.path.exists(tmp_path / "kor") and not os.path.exists(tmp_path / "eng")
+    assert checkpoints.load(URL)[0] == 'enriched'
+    assert stages['translate'] == 0
+    assert metrics.get_metrics().snapshot()['counters']['posts{status=error}'] == 1
@@ -0,0 +1,91 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+from unittest.mock import MagicMock
+from components.deepl import DeepLBackend, chunk_texts, translate_text, translate_texts, translate_texts_detailed
+from components.translators import TranslatorRouter
+from components.translation_cache import TranslationCache, set_translation_cache
+
+class FakeResult:
+    def __init__(self, text):
+        self.text = text
+
+def fake_translate(text, target_lang):
+    # 리스트 입력이면 리스트, 단일 문자열이면 단일 결과
+    if isinstance(text, list):
+        return [FakeResult(f"EN:{t}") for t in text]
+    return FakeResult(f"EN:{text}")
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    # 테스트마다 임시 캐시를 사용하고 번역량 파일은 건드리지 않음
+    cache = TranslationCache(str(tmp_path / "cache.sqlite3"))
+    set_translation_cache(cache)
+    monkeypatch.setattr("components.deepl.update_translation_count", lambda chars: None)
+    monkeypatch.setattr("components.translation_counter.COUNTER_FILE", str(tmp_path / "translation_counter.txt"))
+    yield cache
+    # 닫은 캐시가 기본 캐시로 남지 않도록 되돌린 뒤 닫음
+    set_translation_cache(None)
+    cache.close()
+
+def test_chunk_texts_respects_limits():
+    texts = ["가" * 10] * 7
+    chunks = chunk_texts(texts, max_texts=3, max_chars=25)
+    assert [len(c) for c in chunks] == [2, 2, 2, 1]
+    assert sum(chunks, []) == texts
+
+def test_chunk_texts_oversized_text_gets_own_chunk():
+    chunks = chunk_texts(["a" * 100, "b"], max_texts=50, max_chars=10)
+    assert chunks == [["a" * 100], ["b"]]
+
+def test_translate_texts_keeps_order_and_blanks():
+    translator = MagicMock()
+    translator.translate_text.side_effect = fake_translate
+    texts = ["첫 문단", "  ", "둘째 문단", "셋째 문단"]
+    assert translate_texts(texts, translator) == ["EN:첫 문단", "  ", "EN:둘째 문단", "EN:셋째 문단"]
+    # 빈 문자열을 제외한 3개가 한 번의 요청으로 전송되어야 함
+    assert translator.translate_text.call_count == 1
+
+def test_translate_texts_failed_chunk_returns_original():
+    translator = MagicMock()
+    translator.translate_text.side_effect = Exception("quota exceeded")
+    assert translate_texts(["원문"], translator) == ["원문"]
+
+def test_translate_texts_cache_hit_skips_network(isolated_cache):
+    translator = MagicMock()
+    translator.translate_text.side_effect = fake_translate
+    translate_texts(["◈ 위치", "영업시간"], translator)
+    assert translate_texts(["영업시간", "◈ 위치"], translator) == ["EN:영업시간", "EN:◈ 위치"]
+    assert translate_text("◈ 위치", translator) == "EN:◈ 위치"
+    assert translator.translate_text.call_count == 1
+    assert isolated_cache.stats()['hits'] == 3
+
+def test_translation_cache_evicts_least_recently_used(tmp_path):
+    cache = TranslationCache(str(tmp_path / "small.sqlite3"), max_bytes=30, memory_entries=1)
+    cache.set("a" * 10, "EN-US", "A" * 10)
+    cache.set("b" * 10, "EN-US", "B" * 10)
+    assert cache.get("a" * 10, "EN-US") is None
+    assert cache.get("b" * 10, "EN-US") == "B" * 10
+    cache.close()
+
+class GoogleBackend:
+    name = "google"
+    tracks_quota = False
+
+    def translate(self, texts, target_lang):
+        return [f"GOOGLE:{t}" for t in texts]
+
+def test_fallback_translation_is_not_cached(isolated_cache):
+    translator = MagicMock()
+    translator.translate_text.side_effect = [ConnectionError("503"), fake_translate(["영업시간"], "EN-US")]
+    router = TranslatorRouter([DeepLBackend(translator), GoogleBackend()], backoff_base=0)
+
+    # DeepL 장애 중에는 대체 백엔드 번역을 쓰되 캐시에는 저장하지 않음
+    assert translate_texts_detailed(["영업시간"], router) == (["GOOGLE:영업시간"], {"영업시간"})
+    assert isolated_cache.get_many(["영업시간"], "EN-US") == {}
+
+    # DeepL이 복구되면 다시 번역해 캐시에 저장
+    assert translate_texts(["영업시간"], router) == ["EN:영업시간"]
+    assert translate_texts(["영업시간"], router) == ["EN:영업시간"]
+    assert translator.translate_text.call_count == 2
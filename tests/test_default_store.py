@@ -0,0 +1,33 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from components.default_store import DefaultStore, is_off
+
+def test_default_store_is_lazy_and_set_none_resets():
+    created = []
+    store = DefaultStore(lambda: created.append(object()) or created[-1])
+    assert created == []
+    first = store.get()
+    assert store.get() is first and len(created) == 1
+
+    replacement = object()
+    store.set(replacement)
+    assert store.get() is replacement
+    # None은 끄는 것이 아니라 다음 get()에서 기본값을 다시 만듦
+    store.set(None)
+    assert store.get() is created[-1] and len(created) == 2
+
+def test_disabled_store_returns_none_until_set():
+    store = DefaultStore(object, disabled=is_off('off'))
+    assert store.get() is None
+    explicit = object()
+    store.set(explicit)
+    assert store.get() is explicit
+    store.set(None)
+    assert store.get() is None
+
+    enabled = DefaultStore(object)
+    enabled.disable()
+    assert enabled.get() is None
+    enabled.set(None)
+    assert enabled.get() is not None
@@ -0,0 +1,34 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from components.document import Document, HeadingBlock, ImageBlock, TextBlock, post_document
+
+def sample_document():
+    return Document([
+        HeadingBlock('망원동 라멘', 'Mangwon Ramen', level=0),
+        TextBlock('#망원라멘 #맛집 국물이 진해요', 'The broth is rich'),
+        ImageBlock('https://postfiles.pstatic.net/a.jpg?type=w773', 1),
+        TextBlock('다시 갈게요 #맛집'),
+        HeadingBlock('여행 코스 추천', 'Seoul Travel Guide Recommendation by Korean'),
+    ])
+
+def test_markdown_matches_legacy_parts():
+    document = sample_document()
+    assert document.markdown() == [
+        '망원동 라멘\n\n', '#망원라멘 #맛집 국물이 진해요\n\n',
+        '\n![pic1](https://postfiles.pstatic.net/a.jpg?type=w773)\n\n', '다시 갈게요 #맛집\n\n',
+        '\n# 여행 코스 추천\n\n',
+    ]
+    assert document.markdown(translated=True)[:2] == ['Mangwon Ramen\n\n', 'The broth is rich\n\n']
+    assert document.markdown(translated=True)[3] == '다시 갈게요 #맛집\n\n'
+
+def test_tags_and_images():
+    document = sample_document()
+    assert document.tags() == ['망원라멘', '맛집']
+    assert [image.src for image in document.images()] == ['https://postfiles.pstatic.net/a.jpg?type=w773']
+
+def test_from_parts_round_trip():
+    document = sample_document()
+    result = {'content_parts': document.markdown(), 'content_parts_en': document.markdown(translated=True)}
+    assert post_document(result) == document
+    assert result['document'] is post_document(result)
@@ -0,0 +1,106 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import threading
+import time
+import pytest
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from components.driver_pool import DriverPool
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def default_content(self):
+        self.driver.resets += 1
+
+class FakeDriver:
+    def __init__(self, number):
+        self.number = number
+        self.resets = 0
+        self.cookies_cleared = 0
+        self.quit_called = False
+        self.switch_to = FakeSwitchTo(self)
+
+    def delete_all_cookies(self):
+        self.cookies_cleared += 1
+
+    def quit(self):
+        self.quit_called = True
+
+@pytest.fixture
+def created():
+    return []
+
+@pytest.fixture
+def factory(created):
+    def make(slot=0):
+        created.append(FakeDriver(len(created)))
+        created[-1].slot = slot
+        return created[-1]
+    return make
+
+def test_returned_driver_is_reset_and_reused(factory, created):
+    with DriverPool(factory, size=1) as pool:
+        with pool.borrow() as driver:
+            pass
+        with pool.borrow() as again:
+            assert again is driver
+    assert len(created) == 1
+    # 반납할 때마다 iframe/쿠키 상태 초기화
+    assert (driver.resets, driver.cookies_cleared) == (2, 2)
+    assert driver.quit_called
+
+def test_driver_is_recycled_after_max_pages(factory, created):
+    with DriverPool(factory, size=1, max_pages=2) as pool:
+        for _ in range(3):
+            with pool.borrow():
+                pass
+    assert len(created) == 2
+    assert created[0].quit_called
+
+def test_driver_is_discarded_after_webdriver_exception(factory, created):
+    pool = DriverPool(factory, size=1)
+    with pytest.raises(WebDriverException):
+        with pool.borrow():
+            raise WebDriverException("session deleted")
+    # 페이지 구조 문제(Timeout)는 브라우저를 버리지 않음
+    with pytest.raises(TimeoutException):
+        with pool.borrow():
+            raise TimeoutException("no title")
+    with pool.borrow() as driver:
+        assert driver is created[1]
+    assert created[0].quit_called and not created[1].quit_called
+    pool.close()
+
+def test_borrow_blocks_when_all_drivers_are_in_use(factory, created):
+    pool = DriverPool(factory, size=1)
+    borrowed = threading.Event()
+    timeline = []
+
+    def other_worker():
+        borrowed.wait()
+        with pool.borrow() as driver:
+            timeline.append(('borrowed', driver.number))
+
+    worker = threading.Thread(target=other_worker)
+    worker.start()
+    with pool.borrow():
+        borrowed.set()
+        time.sleep(0.2)
+        timeline.append(('returned', 0))
+    worker.join(timeout=5)
+    assert timeline == [('returned', 0), ('borrowed', 0)]
+    assert len(created) == 1
+    pool.close()
+
+def test_each_live_driver_gets_its_own_slot(factory, created):
+    pool = DriverPool(factory, size=2, max_pages=1)
+    with pool.borrow() as first:
+        with pool.borrow() as second:
+            assert (first.slot, second.slot) == (0, 1)
+    assert first.quit_called and second.quit_called
+    # 폐기된 드라이버의 슬롯(캐시 디렉토리)은 다음에 만드는 드라이버가 이어받음
+    with pool.borrow() as replacement:
+        assert replacement is created[2] and replacement.slot == 0
+    pool.close()
@@ -0,0 +1,45 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from unittest.mock import MagicMock
+from components.deepl import translate_texts
+from components.fingerprints import FingerprintIndex, part_hashes
+
+URL = "https://blog.naver.com/bench/223900000001"
+
+def test_compare_detects_changed_parts(tmp_path):
+    index = FingerprintIndex(str(tmp_path / "fp.sqlite3"))
+    parts = ["제목\n\n", "첫 문단\n\n", "![](https://postfiles.pstatic.net/a.jpg)\n\n"]
+    assert index.compare(URL, part_hashes(parts)) == ("new", 3)
+
+    index.record(URL, part_hashes(parts), {"첫 문단": "First paragraph", "제목": "제목"})
+    # 줄바꿈 차이는 무시
+    assert index.compare(URL, part_hashes([p.strip() for p in parts])) == ("unchanged", 0)
+    assert index.compare(URL, part_hashes(parts[:2] + ["![](https://postfiles.pstatic.net/b.jpg)"])) == ("changed", 1)
+
+    # 번역 실패로 원문이 그대로 남은 텍스트는 재사용 대상이 아님
+    assert index.known_translations(URL, ["제목", "첫 문단", "새 문단"]) == {"첫 문단": "First paragraph"}
+    index.close()
+
+def test_incomplete_record_is_compared_as_changed(tmp_path):
+    index = FingerprintIndex(str(tmp_path / "fp.sqlite3"))
+    hashes = part_hashes(["제목\n\n", "첫 문단\n\n"])
+    # 대체 백엔드로 번역한 문단이 있던 포스트는 내용이 같아도 다음에 다시 처리
+    index.record(URL, hashes, {"첫 문단": "First paragraph"}, complete=False)
+    assert index.compare(URL, hashes) == ("changed", 0)
+    assert index.known_translations(URL, ["첫 문단"]) == {"첫 문단": "First paragraph"}
+
+    index.record(URL, hashes, {"첫 문단": "First paragraph", "제목": "Title"})
+    assert index.compare(URL, hashes) == ("unchanged", 0)
+    index.close()
+
+def test_translate_texts_skips_known_translations(tmp_path, monkeypatch):
+    # 이 테스트에서만 번역 캐시 없이 번역 (기본 캐시는 건드리지 않음)
+    monkeypatch.setattr("components.deepl.get_translation_cache", lambda: None)
+    monkeypatch.setattr("components.deepl.update_translation_count", lambda chars: None)
+    monkeypatch.setattr("components.translation_counter.COUNTER_FILE", str(tmp_path / "translation_counter.txt"))
+    translator = MagicMock()
+    translator.translate_text.side_effect = lambda texts, target_lang: [MagicMock(text=f"EN:{t}") for t in texts]
+    result = translate_texts(["첫 문단", "바뀐 문단"], translator, known={"첫 문단": "First paragraph"})
+    assert result == ["First paragraph", "EN:바뀐 문단"]
+    assert translator.translate_text.call_args[0][0] == ["바뀐 문단"]
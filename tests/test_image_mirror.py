@@ -0,0 +1,93 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import threading
+from concurrent.futures import Future
+import httpx
+import pytest
+from components.document import Document, HeadingBlock, ImageBlock
+from components.image_mirror import ImageMirror, mirror_post_images
+
+@pytest.fixture
+def mirror(tmp_path):
+    requested = []
+
+    def handler(request):
+        requested.append(str(request.url))
+        if request.url.path == '/missing.jpg':
+            return httpx.Response(404)
+        # a.jpg와 b.jpg는 같은 이미지
+        body = b'same-image' if request.url.path in ('/a.jpg', '/b.jpg') else b'other-image'
+        return httpx.Response(200, content=body, headers={'content-type': 'image/jpeg'})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    mirror = ImageMirror(image_dir=str(tmp_path / 'images'), base_url='https://cdn.example.com/img/',
+                         client=client)
+    mirror.requested = requested
+    yield mirror
+    mirror.close()
+
+def test_mirror_deduplicates_by_content_and_remembers_urls(mirror):
+    urls = ['https://postfiles.pstatic.net/a.jpg', 'https://postfiles.pstatic.net/b.jpg',
+            'https://postfiles.pstatic.net/c.jpg', 'https://postfiles.pstatic.net/missing.jpg']
+    mirrored = mirror.mirror(urls)
+    assert set(mirrored) == set(urls[:3])
+    assert mirrored[urls[0]] == mirrored[urls[1]]
+    assert mirrored[urls[0]]['original'].startswith('https://cdn.example.com/img/')
+    assert len([f for f in os.listdir(mirror.image_dir) if f.endswith('.jpg')]) == 2
+
+    mirror.requested.clear()
+    assert mirror.mirror(urls[:3]) == mirrored
+    assert mirror.requested == []
+
+def test_mirror_post_images_rewrites_markdown(mirror):
+    src = 'https://postfiles.pstatic.net/a.jpg?type=w773'
+    missing = 'https://postfiles.pstatic.net/missing.jpg'
+    result = {'document': Document([HeadingBlock('제목', 'Title', level=0), ImageBlock(src, 1), ImageBlock(missing, 2)])}
+    mirror_post_images(result, mirror=mirror)
+    parts_en = result['document'].markdown(translated=True)
+    assert parts_en[1].startswith('\n![pic1](https://cdn.example.com/img/')
+    assert parts_en[2] == f'\n![pic2]({missing})\n\n'
+    assert result['cover_image'].startswith('https://cdn.example.com/img/')
+
+def test_concurrent_identical_downloads_share_one_file(tmp_path):
+    arrived = threading.Barrier(4, timeout=5)
+
+    def handler(request):
+        # 네 요청이 모두 도착한 뒤 한꺼번에 응답해 같은 파일을 동시에 저장하게 함
+        arrived.wait()
+        return httpx.Response(200, content=b'same-image', headers={'content-type': 'image/jpeg'})
+
+    mirror = ImageMirror(image_dir=str(tmp_path / 'images'), workers=4,
+                         client=httpx.Client(transport=httpx.MockTransport(handler)))
+    try:
+        mirror._get_resizer = lambda: None
+        urls = [f'https://postfiles.pstatic.net/{i}.jpg' for i in range(4)]
+        mirrored = mirror.mirror(urls)
+    finally:
+        mirror.close()
+    assert set(mirrored) == set(urls)
+    assert len({variants['original'] for variants in mirrored.values()}) == 1
+    assert [f for f in os.listdir(tmp_path / 'images') if f != 'mirror.sqlite3'] == [
+        os.path.basename(mirrored[urls[0]]['original'])]
+
+class FakeResizer:
+    def __init__(self):
+        self.digests = []
+
+    def submit(self, fn, path, out_dir, digest):
+        self.digests.append(digest)
+        future = Future()
+        future.set_result({'display': f'{digest}-display.webp', 'thumb': f'{digest}-thumb.webp'})
+        return future
+
+def test_resize_runs_once_per_unique_image(mirror):
+    resizer = FakeResizer()
+    mirror._get_resizer = lambda: resizer
+    urls = ['https://postfiles.pstatic.net/a.jpg', 'https://postfiles.pstatic.net/b.jpg',
+            'https://postfiles.pstatic.net/c.jpg']
+    mirrored = mirror.mirror(urls)
+    assert len(resizer.digests) == 2
+    assert mirrored[urls[0]]['display'] == mirrored[urls[1]]['display']
+    assert mirrored[urls[0]]['display'].endswith('-display.webp')
+    assert mirrored[urls[2]]['thumb'].endswith('-thumb.webp')
@@ -0,0 +1,85 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import json
+import threading
+import pytest
+from components.metrics import MetricsRegistry
+
+def test_registry_accumulates_counters_and_timers():
+    registry = MetricsRegistry(log_path=None)
+    registry.inc('requests', kind='fetch')
+    registry.inc('requests', 2, kind='fetch')
+    registry.observe('fetch_seconds', 0.5)
+    registry.observe('fetch_seconds', 1.5)
+    with pytest.raises(RuntimeError):
+        with registry.timer('translate_seconds', backend='deepl'):
+            raise RuntimeError("번역 실패")
+
+    snapshot = registry.snapshot()
+    assert snapshot['counters'] == {'requests{kind=fetch}': 3}
+    assert snapshot['timers']['fetch_seconds'] == {'count': 2, 'sum': 2.0, 'max': 1.5}
+    # 예외가 나도 시간은 기록됨
+    assert snapshot['timers']['translate_seconds{backend=deepl}']['count'] == 1
+
+def test_post_metrics_follow_activation_and_write_jsonl(tmp_path):
+    log_path = tmp_path / 'metrics.jsonl'
+    registry = MetricsRegistry(log_path=str(log_path))
+    post = registry.start_post('https://blog.naver.com/a/1')
+
+    def worker():
+        # 다른 스레드에서도 같은 포스트 객체에 누적
+        with registry.activate(post):
+            registry.inc('images')
+            registry.observe('translate_seconds', 0.25)
+
+    with registry.activate(post):
+        registry.inc('images', 2)
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    registry.inc('images')  # 활성화 밖: 전체 누적에만 반영
+    assert registry.current() is None
+
+    registry.finish_post(post)
+    registry.finish_post(registry.start_post('https://blog.naver.com/a/2'),
+                         error=ValueError("파싱 실패"), failed_stage='parse')
+
+    records = [json.loads(line) for line in log_path.read_text(encoding='utf-8').splitlines()]
+    assert [r['status'] for r in records] == ['ok', 'error']
+    assert records[0]['counters'] == {'images': 3}
+    assert records[0]['timings'] == {'translate_seconds': 0.25}
+    assert (records[1]['error'], records[1]['failed_stage']) == ("파싱 실패", 'parse')
+    assert registry.snapshot()['counters']['images'] == 4
+    assert registry.snapshot()['counters']['posts{status=error}'] == 1
+
+def test_log_path_off_writes_nothing(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    registry = MetricsRegistry(log_path='off')
+    registry.finish_post(registry.start_post('https://blog.naver.com/a/1'))
+    assert registry.log_path is None
+    assert os.listdir(tmp_path) == []
+
+def test_render_prometheus_declares_types_and_escapes_labels(tmp_path):
+    registry = MetricsRegistry(log_path=None)
+    registry.inc('posts', status='ok')
+    registry.inc('posts', status='error')
+    registry.inc('errors', stage='pa"rse')
+    registry.observe('fetch_seconds', 0.5, mode='http')
+    registry.observe('fetch_seconds', 0.25, mode='http')
+
+    text = registry.render_prometheus(prefix='test')
+    lines = text.splitlines()
+    assert lines.count('# TYPE test_posts_total counter') == 1
+    assert 'test_posts_total{status="ok"} 1' in lines
+    assert 'test_posts_total{status="error"} 1' in lines
+    assert 'test_errors_total{stage="pa\\"rse"} 1' in lines
+    assert '# TYPE test_fetch_seconds summary' in lines
+    assert 'test_fetch_seconds_count{mode="http"} 2' in lines
+    assert 'test_fetch_seconds_sum{mode="http"} 0.750000' in lines
+    assert 'test_fetch_seconds_max{mode="http"} 0.500000' in lines
+
+    path = tmp_path / 'metrics.prom'
+    registry.write_prometheus(str(path))
+    assert path.read_text(encoding='utf-8') == registry.render_prometheus()
+    assert os.listdir(tmp_path) == ['metrics.prom']
@@ -0,0 +1,56 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+import components.naver_backfill as naver_backfill
+from components.post_store import PostStore
+
+BLOG = "https://blog.naver.com/yamyam"
+
+@pytest.fixture
+def listing(monkeypatch):
+    """logNo 내림차순(최신 글부터) 목록을 2개씩 나눠 주는 가짜 PostTitleListAsync"""
+    log_nos = [105, 104, 103, 102, 101]
+    monkeypatch.setattr(naver_backfill, "COUNT_PER_PAGE", 2)
+
+    def fetch_page(blog_id, category_no, page, client=None):
+        start = (page - 1) * 2
+        posts = [{'title': f"글 {n}", 'url': f"{BLOG}/{n}", 'published': None, 'image_url': None, 'tags': []}
+                 for n in log_nos[start:start + 2]]
+        return posts, len(log_nos)
+
+    monkeypatch.setattr(naver_backfill, "fetch_post_list_page", fetch_page)
+    return log_nos
+
+def urls(*log_nos):
+    return [f"{BLOG}/{n}" for n in log_nos]
+
+def test_resume_uses_pending_rows_and_log_no_cursor(tmp_path, listing):
+    store = PostStore(":memory:", legacy_json_path=None)
+    checkpoint = str(tmp_path / "backfill_checkpoint.json")
+    run = lambda max_posts=None: [post['url'] for post in naver_backfill.iter_backfill_posts(
+        "yamyam", "1", store, max_posts=max_posts, delay=0, checkpoint_path=checkpoint)]
+
+    assert run(max_posts=3) == urls(105, 104, 103)
+    # 105만 처리하고 중단된 사이 새 글이 올라와 페이지가 한 칸씩 밀림
+    store.mark_processed(f"{BLOG}/105")
+    listing.insert(0, 106)
+
+    assert run() == urls(104, 103, 102, 101)
+    assert naver_backfill.load_checkpoint(checkpoint)['last_log_no'] == "101"
+
+def test_legacy_page_checkpoint_is_still_read(tmp_path, listing):
+    store = PostStore(":memory:", legacy_json_path=None)
+    checkpoint = str(tmp_path / "backfill_checkpoint.json")
+    naver_backfill.save_checkpoint({'blog_id': "yamyam", 'category_no': "1", 'next_page': 3}, checkpoint)
+    posts = naver_backfill.iter_backfill_posts("yamyam", "1", store, delay=0, checkpoint_path=checkpoint)
+    assert [post['url'] for post in posts] == urls(101)
+
+def test_resume_steps_back_when_posts_were_deleted(tmp_path, listing):
+    store = PostStore(":memory:", legacy_json_path=None)
+    checkpoint = str(tmp_path / "backfill_checkpoint.json")
+    naver_backfill.save_checkpoint({'blog_id': "yamyam", 'category_no': "1", 'page': 2, 'last_log_no': "103"},
+                                   checkpoint)
+    listing.remove(103)
+    posts = naver_backfill.iter_backfill_posts("yamyam", "1", store, delay=0, checkpoint_path=checkpoint)
+    assert [post['url'] for post in posts] == urls(102, 101)
@@ -0,0 +1,94 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import time
+import pytest
+from bs4 import BeautifulSoup
+from selenium.common.exceptions import NoSuchElementException
+import components.html_parser as html_parser
+import components.naver_crawler as naver_crawler
+from components.naver_crawler import TITLE_SELECTORS, extract_blog_title, extract_blog_title_from_soup
+
+POSTVIEW_PAGE = """<html><head><title>망원동 라멘 : 블로그</title><script>var x = "<h2>스크립트</h2>";</script></head>
+<body><div id="gnb"><h2>블로그 메뉴</h2><ul><li>이웃 블로그</li></ul></div>
+<div class="se-documentTitle"><div class="se-title-text"><span>망원동 라멘</span></div></div>
+<div class="se-main-container">
+<div class="se-component se-text"><p class="se-text-paragraph">국물이 진해요</p></div>
+<div class="se-component se-image"><img class="se-image-resource" src="https://postfiles.pstatic.net/a.jpg?type=w80_blur" data-lazy-src="https://postfiles.pstatic.net/a.jpg?type=w773"></div>
+</div><div class="footer"><p>댓글 3</p></div></body></html>"""
+H2_PAGE = "<html><head><title>h2 제목 : 블로그</title></head><body><h2>[연남] 파스타 맛집</h2></body></html>"
+
+class FakeDriver:
+    """제목 선택자를 하나도 찾지 못하는(대기가 끝까지 가는) 드라이버"""
+    def __init__(self, page_source):
+        self.page_source = page_source
+        self.title = "드라이버 제목 : 블로그"
+        self.find_calls = 0
+
+    def find_element(self, by, value):
+        self.find_calls += 1
+        raise NoSuchElementException(value)
+
+@pytest.fixture(autouse=True)
+def clear_title_memo(monkeypatch):
+    monkeypatch.setattr(naver_crawler, "_title_memo", {})
+    monkeypatch.setattr(naver_crawler, "TITLE_WAIT_SECONDS", 0.2)
+
+def test_extract_blog_title_waits_once_then_reads_snapshot():
+    driver = FakeDriver(H2_PAGE)
+    started = time.perf_counter()
+    title, safe_title = extract_blog_title(driver)
+    # 선택자마다 기다리지 않고 합친 선택자로 한 번만 대기
+    assert time.perf_counter() - started < 1.0
+    assert title == "[연남] 파스타 맛집"
+    assert safe_title == "[연남] 파스타 맛집"
+
+def test_extract_blog_title_falls_back_to_driver_title():
+    title, _ = extract_blog_title(FakeDriver("<html><body><p>본문</p></body></html>"))
+    assert title == "드라이버 제목"
+
+def test_title_selector_memo_per_blog():
+    soup = BeautifulSoup('<div class="pcol1">옛 에디터 제목</div>', "html.parser")
+    assert extract_blog_title_from_soup(soup, "blogA")[0] == "옛 에디터 제목"
+    assert naver_crawler._title_memo == {"blogA": TITLE_SELECTORS.index(".pcol1")}
+
+    # 같은 블로그는 지난번 선택자를 먼저 시도하지만, 없으면 원래 순서로 찾음
+    other = BeautifulSoup('<div class="se-title-text"><span>새 레이아웃</span></div>', "html.parser")
+    assert extract_blog_title_from_soup(other, "blogA")[0] == "새 레이아웃"
+    assert naver_crawler._title_memo["blogA"] == 0
+
+def test_generic_title_selector_is_not_memoised():
+    soup = BeautifulSoup(H2_PAGE, "html.parser")
+    assert extract_blog_title_from_soup(soup, "blogA")[0] == "[연남] 파스타 맛집"
+    assert naver_crawler._title_memo == {}
+
+    page = BeautifulSoup('<h3>Other</h3><div class="se-title-text"><span>Real</span></div>', "html.parser")
+    assert extract_blog_title_from_soup(page, "blogA")[0] == "Real"
+
+def test_lean_chrome_options(tmp_path):
+    options = naver_crawler.build_chrome_options('lean', str(tmp_path))
+    assert options.page_load_strategy == 'eager'
+    assert '--blink-settings=imagesEnabled=false' in options.arguments
+    # 풀의 드라이버마다 디스크 캐시 디렉토리를 따로 씀
+    assert f'--disk-cache-dir={tmp_path / "slot-0"}' in options.arguments
+    assert f'--disk-cache-dir={tmp_path / "slot-1"}' in naver_crawler.build_chrome_options('lean', str(tmp_path), slot=1).arguments
+    assert options.experimental_options['prefs']['profile.managed_default_content_settings.images'] == 2
+
+    full = naver_crawler.build_chrome_options('full', str(tmp_path))
+    assert full.page_load_strategy == 'normal'
+    assert not any(arg.startswith('--disk-cache-dir') for arg in full.arguments)
+
+@pytest.mark.parametrize("parser", ["lxml", "bs4-lxml", "html.parser"])
+def test_postview_keeps_title_and_main_container(parser, monkeypatch):
+    monkeypatch.setattr(html_parser, "HTML_PARSER", parser)
+    title, _, main_content = naver_crawler.extract_main_content_from_html(POSTVIEW_PAGE)
+    assert title == "망원동 라멘"
+    parts, text_indices, image_count = naver_crawler.parse_text_and_images(main_content)
+    assert parts == ["국물이 진해요\n\n", "\n![pic1](https://postfiles.pstatic.net/a.jpg?type=w773)\n\n"]
+    assert (text_indices, image_count) == ([0], 2)
+
+def test_bs4_postview_drops_page_chrome():
+    soup = html_parser.parse_document(POSTVIEW_PAGE, parser="html.parser", keep=naver_crawler.POSTVIEW_KEEP)
+    # 제목 후보(h2)와 본문만 남고 메뉴/댓글 영역은 버림
+    assert "이웃 블로그" not in soup.get_text() and "댓글" not in soup.get_text()
+    assert soup.title.string == "망원동 라멘 : 블로그"
@@ -0,0 +1,79 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import json
+import components.uploader as uploader
+from components.output_writer import OutputManifest, atomic_write, content_hash, remove_replaced_outputs
+from components.post_store import PostStore
+
+def test_atomic_write_replaces_without_leftovers(tmp_path):
+    path = tmp_path / "post.md"
+    atomic_write(str(path), "첫 번째")
+    assert atomic_write(str(path), "두 번째") == len("두 번째".encode('utf-8'))
+    assert path.read_text(encoding='utf-8') == "두 번째"
+    assert os.listdir(tmp_path) == ["post.md"]
+
+def test_atomic_write_uses_umask_mode_or_keeps_existing(tmp_path):
+    path = tmp_path / "new.md"
+    atomic_write(str(path), "내용")
+    with open(tmp_path / "plain.md", 'w', encoding='utf-8') as f:
+        f.write("내용")
+    assert path.stat().st_mode & 0o777 == (tmp_path / "plain.md").stat().st_mode & 0o777
+    os.chmod(path, 0o640)
+    atomic_write(str(path), "다시")
+    assert path.stat().st_mode & 0o777 == 0o640
+
+def test_manifest_skips_truncated_line_and_keeps_latest(tmp_path):
+    manifest = OutputManifest(str(tmp_path / "manifest.jsonl"))
+    manifest.append([{'log_no': '1', 'status': 'written'}, {'log_no': '2', 'status': 'written'}])
+    manifest.append([{'log_no': '1', 'status': 'uploaded'}])
+    with open(manifest.path, 'a', encoding='utf-8') as f:
+        f.write('{"log_no": "3", "sta')  # 쓰는 도중 종료
+    latest = manifest.latest()
+    assert {key: entry['status'] for key, entry in latest.items()} == {'1': 'uploaded', '2': 'written'}
+
+def test_upload_uses_manifest_meta(tmp_path):
+    eng_dir = tmp_path / "eng"
+    eng_dir.mkdir()
+    url = "https://blog.naver.com/bench/223900000001"
+    md_path, meta_path = str(eng_dir / "post.md"), str(eng_dir / "post.meta.json")
+    meta = {"title": "Post", "kor_url": url, "tags": ["맛집"]}
+    atomic_write(md_path, "# Post\n")
+    atomic_write(meta_path, json.dumps(meta))
+    manifest = OutputManifest(str(tmp_path / "manifest.jsonl"))
+    manifest.record_written(url, {'kor_path': md_path, 'eng_path': md_path, 'meta_path': meta_path},
+                            {'kor': content_hash("# Post\n"), 'eng': content_hash("# Post\n")}, meta)
+    # 매니페스트 기록 이후 바뀌지 않은 메타 파일은 다시 읽지 않음
+    os.utime(meta_path, (0, 0))
+    with open(meta_path, 'w', encoding='utf-8') as f:
+        f.write("not json")
+    os.utime(meta_path, (0, 0))
+
+    uploaded = []
+    stats = uploader.upload_pending(str(eng_dir), store=PostStore(":memory:", legacy_json_path=None),
+                                    upsert=uploaded.extend, manifest=manifest)
+    assert stats['uploaded'] == 1 and stats['failed'] == 0
+    assert uploaded[0]['title'] == "Post"
+    assert manifest.latest()[url.rsplit('/', 1)[1]]['status'] == 'uploaded'
+
+def test_renamed_post_removes_previous_files(tmp_path):
+    manifest = OutputManifest(str(tmp_path / "manifest.jsonl"))
+    url = "https://blog.naver.com/bench/223900000001"
+    old = {name: str(tmp_path / f"old{ext}") for name, ext in
+           (('kor_path', '.kor.md'), ('eng_path', '.md'), ('meta_path', '.meta.json'))}
+    for path in old.values():
+        atomic_write(path, "옛 제목")
+    manifest.record_written(url, old, {'kor': 'a', 'eng': 'b'}, {'kor_url': url})
+
+    new = dict(old, eng_path=str(tmp_path / "new.md"), meta_path=str(tmp_path / "new.meta.json"))
+    assert remove_replaced_outputs(manifest.previous(url), new) == [old['eng_path'], old['meta_path']]
+    assert os.path.exists(old['kor_path'])
+    manifest.record_written(url, new, {'kor': 'a', 'eng': 'c'}, {'kor_url': url})
+    assert manifest.previous(url)['eng_path'] == new['eng_path']
+
+def test_processed_posts_keep_rss_info(tmp_path):
+    store = PostStore(":memory:", legacy_json_path=None)
+    post = {'url': "https://blog.naver.com/bench/223900000002", 'title': "망원동 라멘", 'image_url': "https://a/b.jpg"}
+    store.add_pending(post)
+    store.mark_processed(post['url'])
+    assert store.processed_posts() == [post]
@@ -0,0 +1,51 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import threading
+import time
+import pytest
+import components.metrics as metrics
+from components.pipeline import Pipeline, Stage
+
+@pytest.fixture(autouse=True)
+def isolated_metrics(monkeypatch):
+    monkeypatch.setattr(metrics, "_default_registry", metrics.MetricsRegistry(log_path=None))
+
+def test_failed_message_skips_later_stages_and_keeps_error():
+    later = []
+
+    def parse(message):
+        if message['n'] == 2:
+            raise ValueError("파싱 실패")
+        return dict(message, parsed=True)
+
+    pipeline = Pipeline([Stage('parse', parse), Stage('write', lambda m: later.append(m['n']) or m)])
+    results = {m['n']: m for m in pipeline.run({'n': n} for n in range(4))}
+    assert sorted(results) == [0, 1, 2, 3]
+    assert isinstance(results[2]['error'], ValueError) and results[2]['failed_stage'] == 'parse'
+    assert sorted(later) == [0, 1, 3]
+    parse_stats, write_stats = pipeline.stats()
+    assert (parse_stats['processed'], parse_stats['errors']) == (4, 1)
+    assert write_stats['processed'] == 3
+
+def test_multi_worker_stages_drain_every_message_and_stop():
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def slow(message):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+        return message
+
+    # 워커 수가 다른 단계끼리도 종료 신호가 빠짐없이 전달돼야 run()이 끝남
+    pipeline = Pipeline([Stage('fetch', slow, workers=3), Stage('translate', slow, workers=2),
+                         Stage('write', lambda m: m)], queue_size=2)
+    before = threading.active_count()
+    done = [m['n'] for m in pipeline.run({'n': n} for n in range(20))]
+    assert sorted(done) == list(range(20))
+    assert peak[0] > 1
+    assert threading.active_count() == before
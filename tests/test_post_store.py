@@ -0,0 +1,71 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import json
+import feedparser
+import pytest
+import components.naver_rss as naver_rss
+from components.post_store import PostStore
+
+BLOG = "https://blog.naver.com/yamyam"
+FEED_URL = "https://rss.blog.naver.com/yamyam.xml"
+
+@pytest.fixture
+def store():
+    store = PostStore(":memory:", legacy_json_path=None)
+    yield store
+    store.close()
+
+def test_legacy_json_is_imported_once(tmp_path):
+    legacy = tmp_path / "processed_posts.json"
+    legacy.write_text(json.dumps([f"{BLOG}/101", {'kor_url': f"{BLOG}/102", 'title': "옛 메타"}, 3]),
+                      encoding='utf-8')
+    path = str(tmp_path / "posts.sqlite3")
+    store = PostStore(path, legacy_json_path=str(legacy))
+    assert store.count('done') == 2
+    assert store.is_processed(f"{BLOG}/102?fromRss=true")  # logNo 기준
+    store.mark_processed(f"{BLOG}/103")
+    store.close()
+
+    # 저장소에 행이 있으면 다시 가져오지 않음
+    legacy.write_text(json.dumps([f"{BLOG}/104"]), encoding='utf-8')
+    store = PostStore(path, legacy_json_path=str(legacy))
+    assert store.count('done') == 3 and not store.is_processed(f"{BLOG}/104")
+    store.close()
+
+def test_pending_posts_until_marked_processed(store):
+    first = {'url': f"{BLOG}/101", 'title': "첫 글", 'image_url': "https://a/1.jpg"}
+    second = {'url': f"{BLOG}/102", 'title': "둘째 글"}
+    assert store.add_pending(first) and store.add_pending(second)
+    assert not store.add_pending(dict(first, title="다시 발견"))
+    assert store.pending_posts() == [first, second]
+
+    store.mark_processed(first['url'])
+    assert store.pending_posts() == [second]
+    assert store.is_processed(first['url']) and not store.is_processed(second['url'])
+    assert (store.count(), store.count('pending'), store.count('done')) == (2, 1, 1)
+
+def feed(status, entries=(), etag=None):
+    return feedparser.FeedParserDict(status=status, entries=list(entries), etag=etag)
+
+def entry(log_no, category="맛집일기_얌얌"):
+    return feedparser.FeedParserDict(
+        title=f"글 {log_no}", link=f"{BLOG}/{log_no}", published="Mon, 01 Jan 2024 00:00:00 +0900",
+        description=f'<img src="https://blogthumb.pstatic.net/{log_no}.jpg">',
+        tags=[feedparser.FeedParserDict(term=category)])
+
+def test_rss_uses_conditional_get_and_skips_parse_on_304(store, monkeypatch):
+    monkeypatch.setenv('RSS_URL', FEED_URL)
+    calls = []
+    responses = [feed(200, [entry(101), entry(102, category="일상")], etag='"v1"'), feed(304)]
+    monkeypatch.setattr(naver_rss.feedparser, 'parse', lambda url, etag=None, modified=None: (
+        calls.append((url, etag, modified)) or responses.pop(0)))
+
+    posts = naver_rss.check_new_posts("맛집일기_얌얌", store)
+    assert [post['url'] for post in posts] == [f"{BLOG}/101"]
+    assert posts[0]['image_url'] == "https://blogthumb.pstatic.net/101.jpg"
+    assert store.get_feed_state(FEED_URL)[0] == '"v1"'
+
+    # 304면 피드를 파싱하지 않지만 지난번 처리하지 못한 대기 포스트는 다시 반환
+    assert [post['url'] for post in naver_rss.check_new_posts("맛집일기_얌얌", store)] == [f"{BLOG}/101"]
+    assert calls == [(FEED_URL, None, None), (FEED_URL, '"v1"', None)]
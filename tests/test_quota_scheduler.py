@@ -0,0 +1,104 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import json
+import threading
+import pytest
+import components.translation_counter as translation_counter
+from components.quota_scheduler import estimate_translation_cost, plan_by_budget
+from components.translation_cache import TranslationCache, set_translation_cache
+
+@pytest.fixture(autouse=True)
+def isolated_counter(tmp_path, monkeypatch):
+    monkeypatch.setattr(translation_counter, "COUNTER_FILE", str(tmp_path / "translation_counter.txt"))
+    cache = TranslationCache(str(tmp_path / "cache.sqlite3"))
+    set_translation_cache(cache)
+    yield cache
+    # 닫은 캐시가 기본 캐시로 남지 않도록 되돌린 뒤 닫음
+    set_translation_cache(None)
+    cache.close()
+
+def test_plan_by_budget_maximizes_finished_posts():
+    posts = ["긴 글", "짧은 글 1", "중간 글", "짧은 글 2"]
+    selected, deferred = plan_by_budget(posts, [900, 100, 400, 200], budget=750)
+    # 비용이 작은 순으로 채우되 결과는 원래 순서 유지
+    assert selected == ["짧은 글 1", "중간 글", "짧은 글 2"]
+    assert deferred == ["긴 글"]
+
+def test_estimate_skips_blanks_duplicates_and_cache_hits(isolated_counter):
+    isolated_counter.set("번역된 문장", "EN-US", "Translated")
+    assert estimate_translation_cost(["가나다", "가나다", "  ", "번역된 문장", "라마"]) == 5
+    # 예상치 계산은 캐시 적중 통계에 포함되지 않음
+    assert isolated_counter.hits == 0
+
+def test_counter_reads_legacy_file_and_rolls_over(monkeypatch):
+    with open(translation_counter.COUNTER_FILE, "w") as f:
+        f.write("1200")
+    assert translation_counter.get_translation_count() == 1200
+
+    translation_counter.update_translation_count(300)
+    with open(translation_counter.COUNTER_FILE) as f:
+        assert json.load(f) == {"month": translation_counter.current_month(), "chars": 1500}
+
+    # 달이 바뀌면 누적값이 0부터 다시 시작
+    monkeypatch.setattr(translation_counter, "current_month", lambda: "2099-01")
+    assert translation_counter.get_translation_count() == 0
+    assert translation_counter.get_remaining_chars() == translation_counter.MONTHLY_LIMIT
+
+def test_ensure_quota_raises_before_request():
+    translation_counter.set_translation_count(translation_counter.MONTHLY_LIMIT - 10)
+    translation_counter.ensure_quota(10)
+    with pytest.raises(translation_counter.QuotaExceeded):
+        translation_counter.ensure_quota(11)
+
+def test_reservation_blocks_other_threads_until_released():
+    translation_counter.set_translation_count(translation_counter.MONTHLY_LIMIT - 100)
+    errors = []
+
+    def reserve_elsewhere(chars):
+        try:
+            with translation_counter.reserve_quota(chars):
+                pass
+        except translation_counter.QuotaExceeded as e:
+            errors.append(e)
+
+    with translation_counter.reserve_quota(80):
+        assert translation_counter.get_remaining_chars() == 20
+        worker = threading.Thread(target=reserve_elsewhere, args=(30,))
+        worker.start()
+        worker.join()
+        assert len(errors) == 1
+        # 같은 스레드의 요청은 바깥 예약분에서 가져다 쓰고, 쓴 만큼만 누적됨
+        with translation_counter.reserve_quota(50):
+            translation_counter.update_translation_count(50)
+        assert translation_counter.get_remaining_chars() == 20
+    assert translation_counter.get_translation_count() == translation_counter.MONTHLY_LIMIT - 50
+    assert translation_counter.get_remaining_chars() == 50
+
+def test_budgeted_mode_enriches_only_selected_posts(tmp_path, monkeypatch):
+    import app
+    from components.checkpoints import CheckpointStore, set_checkpoint_store
+    from components.document import Document, HeadingBlock, TextBlock
+    import components.metrics as metrics
+
+    store = CheckpointStore(str(tmp_path / "checkpoints.sqlite3"))
+    set_checkpoint_store(store)
+    monkeypatch.setattr(metrics, "_default_registry", metrics.MetricsRegistry(log_path=None))
+    enriched = []
+    monkeypatch.setattr(app, "fetch_or_resume", lambda m, driver_pool=None: dict(m, title=m['url'][-1]))
+    monkeypatch.setattr(app, "parse_post", lambda m: dict(m, document=Document(
+        [HeadingBlock(m['title'], level=0), TextBlock("가" * m['rss_data']['size'])])))
+    monkeypatch.setattr(app, "enrich_post", lambda m: enriched.append(m['url']) or dict(m, travel_courses=""))
+    monkeypatch.setattr(app, "translate_post", lambda m, translator: m)
+    monkeypatch.setattr(app, "save_post_result", lambda m, rss_data: {'url': m['url']})
+    monkeypatch.setattr(app, "translation_budget", lambda: 4000)
+    # 여행코스 추정치(TRAVEL_ESTIMATE_CHARS)를 더해도 1, 3번만 예산 안에 들어옴
+    posts = [{'url': "https://blog.naver.com/a/1", 'size': 100}, {'url': "https://blog.naver.com/a/2", 'size': 5000},
+             {'url': "https://blog.naver.com/a/3", 'size': 200}]
+    try:
+        results = [meta for _, meta in app.run_budgeted(posts, None, None, dict(fetch=2, translate=1, llm=1, images=1))]
+    finally:
+        set_checkpoint_store(None)
+        store.close()
+    assert sorted(enriched) == ["https://blog.naver.com/a/1", "https://blog.naver.com/a/3"]
+    assert sorted(meta['url'] for meta in results) == sorted(enriched)
@@ -0,0 +1,33 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from components.get_store_and_address import StoreAddress, extract_address, extract_store_and_address
+from components.travel_cache import normalize_address
+
+def test_extract_address_after_location_label():
+    parts = ["망원동 라멘\n\n", "#망원라멘 #맛집\n", "◈ 위치\n", "서울특별시 마포구 망원로 12 (망원1동)\n"]
+    result = extract_address(parts)
+    assert result == StoreAddress(store='망원라멘', address='서울특별시 마포구 망원로 12 (망원1동)',
+                                  city='서울', gu='마포구', dong='망원동')
+    assert result.in_seoul
+    assert extract_store_and_address(parts) == "망원라멘, 서울특별시 마포구 망원로 12 (망원1동)"
+
+def test_extract_address_ignores_station_exits():
+    parts = ["제목\n\n", "홍대입구 3번 출구에서 5분\n", "주소: 마포구 서교동 123-4\n"]
+    result = extract_address(parts)
+    assert result.address == "마포구 서교동 123-4"
+    assert (result.gu, result.dong) == ('마포구', '서교동')
+
+def test_missing_values_keep_legacy_format():
+    assert str(extract_address(["제목\n\n", "본문\n"])) == "None, None"
+    assert normalize_address(extract_address(["본문\n"])) is None
+
+def test_normalize_address_accepts_structured_and_string():
+    parsed = extract_address(["#가게\n", "위치: 서울 마포구 망원1동 45\n"])
+    assert normalize_address(parsed, 'dong') == normalize_address(str(parsed), 'dong') == "dong:마포구 망원동"
+    assert normalize_address(parsed, 'address') == "address:서울 마포구 망원1동 45"
+
+def test_address_after_rejected_candidate_in_same_paragraph():
+    result = extract_address(['제목\n\n', '홍대입구 3번 출구 나와서 마포구 서교동 123-4\n'])
+    assert result.address == "마포구 서교동 123-4"
+    assert (result.gu, result.dong) == ('마포구', '서교동')
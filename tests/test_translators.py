@@ -0,0 +1,61 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+from components.translation_counter import QuotaExceeded
+from components.translators import TranslationError, TranslatorRouter
+
+class FakeBackend:
+    def __init__(self, name, error=None, tracks_quota=False):
+        self.name = name
+        self.error = error
+        self.tracks_quota = tracks_quota
+        self.calls = 0
+
+    def translate(self, texts, target_lang):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return [f"{self.name}:{text}" for text in texts]
+
+def make_router(backends, **kwargs):
+    kwargs.setdefault("backoff_base", 0)
+    return TranslatorRouter(backends, **kwargs)
+
+def test_fails_over_to_next_backend():
+    primary = FakeBackend("deepl", error=ConnectionError("429"))
+    secondary = FakeBackend("google")
+    router = make_router([primary, secondary])
+    assert router.translate(["안녕"], "EN-US") == ["google:안녕"]
+    assert (primary.calls, secondary.calls) == (1, 1)
+
+def test_circuit_opens_after_repeated_failures():
+    primary = FakeBackend("deepl", error=ConnectionError("503"))
+    secondary = FakeBackend("google")
+    router = make_router([primary, secondary], failure_threshold=2)
+    for _ in range(4):
+        router.translate(["안녕"], "EN-US")
+    # 두 번 실패한 뒤로는 차단돼 바로 대체 백엔드로 감
+    assert primary.calls == 2
+    assert router.status()[0]["state"] == "open"
+
+def test_quota_exceeded_is_not_retried():
+    primary = FakeBackend("deepl", error=QuotaExceeded("한도 초과"), tracks_quota=True)
+    router = make_router([primary])
+    with pytest.raises(QuotaExceeded):
+        router.translate(["안녕"], "EN-US")
+    assert primary.calls == 1
+
+def test_strict_router_raises_instead_of_returning_source():
+    backend = FakeBackend("deepl", error=ConnectionError("timeout"))
+    router = make_router([backend], strict=True)
+    with pytest.raises(TranslationError):
+        router.translate(["안녕"], "EN-US")
+    assert backend.calls == router.max_rounds
+
+def test_slow_backend_moves_behind_faster_one():
+    slow, fast = FakeBackend("deepl"), FakeBackend("google")
+    router = make_router([slow, fast])
+    router._routes[0].latency = 0.01
+    router._routes[1].latency = 0.001
+    assert router.translate(["안녕"], "EN-US") == ["google:안녕"]
@@ -0,0 +1,110 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from types import SimpleNamespace
+import pytest
+import components.naver_crawler as naver_crawler
+import components.travel_cache as travel_cache
+from components.document import Document, HeadingBlock, TextBlock
+from components.get_store_and_address import extract_address
+from components.translators import TranslatorRouter
+from components.travel_cache import TravelCourseCache, normalize_address, set_travel_cache
+
+class Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(travel_cache, "time", SimpleNamespace(time=clock))
+    return clock
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = TravelCourseCache(str(tmp_path / "travel.sqlite3"), ttl_days=1)
+    set_travel_cache(cache)
+    yield cache
+    set_travel_cache(None)
+    cache.close()
+
+def test_dong_granularity_merges_numbered_dongs():
+    first = normalize_address("라멘, 서울특별시 마포구 망원1동 45", 'dong')
+    second = normalize_address(extract_address(["#파스타\n", "위치: 서울 마포구 망원2동 12\n"]), 'dong')
+    assert first == second == "dong:마포구 망원동"
+    assert normalize_address("카페, 서울 용산구 한남동 7", 'dong') == "dong:용산구 한남동"
+    # 동을 알 수 없으면 주소 단위로 돌아감
+    assert normalize_address("카페, 서울 마포구 월드컵로 12", 'dong') == "address:서울 마포구 월드컵로 12"
+    assert normalize_address("라멘, None", 'dong') is None
+
+def test_entries_expire_after_ttl(cache, clock):
+    cache.set("dong:마포구 망원동", "망원 한강공원 산책")
+    clock.now += 23 * 60 * 60
+    assert cache.get("dong:마포구 망원동") == ("망원 한강공원 산책", None)
+
+    clock.now += 2 * 60 * 60
+    assert cache.get("dong:마포구 망원동") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.purge_expired() == 1
+    assert cache.purge_expired() == 0
+
+def test_set_translation_keeps_original_expiry(cache, clock):
+    cache.set("dong:마포구 망원동", "망원 한강공원 산책")
+    clock.now += 20 * 60 * 60
+    cache.set_translation("dong:마포구 망원동", "Walk in Mangwon Hangang Park")
+    assert cache.get("dong:마포구 망원동") == ("망원 한강공원 산책", "Walk in Mangwon Hangang Park")
+
+    # 번역을 추가해도 만료 시각은 처음 저장한 때 기준
+    clock.now += 5 * 60 * 60
+    assert cache.get("dong:마포구 망원동") is None
+    # 없는 키에는 번역만 저장되지 않음
+    cache.set_translation("dong:용산구 한남동", "Hannam walk")
+    assert cache.get("dong:용산구 한남동") is None
+
+def test_enrich_post_reuses_courses_for_same_dong(cache, monkeypatch):
+    calls = []
+
+    def fetch_travel_courses(store_and_address):
+        calls.append(store_and_address)
+        return "망원 한강공원 산책"
+
+    monkeypatch.setattr(naver_crawler, "fetch_travel_courses", fetch_travel_courses)
+    monkeypatch.setattr(naver_crawler, "normalize_address",
+                        lambda value: normalize_address(value, 'dong'))
+
+    first = naver_crawler.enrich_post({"store_and_address": "라멘, 서울 마포구 망원1동 45"})
+    assert first["travel_cache_key"] == "dong:마포구 망원동"
+    cache.set_translation(first["travel_cache_key"], "Walk in Mangwon Hangang Park")
+
+    second = naver_crawler.enrich_post({"store_and_address": "파스타, 서울 마포구 망원2동 12"})
+    assert calls == ["라멘, 서울 마포구 망원1동 45"]
+    assert second["travel_courses"] == "망원 한강공원 산책"
+    assert second["translated_travel_courses"] == "Walk in Mangwon Hangang Park"
+
+class FakeBackend:
+    tracks_quota = False
+
+    def __init__(self, name, error=None):
+        self.name = name
+        self.error = error
+
+    def translate(self, texts, target_lang):
+        if self.error is not None:
+            raise self.error
+        return [f"{self.name.upper()}:{t}" for t in texts]
+
+def test_fallback_translation_is_kept_out_of_caches(cache, monkeypatch):
+    monkeypatch.setattr("components.deepl.get_translation_cache", lambda: None)
+    router = TranslatorRouter([FakeBackend("deepl", ConnectionError("503")), FakeBackend("google")], backoff_base=0)
+    cache.set("dong:마포구 망원동", "망원 한강공원 산책")
+    result = {"title": "망원동 라멘", "document": Document([HeadingBlock("망원동 라멘", level=0), TextBlock("국물이 진해요")]),
+              "travel_courses": "망원 한강공원 산책", "travel_cache_key": "dong:마포구 망원동"}
+
+    result = naver_crawler.translate_post(result, router)
+    assert result["translated_travel_courses"] == "GOOGLE:망원 한강공원 산책"
+    # 대체 번역은 여행코스 캐시와 지문용 번역 기록에 남기지 않음
+    assert cache.get("dong:마포구 망원동") == ("망원 한강공원 산책", None)
+    assert result["translations"] == {} and result["fallback_translated"] == 3
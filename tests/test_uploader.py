@@ -0,0 +1,100 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import json
+import pytest
+import components.uploader as uploader
+from components.output_writer import OutputManifest
+from components.post_store import PostStore
+from components.supabase import MemoryClient, set_client
+
+@pytest.fixture
+def memory_client():
+    client = MemoryClient()
+    set_client(client)
+    yield client
+    set_client(None)
+
+@pytest.fixture
+def eng_dir(tmp_path):
+    for i in range(5):
+        (tmp_path / f"post{i}.md").write_text(f"# Post {i}\n\n![](https://postfiles.pstatic.net/{i}.jpg)\n", encoding="utf-8")
+        meta = {"title": f"Post {i}", "kor_url": f"https://blog.naver.com/bench/22390000000{i}", "tags": ["맛집"]}
+        (tmp_path / f"post{i}.meta.json").write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+    return tmp_path
+
+def test_upload_pending_batches_and_skips_synced_rows(memory_client, eng_dir):
+    store = PostStore(":memory:", legacy_json_path=None)
+    stats = uploader.upload_pending(str(eng_dir), batch_size=2, store=store)
+    assert stats == {"uploaded": 5, "skipped": 0, "failed": 0, "batches": 3}
+    assert memory_client.requests == 3
+    rows = memory_client.table("eng_posts").select("*").execute().data
+    assert rows[0]["image_url"] == "https://postfiles.pstatic.net/0.jpg"
+
+    # 바뀐 포스트만 다시 올리고, kor_url 기준 upsert라 행이 늘지 않음
+    (eng_dir / "post3.md").write_text("# Post 3 (수정)\n", encoding="utf-8")
+    stats = uploader.upload_pending(str(eng_dir), batch_size=2, store=store)
+    assert stats == {"uploaded": 1, "skipped": 4, "failed": 0, "batches": 1}
+    assert len(memory_client.table("eng_posts").select("*").execute().data) == 5
+
+def test_failed_batch_is_split_to_isolate_bad_row(memory_client, eng_dir, monkeypatch):
+    monkeypatch.setattr(uploader, "BACKOFF_BASE", 0)
+
+    def upsert(rows):
+        if any(row["kor_url"].endswith("2") for row in rows):
+            raise RuntimeError("invalid row")
+        memory_client.table("eng_posts").upsert(rows, on_conflict="kor_url").execute()
+
+    store = PostStore(":memory:", legacy_json_path=None)
+    stats = uploader.upload_pending(str(eng_dir), batch_size=5, store=store, upsert=upsert)
+    assert (stats["uploaded"], stats["failed"]) == (4, 1)
+    assert len(store.upload_hashes()) == 4
+
+def test_transient_error_is_retried_without_splitting(monkeypatch):
+    monkeypatch.setattr(uploader, "BACKOFF_BASE", 0)
+    calls = []
+
+    def upsert(rows):
+        calls.append(len(rows))
+        if len(calls) < uploader.MAX_RETRIES:
+            raise RuntimeError("timeout")
+
+    rows = [{"kor_url": f"https://blog.naver.com/bench/{i}"} for i in range(4)]
+    assert uploader._upsert_with_retry(rows, upsert) == []
+    assert calls == [4] * uploader.MAX_RETRIES
+
+def test_split_retry_isolates_each_bad_row(monkeypatch):
+    monkeypatch.setattr(uploader, "BACKOFF_BASE", 0)
+    monkeypatch.setattr(uploader, "MAX_RETRIES", 1)
+    calls = []
+
+    def upsert(rows):
+        calls.append([row["n"] for row in rows])
+        if any(row["n"] in (1, 6) for row in rows):
+            raise RuntimeError("invalid row")
+
+    rows = [{"kor_url": f"https://blog.naver.com/bench/{i}", "n": i} for i in range(8)]
+    failed = uploader._upsert_with_retry(rows, upsert)
+    assert [row["n"] for row in failed] == [1, 6]
+    # 실패한 묶음만 반으로 나누고, 성공한 쪽은 다시 보내지 않음
+    assert calls == [list(range(8)), [0, 1, 2, 3], [0, 1], [0], [1], [2, 3],
+                     [4, 5, 6, 7], [4, 5], [6, 7], [6], [7]]
+
+def test_upload_pending_flushes_partial_last_batch(eng_dir):
+    batches = []
+    stats = uploader.upload_pending(str(eng_dir), batch_size=3, store=PostStore(":memory:", legacy_json_path=None),
+                                    upsert=lambda rows: batches.append(len(rows)),
+                                    manifest=OutputManifest(str(eng_dir / "manifest.jsonl")))
+    assert batches == [3, 2]
+    assert stats == {"uploaded": 5, "skipped": 0, "failed": 0, "batches": 2}
+
+def test_single_upload_rejects_meta_without_kor_url(memory_client, tmp_path, monkeypatch):
+    store = PostStore(":memory:", legacy_json_path=None)
+    monkeypatch.setattr(uploader, "get_post_store", lambda: store)
+    (tmp_path / "post.md").write_text("# Post\n", encoding="utf-8")
+    (tmp_path / "post.meta.json").write_text(json.dumps({"title": "Post"}), encoding="utf-8")
+
+    ok, error = uploader.upload_markdown_to_supabase(str(tmp_path / "post.md"), str(tmp_path / "post.meta.json"))
+    assert not ok and isinstance(error, ValueError)
+    assert memory_client.requests == 0
+    assert store.upload_hashes() == {}